@@ -1,22 +1,46 @@
 """Excel Assistant Service - Main application service."""
 
-from typing import Optional
+import asyncio
+import os
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
+from src.application.response_cache import ResponseCache
 from src.domain.models.query import AssistantResponse, QuestionContext
 from src.domain.models.selection import Selection
 from src.domain.models.workbook import Workbook
-from src.domain.services.annotation_management_service import AnnotationManagementService
-from src.domain.services.dependency_analysis_service import DependencyAnalysisService
-from src.domain.services.exploration_agent import ExplorationAgent
-from src.domain.services.llm_interaction_service import LLMInteractionService
-from src.domain.services.workbook_data_service import WorkbookDataService
-from src.infrastructure.config.config_loader import Config
-from src.infrastructure.excel.workbook_discovery import WorkbookInfo
+from src.infrastructure.config.config_schema import Config
 from src.shared.logging import get_logger, setup_logging
 
+if TYPE_CHECKING:
+    # Imported lazily at runtime: these pull in xlwings/pywin32 and the
+    # LLM stack, which many commands never need
+    from src.domain.services.annotation_management_service import AnnotationManagementService
+    from src.domain.services.dependency_analysis_service import DependencyAnalysisService
+    from src.domain.services.exploration_agent import ExplorationAgent
+    from src.domain.services.llm_interaction_service import LLMInteractionService
+    from src.domain.services.workbook_data_service import WorkbookDataService
+    from src.infrastructure.excel.workbook_discovery import WorkbookInfo
+
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class CacheStatus:
+    """Snapshot of connection and dependency cache state."""
+
+    connected: bool
+    workbook: Optional[str] = None
+    graph_cached: bool = False
+    node_count: int = 0
+    formula_count: int = 0
+    has_annotations: bool = False
+
+
+_DISCONNECTED = CacheStatus(connected=False)
+
+
 class ExcelAssistantService:
     """
     Main application service for Excel Sidekick.
@@ -43,27 +67,65 @@ class ExcelAssistantService:
 
         logger.info("Initializing Excel Assistant Service")
 
-        # Initialize domain services
-        self.workbook_data = WorkbookDataService(config)
-        self.dependency_analysis = DependencyAnalysisService(
-            config, self.workbook_data
+        # Domain services are created on first use (see properties below)
+        self._current_workbook: Optional[Workbook] = None
+
+        self._responses: Optional[ResponseCache] = None
+        if config.agent.response_cache.enabled:
+            self._responses = ResponseCache(
+                ttl_seconds=config.agent.response_cache.ttl_seconds,
+                max_entries=config.agent.response_cache.max_entries,
+            )
+
+        logger.info("Excel Assistant Service initialized")
+
+    # =========================================================================
+    # DOMAIN SERVICES - created on first access
+    # =========================================================================
+
+    @cached_property
+    def workbook_data(self) -> "WorkbookDataService":
+        """Service for reading Excel data."""
+        from src.domain.services.workbook_data_service import WorkbookDataService
+
+        return WorkbookDataService(self.config)
+
+    @cached_property
+    def dependency_analysis(self) -> "DependencyAnalysisService":
+        """Service for dependency analysis."""
+        from src.domain.services.dependency_analysis_service import DependencyAnalysisService
+
+        return DependencyAnalysisService(self.config, self.workbook_data)
+
+    @cached_property
+    def annotation_management(self) -> "AnnotationManagementService":
+        """Service for annotations."""
+        from src.domain.services.annotation_management_service import (
+            AnnotationManagementService,
         )
-        self.annotation_management = AnnotationManagementService(config)
-        self.llm_interaction = LLMInteractionService(config)
 
-        # Initialize exploration agent
-        self.agent = ExplorationAgent(
-            config=config,
+        return AnnotationManagementService(self.config)
+
+    @cached_property
+    def llm_interaction(self) -> "LLMInteractionService":
+        """Service for LLM queries."""
+        from src.domain.services.llm_interaction_service import LLMInteractionService
+
+        return LLMInteractionService(self.config)
+
+    @cached_property
+    def agent(self) -> "ExplorationAgent":
+        """Exploration agent wired to the domain services."""
+        from src.domain.services.exploration_agent import ExplorationAgent
+
+        return ExplorationAgent(
+            config=self.config,
             workbook_data=self.workbook_data,
             dependency_analysis=self.dependency_analysis,
             annotation_management=self.annotation_management,
             llm_interaction=self.llm_interaction,
         )
 
-        self._current_workbook: Optional[Workbook] = None
-
-        logger.info("Excel Assistant Service initialized")
-
     def connect(self, workbook_name: Optional[str] = None, build_graph: bool = True) -> Workbook:
         """
         Connect to Excel workbook.
@@ -82,6 +144,7 @@ class ExcelAssistantService:
         # Connect to workbook
         workbook = self.workbook_data.connect(workbook_name)
         self._current_workbook = workbook
+        self._clear_responses()
 
         # Set workbook for annotation management
         self.annotation_management.set_workbook(workbook.path)
@@ -100,7 +163,7 @@ class ExcelAssistantService:
         return workbook
 
     def connect_to_workbook_info(
-        self, workbook_info: WorkbookInfo, build_graph: bool = True
+        self, workbook_info: "WorkbookInfo", build_graph: bool = True
     ) -> Workbook:
         """
         Connect to Excel workbook using WorkbookInfo.
@@ -122,6 +185,7 @@ class ExcelAssistantService:
         # Connect to workbook
         workbook = self.workbook_data.connect_to_workbook_info(workbook_info)
         self._current_workbook = workbook
+        self._clear_responses()
 
         # Set workbook for annotation management
         self.annotation_management.set_workbook(workbook.path)
@@ -159,6 +223,7 @@ class ExcelAssistantService:
         """Disconnect from current workbook."""
         self.workbook_data.disconnect()
         self._current_workbook = None
+        self._clear_responses()
         logger.info("Disconnected from workbook")
 
     def ask_question(
@@ -180,16 +245,168 @@ class ExcelAssistantService:
         """
         logger.info(f"Question: {question}")
 
-        context = QuestionContext(
+        context = self._build_question_context(question, selection, mode)
+
+        key = self._response_key(context)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
+
+        response = self.agent.explore_and_answer(context)
+
+        if key is not None:
+            self._responses.put(key, response)
+        return response
+
+    async def ask_question_async(
+        self,
+        question: str,
+        selection: Optional[Selection] = None,
+        mode: str = "educational",
+    ) -> AssistantResponse:
+        """
+        Ask a question about the workbook without blocking the event loop.
+
+        Args:
+            question: User's question
+            selection: Optional specific selection (None for current selection)
+            mode: Query mode (educational, technical, concise)
+
+        Returns:
+            Assistant response with answer and context
+        """
+        logger.info(f"Question: {question}")
+
+        context = self._build_question_context(question, selection, mode)
+
+        key = self._response_key(context)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
+
+        response = await self.agent.aexplore_and_answer(context)
+
+        if key is not None:
+            self._responses.put(key, response)
+        return response
+
+    async def ask_many(
+        self,
+        items: List[Tuple[str, Optional[Selection], str]],
+    ) -> List[AssistantResponse]:
+        """
+        Ask several questions concurrently.
+
+        At most config.llm.max_concurrency LLM requests are in flight at once.
+        Answers go through the response cache like ask_question(), and
+        identical questions in one batch are only explored once.
+
+        Args:
+            items: List of (question, selection, mode) tuples
+
+        Returns:
+            Assistant responses, in the same order as items
+        """
+        logger.info(f"Asking {len(items)} questions")
+
+        semaphore = asyncio.Semaphore(max(1, self.config.llm.max_concurrency))
+        contexts = [
+            self._build_question_context(question, selection, mode)
+            for question, selection, mode in items
+        ]
+        # Identical cacheable questions in the batch share one agent run
+        running: Dict[bytes, "asyncio.Task[AssistantResponse]"] = {}
+
+        async def explore(context: QuestionContext) -> AssistantResponse:
+            async with semaphore:
+                return await self.agent.aexplore_and_answer(context)
+
+        async def run(context: QuestionContext) -> AssistantResponse:
+            key = self._response_key(context)
+            if key is None:
+                return await explore(context)
+
+            cached = self._cached_response(key)
+            if cached is not None:
+                return cached
+
+            task = running.get(key)
+            if task is None:
+                task = running[key] = asyncio.ensure_future(explore(context))
+                response = await task
+                self._responses.put(key, response)
+                return response
+            return await task
+
+        return list(await asyncio.gather(*(run(context) for context in contexts)))
+
+    def _build_question_context(
+        self,
+        question: str,
+        selection: Optional[Selection],
+        mode: str,
+    ) -> QuestionContext:
+        """Build question context for the agent."""
+        return QuestionContext(
             question=question,
             selection=selection,
-            active_sheet=self.workbook_data.get_active_sheet() if self.workbook_data.is_connected() else None,
+            active_sheet=(
+                self.workbook_data.get_active_sheet()
+                if self.workbook_data.is_connected()
+                else None
+            ),
             mode=mode,
         )
 
-        response = self.agent.explore_and_answer(context)
-
-        return response
+    def _response_key(self, context: QuestionContext) -> Optional[bytes]:
+        """
+        Get the response cache key for a question, or None if it can't be cached.
+
+        Questions without an explicit selection use whatever is selected in
+        Excel when the agent runs, so they are never cached. Neither are
+        answers from providers that must be asked every time (e.g. manual),
+        nor questions about a workbook with unsaved edits, which can't be
+        versioned. The key includes workbook_revision and the file's mtime,
+        so mark_workbook_changed() and saved edits both invalidate entries.
+        """
+        if self._responses is None or context.selection is None:
+            return None
+
+        if not self.llm_interaction.supports_response_memo():
+            return None
+
+        version = ""
+        if self.workbook_data.is_connected():
+            if self.workbook_data.has_unsaved_changes():
+                return None
+            version = str(self.workbook_data.workbook_revision)
+
+        if self._current_workbook is not None:
+            path = self._current_workbook.path
+            try:
+                version += f":{path}:{os.stat(path).st_mtime_ns}"
+            except OSError:
+                version += f":{path}"  # Never saved
+
+        return context.cache_key(version)
+
+    def _cached_response(self, key: Optional[bytes]) -> Optional[AssistantResponse]:
+        """Look up a cached response by _response_key() (None never hits)."""
+        if key is None:
+            return None
+
+        cached = self._responses.get(key)
+        if cached is not None:
+            logger.info("Answer served from response cache")
+        return cached
+
+    def _clear_responses(self) -> None:
+        """Drop cached responses and snapshots (workbook or annotations changed)."""
+        if self._responses is not None:
+            self._responses.clear()
+        # Only if the service exists - don't create it just to clear it
+        if "workbook_data" in self.__dict__:
+            self.workbook_data.mark_workbook_changed()
 
     def explain_selection(
         self,
@@ -220,6 +437,50 @@ class ExcelAssistantService:
 
         return self.ask_question(question, selection, mode)
 
+    def submit_explain_batch(
+        self,
+        selections: List[Selection],
+        mode: str = "educational",
+    ) -> str:
+        """
+        Submit explanations for many selections as one LLM batch job.
+
+        Useful for non-interactive jobs such as onboarding a workbook,
+        where waiting for results is fine in exchange for lower cost.
+
+        Args:
+            selections: Selections to explain
+            mode: Query mode
+
+        Returns:
+            Batch ID for collect_batch()
+        """
+        contexts = {
+            selection.to_address(): self._build_question_context(
+                f"Explain what {selection.to_address()} calculates and why.",
+                selection,
+                mode,
+            )
+            for selection in selections
+        }
+
+        batch_id = self.agent.submit_batch(contexts)
+        logger.info(f"Submitted explain batch {batch_id} ({len(contexts)} selections)")
+
+        return batch_id
+
+    def collect_batch(self, batch_id: str) -> Optional[Dict[str, AssistantResponse]]:
+        """
+        Collect results of a batch submitted with submit_explain_batch().
+
+        Args:
+            batch_id: Batch ID
+
+        Returns:
+            Mapping of selection address -> response, or None if still running
+        """
+        return self.agent.collect_batch(batch_id)
+
     def add_annotation(
         self,
         range_address: str,
@@ -239,6 +500,7 @@ class ExcelAssistantService:
             label=label,
             description=description,
         )
+        self._clear_responses()
 
         logger.info(f"Added annotation: '{label}' for {range_address}")
 
@@ -261,6 +523,7 @@ class ExcelAssistantService:
 
         logger.info("Rebuilding dependency graph...")
         self.dependency_analysis.rebuild_graph(self._current_workbook)
+        self._clear_responses()
         logger.info("Graph rebuilt")
 
     def clear_cache(self) -> None:
@@ -271,29 +534,31 @@ class ExcelAssistantService:
         self.dependency_analysis.clear_cache(self._current_workbook.path)
         logger.info("Cache cleared")
 
-    def get_cache_status(self) -> dict:
+    def get_cache_status(self) -> CacheStatus:
         """
         Get cache status information.
 
         Returns:
-            Dict with cache status
+            Cache status (use dataclasses.asdict for a dict)
         """
         if self._current_workbook is None:
-            return {"connected": False}
+            return _DISCONNECTED
 
         graph = self.dependency_analysis.get_current_graph()
 
-        return {
-            "connected": True,
-            "workbook": self._current_workbook.name,
-            "graph_cached": graph is not None,
-            "node_count": graph.node_count() if graph else 0,
-            "formula_count": graph.formula_count() if graph else 0,
-            "has_annotations": self.annotation_management.has_annotations(),
-        }
+        return CacheStatus(
+            connected=True,
+            workbook=self._current_workbook.name,
+            graph_cached=graph is not None,
+            node_count=graph.node_count() if graph else 0,
+            formula_count=graph.formula_count() if graph else 0,
+            has_annotations=self.annotation_management.has_annotations(),
+        )
 
     def is_connected(self) -> bool:
         """Check if connected to a workbook."""
+        if "workbook_data" not in self.__dict__:
+            return False  # Never connected; don't import the Excel stack just to check
         return self.workbook_data.is_connected()
 
     def get_current_workbook(self) -> Optional[Workbook]:
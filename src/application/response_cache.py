@@ -0,0 +1,78 @@
+"""TTL cache of assistant responses for repeated questions."""
+
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from src.domain.models.query import AssistantResponse
+from src.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ResponseCache:
+    """
+    LRU cache of full assistant responses with a time-to-live.
+
+    Keyed by QuestionContext.cache_key() (a digest of the question context
+    plus a workbook version token), so a repeated question skips the whole
+    agent loop (tool calls and LLM inference). Entries expire after the
+    TTL, which roughly matches provider prompt-cache windows.
+    """
+
+    def __init__(self, ttl_seconds: float = 600.0, max_entries: int = 128):
+        """
+        Initialize response cache.
+
+        Args:
+            ttl_seconds: Seconds before an entry expires
+            max_entries: Maximum cached responses before LRU eviction
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Tuple[float, AssistantResponse]]" = OrderedDict()
+
+    def get(self, key: bytes) -> Optional[AssistantResponse]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: QuestionContext.cache_key() digest
+
+        Returns:
+            Cached response or None on miss/expiry
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, response = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        logger.debug("Response cache hit")
+        return response
+
+    def put(self, key: bytes, response: AssistantResponse) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: QuestionContext.cache_key() digest
+            response: Response to cache
+        """
+        self._entries[key] = (time.monotonic(), response)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of cached responses (including not yet evicted expired ones)."""
+        return len(self._entries)
@@ -22,7 +22,7 @@ You have access to these tools:
 ## Guidelines
 
 1. **Start with what you have**: If user has a selection, start by exploring that
-2. **Be systematic**: Build context progressively (snapshot  formulas  dependencies)
+2. **Be systematic**: Build context progressively (snapshot → formulas → dependencies)
 3. **Use annotations**: Check for existing annotations to understand business context
 4. **Trace intelligently**: Only trace dependencies when needed to understand calculations
 5. **Don't over-explore**: Stop when you have enough context to answer the question
@@ -56,6 +56,16 @@ Remember: You're helping someone understand complex sheets, not just reading for
 """
 
 
+_MODE_ADDITIONS = {
+    "educational": "\n\nFocus on educational explanations with business context.",
+    "technical": "\n\nProvide technical, precise explanations of formulas and logic.",
+    "concise": "\n\nProvide brief, direct answers. Be concise.",
+}
+
+# Full prompt per mode, built once at import
+_PROMPTS = {mode: AGENT_SYSTEM_PROMPT + addition for mode, addition in _MODE_ADDITIONS.items()}
+
+
 def get_agent_system_prompt(mode: str = "educational") -> str:
     """
     Get system prompt for agent based on mode.
@@ -66,12 +76,4 @@ def get_agent_system_prompt(mode: str = "educational") -> str:
     Returns:
         System prompt
     """
-    base_prompt = AGENT_SYSTEM_PROMPT
-
-    mode_additions = {
-        "educational": "\n\nFocus on educational explanations with business context.",
-        "technical": "\n\nProvide technical, precise explanations of formulas and logic.",
-        "concise": "\n\nProvide brief, direct answers. Be concise.",
-    }
-
-    return base_prompt + mode_additions.get(mode, "")
+    return _PROMPTS.get(mode, AGENT_SYSTEM_PROMPT)
@@ -1,6 +1,6 @@
 """Domain models for annotations."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
@@ -8,7 +8,7 @@ from src.domain.models.selection import Range
 from src.shared.types import RangeAddress, SheetName
 
 
-@dataclass
+@dataclass(slots=True)
 class Annotation:
     """
     Represents a semantic annotation on a range of cells.
@@ -26,6 +26,7 @@ class Annotation:
     description: Optional[str] = None
     created_at: Optional[datetime] = None
     metadata: Optional[dict] = None
+    _iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Initialize created timestamp if not provided."""
@@ -70,6 +71,13 @@ class Annotation:
         """Get range address as string."""
         return self.range.to_address()
 
+    @property
+    def created_at_iso(self) -> Optional[str]:
+        """Get created timestamp as ISO string (formatted once)."""
+        if self._iso is None and self.created_at is not None:
+            self._iso = self.created_at.isoformat()
+        return self._iso
+
     def matches_range(self, other_range: Range, strict: bool = False) -> bool:
         """
         Check if this annotation matches a given range.
@@ -81,18 +89,26 @@ class Annotation:
         Returns:
             True if ranges match (exact or overlapping)
         """
+        r = self.range
+
         if strict:
             # Exact match
             return (
-                self.range.sheet == other_range.sheet
-                and self.range.start_row == other_range.start_row
-                and self.range.end_row == other_range.end_row
-                and self.range.start_col == other_range.start_col
-                and self.range.end_col == other_range.end_col
+                r.sheet == other_range.sheet
+                and (r.start_row, r.end_row, r.start_col, r.end_col)
+                == (other_range.start_row, other_range.end_row,
+                    other_range.start_col, other_range.end_col)
             )
-        else:
-            # Allow overlap
-            return self.range.overlaps(other_range)
+
+        # Overlap, with cheap rejects first (a missing sheet matches any sheet,
+        # as in Range.overlaps)
+        if r.sheet and other_range.sheet and r.sheet != other_range.sheet:
+            return False
+        if r.end_row < other_range.start_row or other_range.end_row < r.start_row:
+            return False
+        if r.end_col < other_range.start_col or other_range.end_col < r.start_col:
+            return False
+        return True
 
     def contains_range(self, other_range: Range) -> bool:
         """
@@ -117,7 +133,7 @@ class Annotation:
             "range": self.address,
             "label": self.label,
             "description": self.description,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": self.created_at_iso,
             "metadata": self.metadata,
         }
 
@@ -133,15 +149,20 @@ class Annotation:
             Annotation object
         """
         created_at = None
-        if data.get("created_at"):
-            created_at = datetime.fromisoformat(data["created_at"])
+        iso = data.get("created_at")
+        if iso:
+            created_at = datetime.fromisoformat(iso)
 
-        return cls.from_address(
-            address=data["range"],
+        annotation = cls(
+            range=Range.from_address(data["range"]),
             label=data["label"],
             description=data.get("description"),
+            created_at=created_at,
             metadata=data.get("metadata"),
         )
+        if created_at is not None:
+            annotation._iso = iso
+        return annotation
 
     def __str__(self) -> str:
         """String representation."""
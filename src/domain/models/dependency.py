@@ -1,25 +1,39 @@
 """Domain models for dependency graphs and trees."""
 
+import sys
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from typing import Collection, Dict, FrozenSet, Iterator, List, Optional, Set
 
+from src.shared.exceptions import DependencyGraphError
 from src.shared.types import CellAddress, SheetName
 
 
-@dataclass
+_INDENTS: List[str] = [""]
+
+
+def _indent(depth: int) -> str:
+    """Get indent string for a tree depth (cached per depth level)."""
+    while len(_INDENTS) <= depth:
+        _INDENTS.append(_INDENTS[-1] + "  ")
+    return _INDENTS[depth]
+
+
+@dataclass(slots=True)
 class DependencyNode:
     """
     Represents a node in the dependency graph.
 
     Each node is a cell that may have dependencies (predecessors)
-    and dependents (successors).
+    and dependents (successors). Edge sets become tuples once the
+    owning graph is frozen.
     """
 
     cell_address: CellAddress
     sheet: SheetName
     formula: Optional[str] = None
-    predecessors: Set[CellAddress] = field(default_factory=set)  # Cells this depends on
-    successors: Set[CellAddress] = field(default_factory=set)    # Cells that depend on this
+    predecessors: Collection[CellAddress] = field(default_factory=set)  # Cells this depends on
+    successors: Collection[CellAddress] = field(default_factory=set)    # Cells that depend on this
 
     def add_predecessor(self, cell_address: CellAddress) -> None:
         """Add a cell that this node depends on."""
@@ -50,7 +64,13 @@ class DependencyNode:
 
     def __hash__(self) -> int:
         """Hash for use in sets."""
-        return hash(f"{self.sheet}!{self.cell_address}")
+        return hash((self.sheet, self.cell_address))
+
+    def __eq__(self, other: object) -> bool:
+        """Nodes are equal when they refer to the same cell."""
+        if not isinstance(other, DependencyNode):
+            return NotImplemented
+        return (self.sheet, self.cell_address) == (other.sheet, other.cell_address)
 
 
 @dataclass
@@ -63,62 +83,559 @@ class DependencyGraph:
 
     nodes: Dict[CellAddress, DependencyNode] = field(default_factory=dict)
     workbook_name: Optional[str] = None
+    # Short address ("A1") -> full addresses ("Sheet1!A1", ...) in insertion order
+    _by_short: Dict[CellAddress, List[CellAddress]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    _frozen: bool = field(default=False, repr=False, compare=False)
+    _formula_count: int = field(default=0, repr=False, compare=False)
+
+    # CSR adjacency, built by to_csr(). Node ids index addr_of; the edges of
+    # node u are indices[indptr[u]:indptr[u + 1]].
+    id_of: Dict[CellAddress, int] = field(default_factory=dict, repr=False, compare=False)
+    addr_of: List[CellAddress] = field(default_factory=list, repr=False, compare=False)
+    # Node objects by id, so walks over ids reach nodes without address lookups
+    node_of: List[DependencyNode] = field(default_factory=list, repr=False, compare=False)
+    pred_indptr: array = field(default_factory=lambda: array("i"), repr=False, compare=False)
+    pred_indices: array = field(default_factory=lambda: array("i"), repr=False, compare=False)
+    succ_indptr: array = field(default_factory=lambda: array("i"), repr=False, compare=False)
+    succ_indices: array = field(default_factory=lambda: array("i"), repr=False, compare=False)
+    # Node id -> ids of all transitive predecessors/successors, filled lazily
+    _up_closure: Dict[int, FrozenSet[int]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    _down_closure: Dict[int, FrozenSet[int]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    # Node ids in topological order (precedents first), filled lazily by
+    # topo_order()
+    _topo: Optional[array] = field(default=None, repr=False, compare=False)
 
     def add_node(self, node: DependencyNode) -> None:
-        """Add a node to the graph."""
-        full_address = f"{node.sheet}!{node.cell_address}"
+        """
+        Add a node to the graph.
+
+        Raises:
+            DependencyGraphError: If the graph has been frozen
+        """
+        if self._frozen:
+            raise DependencyGraphError("Cannot add nodes to a frozen dependency graph")
+
+        # Workbooks have few sheet names but every node repeats one
+        node.sheet = sys.intern(node.sheet)
+        full_address = sys.intern(f"{node.sheet}!{node.cell_address}")
+        existing = self.nodes.get(full_address)
+        if existing is None:
+            self._by_short.setdefault(node.cell_address, []).append(full_address)
+        elif existing.formula:
+            self._formula_count -= 1
+        if node.formula:
+            self._formula_count += 1
         self.nodes[full_address] = node
 
-    def get_node(self, cell_address: CellAddress) -> Optional[DependencyNode]:
+    def set_formula(self, node: DependencyNode, formula: Optional[str]) -> None:
+        """
+        Set the formula of a node already in the graph.
+
+        Use this instead of assigning node.formula so formula_count() stays
+        accurate.
+
+        Args:
+            node: Node in this graph
+            formula: Formula string (None for a value cell)
+        """
+        if self._frozen:
+            raise DependencyGraphError("Cannot modify a frozen dependency graph")
+
+        self._formula_count += bool(formula) - bool(node.formula)
+        node.formula = formula
+
+    def merge(self, other: "DependencyGraph") -> None:
+        """
+        Merge another (partial) graph into this one.
+
+        Nodes new to this graph are added in other's order; for nodes in
+        both, edges are unioned and a formula fills in a reference-only
+        node. Merging partial graphs in order gives the same nodes, edges
+        and formulas as building them into one graph. Nodes of other may
+        be reused, so other shouldn't be used afterwards.
+
+        Args:
+            other: Graph to merge in
+
+        Raises:
+            DependencyGraphError: If this graph has been frozen
+        """
+        if self._frozen:
+            raise DependencyGraphError("Cannot merge into a frozen dependency graph")
+
+        nodes = self.nodes
+        for full_address, node in other.nodes.items():
+            existing = nodes.get(full_address)
+            if existing is None:
+                self.add_node(node)
+                continue
+
+            existing.predecessors.update(node.predecessors)
+            existing.successors.update(node.successors)
+            if existing.formula is None and node.formula:
+                self.set_formula(existing, node.formula)
+
+    def get_node(
+        self,
+        cell_address: CellAddress,
+        sheet: Optional[SheetName] = None,
+    ) -> Optional[DependencyNode]:
         """
         Get node by address.
 
         Args:
             cell_address: Cell address (with or without sheet)
+            sheet: Preferred sheet when cell_address has no sheet prefix and
+                   the same address exists on several sheets
 
         Returns:
             Dependency node or None if not found
         """
-        # Try with and without sheet prefix
-        if cell_address in self.nodes:
-            return self.nodes[cell_address]
-
-        # Try adding each sheet prefix
-        for addr in self.nodes:
-            if addr.endswith(f"!{cell_address}"):
-                return self.nodes[addr]
-
-        return None
-
-    def get_predecessors(self, cell_address: CellAddress) -> Set[CellAddress]:
+        node = self.nodes.get(cell_address)
+        if node is not None:
+            return node
+
+        candidates = self._by_short.get(cell_address)
+        if not candidates:
+            return None
+
+        if sheet is not None:
+            preferred = self.nodes.get(f"{sheet}!{cell_address}")
+            if preferred is not None:
+                return preferred
+
+        return self.nodes[candidates[0]]
+
+    def get_predecessors(
+        self,
+        cell_address: CellAddress,
+        sheet: Optional[SheetName] = None,
+    ) -> Collection[CellAddress]:
         """
         Get all cells that the given cell depends on.
 
         Args:
             cell_address: Cell to get predecessors for
+            sheet: Preferred sheet for addresses without a sheet prefix
 
         Returns:
-            Set of predecessor cell addresses
+            Predecessor cell addresses
         """
-        node = self.get_node(cell_address)
+        node = self.get_node(cell_address, sheet)
         if node:
             return node.predecessors
-        return set()
+        return ()
 
-    def get_successors(self, cell_address: CellAddress) -> Set[CellAddress]:
+    def get_successors(
+        self,
+        cell_address: CellAddress,
+        sheet: Optional[SheetName] = None,
+    ) -> Collection[CellAddress]:
         """
         Get all cells that depend on the given cell.
 
         Args:
             cell_address: Cell to get successors for
+            sheet: Preferred sheet for addresses without a sheet prefix
 
         Returns:
-            Set of successor cell addresses
+            Successor cell addresses
         """
-        node = self.get_node(cell_address)
+        node = self.get_node(cell_address, sheet)
         if node:
             return node.successors
-        return set()
+        return ()
+
+    def freeze(self) -> None:
+        """
+        Make the graph read-only once building is finished.
+
+        Converts every node's predecessor/successor sets to tuples, which
+        take far less memory. Traversal only iterates edges, so membership
+        checks aren't needed after the build.
+        """
+        if self._frozen:
+            return
+
+        for node in self.nodes.values():
+            node.predecessors = tuple(node.predecessors)
+            node.successors = tuple(node.successors)
+
+        self._frozen = True
+        self.to_csr()
+
+    def to_csr(self) -> None:
+        """
+        Build compressed sparse row adjacency arrays from the node edges.
+
+        Nodes get dense integer ids in insertion order. Edges to addresses
+        that aren't in the graph are dropped. Traversals can then walk
+        contiguous int arrays instead of hashing address strings per edge.
+        """
+        id_of = {address: i for i, address in enumerate(self.nodes)}
+
+        pred_indptr = array("i", [0])
+        pred_indices = array("i")
+        succ_indptr = array("i", [0])
+        succ_indices = array("i")
+
+        for node in self.nodes.values():
+            pred_indices.extend(id_of[a] for a in node.predecessors if a in id_of)
+            pred_indptr.append(len(pred_indices))
+            succ_indices.extend(id_of[a] for a in node.successors if a in id_of)
+            succ_indptr.append(len(succ_indices))
+
+        self.id_of = id_of
+        self.addr_of = list(self.nodes)
+        self.node_of = list(self.nodes.values())
+        self.pred_indptr = pred_indptr
+        self.pred_indices = pred_indices
+        self.succ_indptr = succ_indptr
+        self.succ_indices = succ_indices
+
+    def _require_frozen(self) -> None:
+        """
+        Check that building is finished before a read that needs the CSR arrays.
+
+        Raises:
+            DependencyGraphError: If the graph hasn't been frozen yet
+        """
+        if not self._frozen:
+            raise DependencyGraphError("Dependency graph must be frozen before it is queried")
+
+    def reachable_upstream(self, cell_address: CellAddress) -> FrozenSet[CellAddress]:
+        """
+        Get every cell the given cell depends on, directly or indirectly.
+
+        Args:
+            cell_address: Full cell address ("Sheet!A1")
+
+        Returns:
+            Transitive predecessor addresses (empty if not in graph)
+
+        Raises:
+            DependencyGraphError: If the graph hasn't been frozen yet
+        """
+        return self._reachable(cell_address, self.pred_indptr, self.pred_indices, self._up_closure)
+
+    def reachable_downstream(self, cell_address: CellAddress) -> FrozenSet[CellAddress]:
+        """
+        Get every cell that depends on the given cell, directly or indirectly.
+
+        Args:
+            cell_address: Full cell address ("Sheet!A1")
+
+        Returns:
+            Transitive successor addresses (empty if not in graph)
+
+        Raises:
+            DependencyGraphError: If the graph hasn't been frozen yet
+        """
+        return self._reachable(
+            cell_address, self.succ_indptr, self.succ_indices, self._down_closure
+        )
+
+    def depends_on(self, cell_address: CellAddress, other_address: CellAddress) -> bool:
+        """
+        Check if a cell depends (transitively) on another cell.
+
+        Args:
+            cell_address: Full address of the dependent cell
+            other_address: Full address of the possible precedent
+
+        Returns:
+            True if other_address is upstream of cell_address
+
+        Raises:
+            DependencyGraphError: If the graph hasn't been frozen yet
+        """
+        self._require_frozen()
+        node_id = self.id_of.get(cell_address)
+        other_id = self.id_of.get(other_address)
+        if node_id is None or other_id is None:
+            return False
+        return other_id in self._closure_ids(
+            node_id, self.pred_indptr, self.pred_indices, self._up_closure
+        )
+
+    def topo_order(self) -> array:
+        """
+        Get node ids in topological order: every cell after its precedents.
+
+        Computed once per graph (Kahn's algorithm over the CSR arrays). If
+        the workbook has circular references, cells in a cycle are kept
+        together and the cycles themselves are ordered topologically
+        (strongly connected components via _scc_order).
+
+        Returns:
+            Array of node ids (indexes into addr_of/node_of)
+
+        Raises:
+            DependencyGraphError: If the graph hasn't been frozen yet
+        """
+        self._require_frozen()
+        if self._topo is not None:
+            return self._topo
+
+        n = len(self.addr_of)
+        pred_indptr = self.pred_indptr
+        succ_indptr, succ_indices = self.succ_indptr, self.succ_indices
+
+        # In-degree is the number of precedents still to be placed
+        in_degree = array("i", (pred_indptr[i + 1] - pred_indptr[i] for i in range(n)))
+        order = array("i", (i for i in range(n) if in_degree[i] == 0))
+        head = 0
+        while head < len(order):
+            u = order[head]
+            head += 1
+            for v in succ_indices[succ_indptr[u]:succ_indptr[u + 1]]:
+                in_degree[v] -= 1
+                if in_degree[v] == 0:
+                    order.append(v)
+
+        if len(order) < n:
+            # Some cells never reached in-degree 0: there is a cycle
+            order = self._scc_order()
+
+        self._topo = order
+        return order
+
+    def _scc_order(self) -> array:
+        """
+        Topological order of strongly connected components (Tarjan, iterative).
+
+        Tarjan's algorithm over successor edges finishes a component only
+        after every component it reaches, so reversing the finish order
+        places precedents first. Ids within a component are ascending.
+
+        Returns:
+            Array of all node ids
+        """
+        n = len(self.addr_of)
+        succ_indptr, succ_indices = self.succ_indptr, self.succ_indices
+        index = [-1] * n
+        low = [0] * n
+        on_stack = bytearray(n)
+        stack: List[int] = []
+        components: List[List[int]] = []
+        counter = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            work = [[root, succ_indptr[root]]]
+
+            while work:
+                frame = work[-1]
+                v, e = frame
+                if e < succ_indptr[v + 1]:
+                    frame[1] = e + 1
+                    w = succ_indices[e]
+                    if index[w] == -1:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = 1
+                        work.append([w, succ_indptr[w]])
+                    elif on_stack[w] and index[w] < low[v]:
+                        low[v] = index[w]
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[v] < low[parent]:
+                        low[parent] = low[v]
+
+                if low[v] == index[v]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        component.append(w)
+                        if w == v:
+                            break
+                    component.sort()
+                    components.append(component)
+
+        order = array("i")
+        for component in reversed(components):
+            order.extend(component)
+        return order
+
+    def _reachable(
+        self,
+        cell_address: CellAddress,
+        indptr: array,
+        indices: array,
+        memo: Dict[int, FrozenSet[int]],
+    ) -> FrozenSet[CellAddress]:
+        """Transitive closure of a node as addresses (see _closure_ids)."""
+        self._require_frozen()
+        node_id = self.id_of.get(cell_address)
+        if node_id is None:
+            return frozenset()
+        addr_of = self.addr_of
+        return frozenset(addr_of[i] for i in self._closure_ids(node_id, indptr, indices, memo))
+
+    @staticmethod
+    def _closure_ids(
+        node_id: int,
+        indptr: array,
+        indices: array,
+        memo: Dict[int, FrozenSet[int]],
+    ) -> FrozenSet[int]:
+        """
+        Ids reachable from a node over CSR edges, memoized per node.
+
+        A node whose closure is already known contributes it wholesale
+        instead of being walked again, so shared precedents (e.g. a
+        parameter cell used everywhere) are expanded once per graph.
+        The graph is frozen, so memoized closures never go stale.
+        """
+        closure = memo.get(node_id)
+        if closure is not None:
+            return closure
+
+        seen: Set[int] = set()
+        stack = list(indices[indptr[node_id]:indptr[node_id + 1]])
+        while stack:
+            v = stack.pop()
+            if v in seen:
+                continue
+            seen.add(v)
+            known = memo.get(v)
+            if known is not None:
+                seen |= known
+                continue
+            stack.extend(indices[indptr[v]:indptr[v + 1]])
+
+        closure = frozenset(seen)
+        memo[node_id] = closure
+        return closure
+
+    def to_columns(self) -> Dict[str, object]:
+        """
+        Export the frozen graph as flat columns for serialization.
+
+        Node fields become parallel lists in id order and the CSR arrays
+        become raw bytes, so a serializer only sees built-in types and no
+        per-node objects.
+
+        Returns:
+            Dict of columns (see from_columns)
+
+        Raises:
+            DependencyGraphError: If the graph hasn't been frozen yet
+        """
+        self._require_frozen()
+        nodes = self.node_of
+        return {
+            "workbook_name": self.workbook_name,
+            "typecode": self.pred_indices.typecode,
+            "cell_addresses": [node.cell_address for node in nodes],
+            "sheets": [node.sheet for node in nodes],
+            "formulas": [node.formula for node in nodes],
+            "pred_indptr": self.pred_indptr.tobytes(),
+            "pred_indices": self.pred_indices.tobytes(),
+            "succ_indptr": self.succ_indptr.tobytes(),
+            "succ_indices": self.succ_indices.tobytes(),
+        }
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, object]) -> "DependencyGraph":
+        """
+        Rebuild a frozen graph from to_columns() output.
+
+        Args:
+            columns: Dict produced by to_columns()
+
+        Returns:
+            Frozen dependency graph
+
+        Raises:
+            DependencyGraphError: If the columns are inconsistent
+        """
+        typecode = columns["typecode"]
+        arrays = {}
+        for name in ("pred_indptr", "pred_indices", "succ_indptr", "succ_indices"):
+            arrays[name] = array(typecode)
+            arrays[name].frombytes(columns[name])
+
+        cell_addresses = columns["cell_addresses"]
+        sheets = columns["sheets"]
+        formulas = columns["formulas"]
+        n = len(cell_addresses)
+        if not (
+            len(sheets) == len(formulas) == n
+            and len(arrays["pred_indptr"]) == len(arrays["succ_indptr"]) == n + 1
+        ):
+            raise DependencyGraphError("Inconsistent dependency graph columns")
+
+        graph = cls(workbook_name=columns["workbook_name"])
+        intern = sys.intern
+        addr_of = [
+            intern(f"{sheet}!{cell}") for cell, sheet in zip(cell_addresses, sheets, strict=True)
+        ]
+
+        pred_indptr, pred_indices = arrays["pred_indptr"], arrays["pred_indices"]
+        succ_indptr, succ_indices = arrays["succ_indptr"], arrays["succ_indices"]
+        nodes = graph.nodes
+        by_short = graph._by_short
+        node_of = []
+        for i, full_address in enumerate(addr_of):
+            node = DependencyNode(
+                cell_address=intern(cell_addresses[i]),
+                sheet=intern(sheets[i]),
+                formula=formulas[i],
+                predecessors=tuple(
+                    addr_of[j] for j in pred_indices[pred_indptr[i]:pred_indptr[i + 1]]
+                ),
+                successors=tuple(
+                    addr_of[j] for j in succ_indices[succ_indptr[i]:succ_indptr[i + 1]]
+                ),
+            )
+            nodes[full_address] = node
+            by_short.setdefault(node.cell_address, []).append(full_address)
+            node_of.append(node)
+
+        graph._formula_count = sum(1 for formula in formulas if formula)
+        graph.id_of = {address: i for i, address in enumerate(addr_of)}
+        graph.addr_of = addr_of
+        graph.node_of = node_of
+        graph.pred_indptr = pred_indptr
+        graph.pred_indices = pred_indices
+        graph.succ_indptr = succ_indptr
+        graph.succ_indices = succ_indices
+        graph._frozen = True
+        return graph
+
+    def __getstate__(self) -> Dict[str, object]:
+        """Pickle state without node_of (rebuilt from nodes on load)."""
+        state = self.__dict__.copy()
+        state.pop("node_of", None)
+        return state
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        """Restore pickled state and rebuild node_of."""
+        self.__dict__.update(state)
+        self.node_of = [self.nodes[address] for address in self.addr_of]
+
+    @property
+    def is_frozen(self) -> bool:
+        """Check if graph has been frozen."""
+        return self._frozen
 
     def node_count(self) -> int:
         """Get total number of nodes in graph."""
@@ -126,7 +643,13 @@ class DependencyGraph:
 
     def formula_count(self) -> int:
         """Get count of cells with formulas."""
-        return sum(1 for node in self.nodes.values() if node.formula)
+        return self._formula_count
+
+    def edge_count(self) -> int:
+        """Get number of dependency edges in graph."""
+        if self._frozen:
+            return len(self.pred_indices)
+        return sum(len(node.predecessors) for node in self.nodes.values())
 
     def __str__(self) -> str:
         """String representation."""
@@ -134,12 +657,13 @@ class DependencyGraph:
         return f"DependencyGraph{name}: {self.node_count()} nodes, {self.formula_count()} formulas"
 
 
-@dataclass
+@dataclass(slots=True)
 class DependencyTreeNode:
     """
     Represents a node in a dependency tree (traced from a specific cell).
 
-    Used for visualization and understanding dependency chains.
+    Used for visualization and understanding dependency chains. Traces
+    create one per reached cell, so instances are slotted.
     """
 
     cell_address: CellAddress
@@ -162,26 +686,45 @@ class DependencyTreeNode:
         """Check if this is a leaf node (no children)."""
         return len(self.children) == 0
 
+    def iter_subtree(self) -> Iterator["DependencyTreeNode"]:
+        """
+        Iterate over each node in subtree (including self) once.
+
+        Uses an explicit stack, so deep trees don't hit the recursion
+        limit, and a node instance reachable via several parents is
+        only visited once.
+        """
+        seen: Set[int] = set()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            yield node
+            stack.extend(node.children)
+
     def total_nodes(self) -> int:
         """Count total nodes in subtree (including self)."""
-        return 1 + sum(child.total_nodes() for child in self.children)
+        return sum(1 for _ in self.iter_subtree())
 
     def max_depth(self) -> int:
         """Get maximum depth of subtree."""
-        if self.is_leaf():
-            return self.depth
-        return max(child.max_depth() for child in self.children)
+        return max(node.depth for node in self.iter_subtree() if node.is_leaf())
 
     def __str__(self) -> str:
         """String representation."""
-        indent = "  " * self.depth
+        indent = _indent(self.depth)
         formula_info = f" = {self.formula}" if self.formula else ""
         value_info = f" [{self.value}]" if self.value is not None else ""
         return f"{indent}{self.full_address}{formula_info}{value_info}"
 
     def __repr__(self) -> str:
         """Debug representation."""
-        return f"DependencyTreeNode('{self.full_address}', depth={self.depth}, children={len(self.children)})"
+        return (
+            f"DependencyTreeNode('{self.full_address}', depth={self.depth}, "
+            f"children={len(self.children)})"
+        )
 
 
 @dataclass
@@ -195,14 +738,38 @@ class DependencyTree:
     root: DependencyTreeNode
     direction: str  # "upstream" | "downstream" | "both"
     max_depth: int
+    # Trees are fully built before being wrapped, so subtree stats are cached
+    _size_cache: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _depth_cache: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
     def total_nodes(self) -> int:
         """Get total number of nodes in tree."""
-        return self.root.total_nodes()
+        if self._size_cache is None:
+            self._size_cache = self.root.total_nodes()
+        return self._size_cache
 
     def actual_max_depth(self) -> int:
         """Get actual maximum depth reached."""
-        return self.root.max_depth()
+        if self._depth_cache is None:
+            self._depth_cache = self.root.max_depth()
+        return self._depth_cache
+
+    def iter_lines(self, max_depth: Optional[int] = None) -> Iterator[str]:
+        """
+        Yield formatted lines for the tree in display (pre-)order.
+
+        Args:
+            max_depth: Leave out nodes deeper than this (None for all)
+
+        Yields:
+            One line per node, indented by depth
+        """
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            yield str(node)
+            if max_depth is None or node.depth < max_depth:
+                stack.extend(reversed(node.children))
 
     def to_lines(self) -> List[str]:
         """
@@ -211,18 +778,12 @@ class DependencyTree:
         Returns:
             List of lines representing the tree
         """
-        lines = []
-        self._add_node_lines(self.root, lines)
-        return lines
-
-    def _add_node_lines(self, node: DependencyTreeNode, lines: List[str]) -> None:
-        """Recursively add node and children to lines."""
-        lines.append(str(node))
-        for child in node.children:
-            self._add_node_lines(child, lines)
+        return list(self.iter_lines())
 
     def __str__(self) -> str:
         """String representation."""
-        lines = self.to_lines()
-        header = f"DependencyTree ({self.direction}, max_depth={self.max_depth}, {self.total_nodes()} nodes):"
-        return header + "\n" + "\n".join(lines)
+        header = (
+            f"DependencyTree ({self.direction}, max_depth={self.max_depth}, "
+            f"{self.total_nodes()} nodes):"
+        )
+        return header + "\n" + "\n".join(self.iter_lines())
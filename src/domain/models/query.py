@@ -1,8 +1,10 @@
 """Domain models for queries and responses."""
 
+import hashlib
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from src.domain.models.annotation import Annotation
 from src.domain.models.dependency import DependencyTree
@@ -26,19 +28,45 @@ class QuestionContext:
     max_depth: int = 3
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
+        """
+        Convert to a canonical dictionary.
+
+        Equivalent questions give identical output (fixed key order,
+        whitespace-normalized question, lowercase mode, selection as sheet
+        plus numeric bounds), so it can be hashed for caching.
+        """
+        selection = None
+        if self.selection:
+            selection = [self.selection.sheet_name, *self.selection.range._bbox]
+
         return {
-            "question": self.question,
-            "selection": str(self.selection) if self.selection else None,
+            "question": " ".join(self.question.split()),
+            "selection": selection,
             "active_sheet": self.active_sheet,
-            "mode": self.mode,
+            "mode": self.mode.lower(),
             "include_dependencies": self.include_dependencies,
             "include_annotations": self.include_annotations,
             "max_depth": self.max_depth,
         }
 
+    def cache_key(self, version: str = "") -> bytes:
+        """
+        Get a stable digest identifying this question.
 
-@dataclass
+        Args:
+            version: Extra token to mix in (e.g. workbook path and mtime)
+
+        Returns:
+            16-byte blake2b digest of the canonical dict and version
+        """
+        canonical = json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":"))
+        digest = hashlib.blake2b(canonical.encode("utf-8"), digest_size=16)
+        digest.update(b"\0")
+        digest.update(version.encode("utf-8"))
+        return digest.digest()
+
+
+@dataclass(slots=True)
 class ExplorationStep:
     """
     Represents a single step in the agent's exploration.
@@ -111,6 +139,30 @@ class AssistantResponse:
         return self.answer
 
 
+# Static prompt section headers
+_HDR_SYSTEM = "# System\n"
+_HDR_CONTEXT = "# Context from Excel\n\n"
+_HDR_SELECTION = "## User Selection\n"
+_HDR_SPATIAL = "## Spatial Context\n"
+_HDR_FORMULAS = "## Formulas\n\n"
+_HDR_DEPENDENCIES = "## Dependencies\n"
+_HDR_ANNOTATIONS = "## Annotations\n\n"
+_HDR_ADDITIONAL = "## Additional Context\n\n"
+_HDR_QUESTION = "# Question\n"
+_ANSWER_FOOTER = (
+    "# Answer\nPlease explain this in terms of financial concepts and business logic:"
+)
+
+
+def _iter_bullets(items: List[str]) -> Iterator[str]:
+    """Yield a markdown bullet list, one chunk per item (no trailing newline)."""
+    sep = "- "
+    for item in items:
+        yield sep
+        yield item
+        sep = "\n- "
+
+
 @dataclass
 class LLMContext:
     """
@@ -126,65 +178,139 @@ class LLMContext:
     annotations: List[str] = field(default_factory=list)
     spatial_context: Optional[str] = None  # Snapshot or region info
     additional_context: Dict[str, Any] = field(default_factory=dict)
+    # (inputs, prompt) of the last to_prompt() call
+    _prompt_memo: Optional[Tuple[tuple, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_prompt(self, system_prompt: Optional[str] = None) -> str:
         """
         Convert context to a formatted prompt for the LLM.
 
+        The result is memoized until a field or the system prompt changes,
+        so e.g. token_estimate() followed by a provider call renders once.
+
         Args:
             system_prompt: Optional system prompt to include
 
         Returns:
             Formatted prompt string
         """
-        parts = []
+        key = self._prompt_key(system_prompt)
+        memo = self._prompt_memo
+        if memo is not None and memo[0] == key:
+            return memo[1]
+
+        prompt = "".join(self.iter_prompt_chunks(system_prompt))
+        self._prompt_memo = (key, prompt)
+        return prompt
+
+    def _prompt_key(self, system_prompt: Optional[str]) -> tuple:
+        """Snapshot of everything the prompt depends on (compared, not hashed)."""
+        return (
+            system_prompt,
+            self.question,
+            self.selection_info,
+            tuple(self.formulas),
+            self.dependencies,
+            tuple(self.annotations),
+            self.spatial_context,
+            tuple(self.additional_context.items()),
+        )
 
-        if system_prompt:
-            parts.append(f"# System\n{system_prompt}\n")
+    def iter_prompt_chunks(self, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """
+        Yield the formatted prompt as string fragments.
+
+        Sections are ordered static-first: everything from
+        _iter_prefix_chunks() is identical across questions about the same
+        context, and only the selection and question follow it. Providers
+        cache prompts by exact prefix, so keeping the volatile parts at the
+        end lets repeated queries reuse the cached prefix.
+
+        Large sections (snapshot, dependency tree) are yielded as-is, so
+        callers can stream or measure the prompt without joining it.
 
-        parts.append("# Context from Excel\n")
+        Args:
+            system_prompt: Optional system prompt to include
+
+        Yields:
+            Prompt fragments; "".join() of them equals to_prompt()
+        """
+        yield from self._iter_prefix_chunks(system_prompt)
 
         if self.selection_info:
-            parts.append(f"## User Selection\n{self.selection_info}\n")
+            yield _HDR_SELECTION
+            yield self.selection_info.rstrip()
+            yield "\n\n"
 
-        if self.spatial_context:
-            parts.append(f"## Spatial Context\n{self.spatial_context}\n")
+        yield _HDR_QUESTION
+        yield self.question.rstrip()
+        yield "\n\n"
+        yield _ANSWER_FOOTER
 
-        if self.formulas:
-            parts.append("## Formulas\n")
-            for formula in self.formulas:
-                parts.append(f"- {formula}")
-            parts.append("")
+    def _iter_prefix_chunks(self, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """
+        Yield the cacheable (question-independent) part of the prompt.
 
-        if self.dependencies:
-            parts.append(f"## Dependencies\n{self.dependencies}\n")
+        List and dict sections are sorted and trailing whitespace is
+        stripped, so the same context always serializes to the same bytes.
+
+        Args:
+            system_prompt: Optional system prompt to include
+
+        Yields:
+            Prompt prefix fragments
+        """
+        if system_prompt:
+            yield _HDR_SYSTEM
+            yield system_prompt.rstrip()
+            yield "\n\n"
+
+        yield _HDR_CONTEXT
+
+        if self.spatial_context:
+            yield _HDR_SPATIAL
+            yield self.spatial_context.rstrip()
+            yield "\n\n"
 
         if self.annotations:
-            parts.append("## Annotations\n")
-            for annotation in self.annotations:
-                parts.append(f"- {annotation}")
-            parts.append("")
+            yield _HDR_ANNOTATIONS
+            yield from _iter_bullets(sorted(self.annotations))
+            yield "\n\n"
 
-        if self.additional_context:
-            parts.append("## Additional Context\n")
-            for key, value in self.additional_context.items():
-                parts.append(f"**{key}**: {value}")
-            parts.append("")
+        if self.formulas:
+            yield _HDR_FORMULAS
+            yield from _iter_bullets(sorted(self.formulas))
+            yield "\n\n"
 
-        parts.append(f"# Question\n{self.question}\n")
-        parts.append("# Answer\nPlease explain this in terms of financial concepts and business logic:")
+        if self.dependencies:
+            yield _HDR_DEPENDENCIES
+            yield self.dependencies.rstrip()
+            yield "\n\n"
 
-        return "\n".join(parts)
+        if self.additional_context:
+            yield _HDR_ADDITIONAL
+            sep = ""
+            for key in sorted(self.additional_context):
+                yield f"{sep}**{key}**: {str(self.additional_context[key]).rstrip()}"
+                sep = "\n"
+            yield "\n\n"
 
     def token_estimate(self) -> int:
         """
         Rough estimate of token count.
 
+        Uses the memoized prompt if it is current, otherwise sums fragment
+        lengths without building the prompt string.
+
         Returns:
             Estimated token count (assuming ~4 chars per token)
         """
-        prompt = self.to_prompt()
-        return len(prompt) // 4
+        memo = self._prompt_memo
+        if memo is not None and memo[0] == self._prompt_key(None):
+            return len(memo[1]) // 4
+        return sum(map(len, self.iter_prompt_chunks())) // 4
 
 
 @dataclass
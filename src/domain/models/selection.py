@@ -1,13 +1,33 @@
 """Domain models for selections and ranges."""
 
 import re
-from dataclasses import dataclass
-from typing import Optional, Tuple
+import sys
+from dataclasses import dataclass, field
+from itertools import product
+from string import ascii_uppercase
+from typing import Dict, Iterator, Optional, Sequence, Tuple
 
 from src.shared.exceptions import InvalidRangeError
 
 
-@dataclass
+def _gen_all_cols() -> Iterator[str]:
+    """Yield column letters A..Z, AA..ZZ, AAA..ZZZ in index order."""
+    for width in (1, 2, 3):
+        for letters in product(ascii_uppercase, repeat=width):
+            yield "".join(letters)
+
+
+# Column letters <-> 0-based index for all 1-3 letter columns (covers XFD)
+_COL_IDX_TO_LETTER: Tuple[str, ...] = tuple(_gen_all_cols())
+_COL_LETTER_TO_IDX: Dict[str, int] = {letters: i for i, letters in enumerate(_COL_IDX_TO_LETTER)}
+
+# Strips "$" and upper-cases in a single str.translate call
+_DOLLAR_STRIP_TABLE = str.maketrans({"$": None, **{c.lower(): c for c in ascii_uppercase}})
+_CELL_ADDRESS_RE = re.compile(r"^([A-Z]+)(\d+)$")
+_DIGITS = "0123456789"
+
+
+@dataclass(slots=True)
 class Range:
     """
     Represents a cell range in Excel.
@@ -25,6 +45,18 @@ class Range:
     start_row: int  # 1-based row index
     end_col: int    # 0-based column index
     end_row: int    # 1-based row index
+    # (start_row, end_row, start_col, end_col), for the geometry checks
+    _bbox: Tuple[int, int, int, int] = field(init=False, repr=False, compare=False)
+    # (sheet, full address) from the last to_address(include_sheet=True)
+    _addr_cache: Optional[Tuple[Optional[str], str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Intern the sheet name and pack the bounds (ranges aren't resized)."""
+        if self.sheet:
+            self.sheet = sys.intern(self.sheet)
+        self._bbox = (self.start_row, self.end_row, self.start_col, self.end_col)
 
     @classmethod
     def from_address(cls, address: str) -> "Range":
@@ -86,18 +118,30 @@ class Range:
             InvalidRangeError: If cell address is invalid
         """
         # Remove dollar signs (absolute references like $A$1) before parsing
-        cell_clean = cell.replace("$", "").upper()
-        match = re.match(r"^([A-Z]+)(\d+)$", cell_clean)
+        cell_clean = cell.translate(_DOLLAR_STRIP_TABLE)
+
+        # Fast path for 1-3 letter columns: split off the trailing digits and
+        # look the letters up, no regex needed
+        col_letters = cell_clean.rstrip(_DIGITS)
+        if col_letters and len(col_letters) < len(cell_clean):
+            col_index = _COL_LETTER_TO_IDX.get(col_letters)
+            if col_index is not None:
+                return col_index, int(cell_clean[len(col_letters):])
+
+        match = _CELL_ADDRESS_RE.match(cell_clean)
         if not match:
             raise InvalidRangeError(f"Invalid cell address: {cell}")
 
         col_letters, row_str = match.groups()
 
         # Convert column letters to index (A=0, B=1, ..., Z=25, AA=26, etc.)
-        col_index = 0
-        for char in col_letters:
-            col_index = col_index * 26 + (ord(char) - ord('A') + 1)
-        col_index -= 1  # Make it 0-based
+        col_index = _COL_LETTER_TO_IDX.get(col_letters)
+        if col_index is None:
+            # Beyond ZZZ - compute it
+            col_index = 0
+            for char in col_letters:
+                col_index = col_index * 26 + (ord(char) - ord('A') + 1)
+            col_index -= 1  # Make it 0-based
 
         row_number = int(row_str)
 
@@ -114,6 +158,9 @@ class Range:
         Returns:
             Column letters (e.g., "A", "AB", "ZZ")
         """
+        if 0 <= col_index < len(_COL_IDX_TO_LETTER):
+            return _COL_IDX_TO_LETTER[col_index]
+
         letters = ""
         col_index += 1  # Make it 1-based for calculation
 
@@ -124,6 +171,17 @@ class Range:
 
         return letters
 
+    def col_letters(self) -> Sequence[str]:
+        """
+        Get the column letters of the range's columns, left to right.
+
+        Returns:
+            Column letters (a slice of the precomputed table when in range)
+        """
+        if 0 <= self.start_col and self.end_col < len(_COL_IDX_TO_LETTER):
+            return _COL_IDX_TO_LETTER[self.start_col:self.end_col + 1]
+        return [self._col_index_to_letter(col) for col in range(self.start_col, self.end_col + 1)]
+
     def to_address(self, include_sheet: bool = True) -> str:
         """
         Convert range to Excel address string.
@@ -134,6 +192,20 @@ class Range:
         Returns:
             Excel address string
         """
+        # Bounds never change, but the sheet may be assigned after construction,
+        # so the memoized address records which sheet it was built with
+        if include_sheet:
+            cached = self._addr_cache
+            if cached is not None and cached[0] is self.sheet:
+                return cached[1]
+            address = self._format_address(include_sheet=True)
+            self._addr_cache = (self.sheet, address)
+            return address
+
+        return self._format_address(include_sheet=False)
+
+    def _format_address(self, include_sheet: bool) -> str:
+        """Build the address string (see to_address)."""
         start_col_letter = self._col_index_to_letter(self.start_col)
         end_col_letter = self._col_index_to_letter(self.end_col)
 
@@ -179,15 +251,13 @@ class Range:
         Returns:
             True if this range fully contains the other range
         """
-        if self.sheet and other.sheet and self.sheet != other.sheet:
+        sheet, other_sheet = self.sheet, other.sheet
+        if sheet and other_sheet and sheet is not other_sheet and sheet != other_sheet:
             return False
 
-        return (
-            self.start_row <= other.start_row
-            and self.end_row >= other.end_row
-            and self.start_col <= other.start_col
-            and self.end_col >= other.end_col
-        )
+        sr, er, sc, ec = self._bbox
+        osr, oer, osc, oec = other._bbox
+        return sr <= osr and er >= oer and sc <= osc and ec >= oec
 
     def overlaps(self, other: "Range") -> bool:
         """
@@ -199,14 +269,14 @@ class Range:
         Returns:
             True if ranges overlap
         """
-        if self.sheet and other.sheet and self.sheet != other.sheet:
+        sheet, other_sheet = self.sheet, other.sheet
+        if sheet and other_sheet and sheet is not other_sheet and sheet != other_sheet:
             return False
 
         # Ranges overlap if they intersect in both dimensions
-        rows_overlap = not (self.end_row < other.start_row or self.start_row > other.end_row)
-        cols_overlap = not (self.end_col < other.start_col or self.start_col > other.end_col)
-
-        return rows_overlap and cols_overlap
+        sr, er, sc, ec = self._bbox
+        osr, oer, osc, oec = other._bbox
+        return not (er < osr or sr > oer or ec < osc or sc > oec)
 
     def expand(self, rows: int = 0, cols: int = 0) -> "Range":
         """
@@ -268,6 +338,7 @@ class Selection:
             raise InvalidRangeError("Sheet name must be specified")
 
         # Update range sheet if needed
+        final_sheet = sys.intern(final_sheet)
         if not range_obj.sheet:
             range_obj.sheet = final_sheet
 
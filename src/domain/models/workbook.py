@@ -1,28 +1,115 @@
 """Domain models for Excel workbooks, sheets, cells, and formulas."""
 
 import re
-from dataclasses import dataclass, field
+import sys
+import weakref
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime
-from typing import Any, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
 from src.shared.types import CellAddress, FormulaString, SheetName
 
+# Cell references in a formula, as one alternation scanned left to right.
+# Matches: A1, $A$1, Sheet1!A1, 'Sheet Name'!A1, A1:B10, A:A, 1:1, etc.
+# Earlier alternatives win at a given position, so "Sheet1!A1:B10" is one
+# reference rather than also yielding "A1:B10", "A1" and "B10".
+_CELL_REF_RE = re.compile(
+    # Sheet reference with range, cell, column or row
+    # (e.g., Sheet1!A1:B10, 'Sheet Name'!A1, Sheet1!A:A, Sheet1!1:1)
+    r"(?:'(?P<sheet_q>[^']+)'|(?P<sheet>\w+))!"
+    r"(?P<ref_sheet>\$?[A-Z]+\$?\d+(?::\$?[A-Z]+\$?\d+)?|\$?[A-Z]+:\$?[A-Z]+|\$?\d+:\$?\d+)"
+    # Simple range (e.g., A1:B10)
+    r"|(?P<range>\$?[A-Z]+\$?\d+:\$?[A-Z]+\$?\d+)"
+    # Column or row reference (e.g., A:A, 1:1)
+    r"|(?P<colrow>\$?[A-Z]+:\$?[A-Z]+|\$?\d+:\$?\d+)"
+    # Single cell (e.g., A1, $A$1)
+    r"|(?P<cell>\$?[A-Z]+\$?\d+)"
+)
 
-@dataclass
-class Formula:
+# Live Formula instances by text, for Formula.parse()
+_FORMULA_CACHE: "weakref.WeakValueDictionary[str, Formula]" = weakref.WeakValueDictionary()
+
+
+class _WeakReferenceable:
+    """Mixin giving slotted dataclasses a __weakref__ slot (weakref_slot needs 3.11)."""
+
+    __slots__ = ("__weakref__",)
+
+
+@dataclass(frozen=True, slots=True)
+class Formula(_WeakReferenceable):
     """
     Represents an Excel formula.
 
     A rich model that can parse and understand formula structure.
+    Immutable, so identical formulas (e.g. copied down a column) can share
+    one parsed instance via Formula.parse().
     """
 
     formula_text: FormulaString
-    referenced_cells: List[CellAddress] = field(default_factory=list)
+    # Pre-parsed references (e.g. from a cache); parsed from the text if None
+    known_references: InitVar[Optional[Sequence[CellAddress]]] = None
+    # Reference data below is filled in by _ensure_references() on first use:
+    # many formulas are loaded but never traced
+    _refs: Optional[Tuple[CellAddress, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _ref_set: FrozenSet[CellAddress] = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+    _ref_sheets: FrozenSet[SheetName] = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+    _has_cross: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self, known_references: Optional[Sequence[CellAddress]]) -> None:
+        """Store pre-parsed references, if given."""
+        if known_references is not None:
+            self._set_references(tuple(known_references))
+
+    def _set_references(self, refs: Tuple[CellAddress, ...]) -> Tuple[CellAddress, ...]:
+        """Store references and their derived lookups."""
+        ref_sheets = frozenset(ref.split("!", 1)[0] for ref in refs if "!" in ref)
+        object.__setattr__(self, "_ref_set", frozenset(refs))
+        object.__setattr__(self, "_ref_sheets", ref_sheets)
+        object.__setattr__(self, "_has_cross", bool(ref_sheets))
+        # Set last: other threads treat _refs as the "parsed" flag
+        object.__setattr__(self, "_refs", refs)
+        return refs
+
+    def _ensure_references(self) -> Tuple[CellAddress, ...]:
+        """Parse references from the text if not done yet."""
+        refs = self._refs
+        if refs is None:
+            refs = self._set_references(tuple(self._extract_cell_references()))
+        return refs
 
-    def __post_init__(self) -> None:
-        """Parse formula to extract referenced cells."""
-        if not self.referenced_cells:
-            self.referenced_cells = self._extract_cell_references()
+    @property
+    def referenced_cells(self) -> Tuple[CellAddress, ...]:
+        """Cell references in the formula (parsed on first access)."""
+        return self._ensure_references()
+
+    @classmethod
+    def parse(cls, formula_text: FormulaString) -> "Formula":
+        """
+        Get a parsed formula, reusing a live instance with the same text.
+
+        Args:
+            formula_text: Formula text (e.g., "=A1+B2")
+
+        Returns:
+            Formula object (shared between identical formulas)
+        """
+        formula = _FORMULA_CACHE.get(formula_text)
+        if formula is None:
+            formula = cls(formula_text)
+            _FORMULA_CACHE[formula_text] = formula
+        return formula
+
+    def references(self, cell_address: CellAddress) -> bool:
+        """Check if formula references an address (exact reference match)."""
+        self._ensure_references()
+        return cell_address in self._ref_set
 
     def _extract_cell_references(self) -> List[CellAddress]:
         """
@@ -36,61 +123,40 @@ class Formula:
             "=SUM(Sheet1!A1:A10)" -> ["Sheet1!A1:A10"]
             "=VLOOKUP(A1,Data!B:C,2,FALSE)" -> ["A1", "Data!B:C"]
         """
-        references = []
-
-        # Pattern for cell references (with optional sheet name)
-        # Matches: A1, $A$1, Sheet1!A1, 'Sheet Name'!A1, A1:B10, etc.
-        patterns = [
-            # Sheet reference with range (e.g., Sheet1!A1:B10, 'Sheet Name'!A1:B10)
-            r"(?:'([^']+)'|(\w+))!(\$?[A-Z]+\$?\d+(?::\$?[A-Z]+\$?\d+)?)",
-            # Sheet reference with column/row (e.g., Sheet1!A:A, Sheet1!1:1)
-            r"(?:'([^']+)'|(\w+))!(\$?[A-Z]+:\$?[A-Z]+|\$?\d+:\$?\d+)",
-            # Simple range (e.g., A1:B10)
-            r"(\$?[A-Z]+\$?\d+:\$?[A-Z]+\$?\d+)",
-            # Column or row reference (e.g., A:A, 1:1)
-            r"(\$?[A-Z]+:\$?[A-Z]+|\$?\d+:\$?\d+)",
-            # Single cell (e.g., A1, $A$1)
-            r"(\$?[A-Z]+\$?\d+)",
-        ]
-
-        formula_upper = self.formula_text.upper()
-
-        for pattern in patterns:
-            for match in re.finditer(pattern, formula_upper):
-                if match.lastindex == 3:
-                    # Sheet reference
-                    sheet = match.group(1) or match.group(2)
-                    cell_part = match.group(3)
-                    ref = f"{sheet}!{cell_part}"
-                else:
-                    # No sheet reference
-                    ref = match.group(0)
-
-                # Clean up $ signs for internal representation
-                ref = ref.replace("$", "")
+        # Formula text always starts with "=" - anything else has no references
+        if not self.formula_text.startswith("="):
+            return []
 
-                if ref not in references:
-                    references.append(ref)
+        # findall builds the group tuples in C, avoiding a Match object and
+        # several method calls per reference. Sheet references become
+        # "Sheet!ref"; $ signs are dropped for the internal representation,
+        # and each address is interned since it recurs across many formulas.
+        references = [
+            sys.intern(
+                (f"{sheet_q or sheet}!{ref_sheet}" if ref_sheet else range_ref or colrow or cell)
+                .replace("$", "")
+            )
+            for sheet_q, sheet, ref_sheet, range_ref, colrow, cell
+            in _CELL_REF_RE.findall(self.formula_text.upper())
+        ]
 
-        return references
+        # Ordered dedup (first occurrence wins)
+        return list(dict.fromkeys(references))
 
     def has_cross_sheet_references(self) -> bool:
         """Check if formula references other sheets."""
-        return any("!" in ref for ref in self.referenced_cells)
+        self._ensure_references()
+        return self._has_cross
 
-    def get_referenced_sheets(self) -> Set[SheetName]:
+    def get_referenced_sheets(self) -> FrozenSet[SheetName]:
         """
         Get all sheets referenced in formula.
 
         Returns:
             Set of sheet names referenced
         """
-        sheets = set()
-        for ref in self.referenced_cells:
-            if "!" in ref:
-                sheet = ref.split("!")[0]
-                sheets.add(sheet)
-        return sheets
+        self._ensure_references()
+        return self._ref_sheets
 
     def __str__(self) -> str:
         """String representation."""
@@ -101,7 +167,7 @@ class Formula:
         return f"Formula('{self.formula_text}')"
 
 
-@dataclass
+@dataclass(slots=True)
 class Cell:
     """
     Represents an Excel cell.
@@ -115,6 +181,11 @@ class Cell:
     formula: Optional[Formula] = None
     data_type: Optional[str] = None  # number, text, boolean, error, empty
 
+    def __post_init__(self) -> None:
+        """Intern address and sheet name (repeated across large workbooks)."""
+        self.address = sys.intern(self.address)
+        self.sheet = sys.intern(self.sheet)
+
     @property
     def full_address(self) -> CellAddress:
         """Get full address with sheet name."""
@@ -141,7 +212,7 @@ class Cell:
         """
         if not self.formula:
             return []
-        return self.formula.referenced_cells
+        return list(self.formula.referenced_cells)
 
     def references_cell(self, cell_address: CellAddress) -> bool:
         """
@@ -155,7 +226,7 @@ class Cell:
         """
         if not self.formula:
             return False
-        return cell_address in self.formula.referenced_cells
+        return self.formula.references(cell_address)
 
     def references_sheet(self, sheet_name: SheetName) -> bool:
         """
@@ -183,7 +254,7 @@ class Cell:
         return f"Cell('{self.full_address}', value={self.value}, formula={self.formula})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Sheet:
     """
     Represents an Excel worksheet.
@@ -197,6 +268,10 @@ class Sheet:
     col_count: int = 0
     formula_count: int = 0
 
+    def __post_init__(self) -> None:
+        """Intern the sheet name (shared with cells, ranges and graph nodes)."""
+        self.name = sys.intern(self.name)
+
     def __str__(self) -> str:
         """String representation."""
         return f"Sheet('{self.name}', {self.row_count}x{self.col_count}, {self.formula_count} formulas)"
@@ -211,7 +286,7 @@ class Sheet:
         return self.__str__()
 
 
-@dataclass
+@dataclass(slots=True)
 class Workbook:
     """
     Represents an Excel workbook.
@@ -224,6 +299,25 @@ class Workbook:
     sheets: List[Sheet] = field(default_factory=list)
     active_sheet: Optional[SheetName] = None
     last_modified: Optional[datetime] = None
+    # Name -> sheet, kept in sync by add_sheet()
+    _index: Dict[SheetName, Sheet] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Index sheets by name (first sheet wins on duplicate names)."""
+        for sheet in self.sheets:
+            self._index.setdefault(sheet.name, sheet)
+
+    def add_sheet(self, sheet: Sheet) -> None:
+        """
+        Add a sheet to the workbook.
+
+        Args:
+            sheet: Sheet to add
+        """
+        self.sheets.append(sheet)
+        self._index.setdefault(sheet.name, sheet)
 
     def get_sheet(self, sheet_name: SheetName) -> Optional[Sheet]:
         """
@@ -235,10 +329,7 @@ class Workbook:
         Returns:
             Sheet object or None if not found
         """
-        for sheet in self.sheets:
-            if sheet.name == sheet_name:
-                return sheet
-        return None
+        return self._index.get(sheet_name)
 
     def has_sheet(self, sheet_name: SheetName) -> bool:
         """
@@ -250,14 +341,19 @@ class Workbook:
         Returns:
             True if sheet exists
         """
-        return any(sheet.name == sheet_name for sheet in self.sheets)
+        return sheet_name in self._index
 
     def get_sheet_names(self) -> List[SheetName]:
         """Get list of all sheet names."""
-        return [sheet.name for sheet in self.sheets]
+        return list(self._index)
 
     def total_formula_count(self) -> int:
-        """Get total number of formulas across all sheets."""
+        """
+        Get total number of formulas across all sheets.
+
+        Summed on each call (one add per sheet): Sheet.formula_count is
+        mutable, so a cached total could go stale.
+        """
         return sum(sheet.formula_count for sheet in self.sheets)
 
     def __str__(self) -> str:
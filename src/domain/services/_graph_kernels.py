@@ -0,0 +1,188 @@
+"""Traversal kernels over CSR dependency graph arrays.
+
+Uses a Numba-compiled kernel when numba is installed, otherwise a pure
+Python implementation with identical output.
+"""
+
+from array import array
+from typing import Sequence, Tuple
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _trace_python(
+    root: int,
+    adjacency: Sequence[Tuple[Sequence[int], Sequence[int]]],
+    max_depth: int,
+    n_nodes: int,
+) -> Tuple[array, array, array, array]:
+    """Pure Python version of the trace kernel."""
+    n_dirs = len(adjacency)
+    # One root slot per direction; a slot's direction picks its adjacency
+    out_nodes = array("i", [root] * n_dirs)
+    out_depths = array("i", [0] * n_dirs)
+    out_parents = array("i", [-1] * n_dirs)
+    out_dirs = array("b", range(n_dirs))
+    out_cycles = array("i")
+    # One flag bit per direction per node id: an index instead of a set
+    visited = bytearray(n_nodes)
+    # Nodes on the current DFS path (expanded, subtree not finished)
+    in_path = bytearray(n_nodes)
+
+    # Reversed so the first direction is walked first
+    stack = list(range(n_dirs - 1, -1, -1))
+    while stack:
+        k = stack.pop()
+        if k < 0:
+            # Exit marker: the subtree of slot ~k is done
+            in_path[out_nodes[~k]] ^= 1 << out_dirs[~k]
+            continue
+
+        u = out_nodes[k]
+        d = out_depths[k]
+        dr = out_dirs[k]
+        bit = 1 << dr
+        if d >= max_depth or visited[u] & bit:
+            continue
+        visited[u] |= bit
+        in_path[u] |= bit
+        stack.append(~k)
+
+        indptr, indices = adjacency[dr]
+        start = len(out_nodes)
+        neighbours = indices[indptr[u]:indptr[u + 1]]
+        out_nodes.extend(neighbours)
+        out_depths.extend([d + 1] * len(neighbours))
+        out_parents.extend([k] * len(neighbours))
+        out_dirs.extend([dr] * len(neighbours))
+        for j, v in enumerate(neighbours, start):
+            if in_path[v] & bit:
+                out_cycles.append(j)
+
+        # Reversed so the first child is expanded first
+        stack.extend(range(len(out_nodes) - 1, start - 1, -1))
+
+    return out_nodes, out_depths, out_parents, out_cycles
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, boundscheck=False)
+    def _trace_jit(
+        root, indptr_a, indices_a, indptr_b, indices_b, n_dirs, max_depth, n_nodes
+    ):  # pragma: no cover
+        # Every node is expanded at most once per direction, so output fits
+        # in nnz + 1 slots per direction walked
+        size = indices_a.shape[0] + 1
+        if n_dirs == 2:
+            size += indices_b.shape[0] + 1
+        out_nodes = np.empty(size, dtype=np.int32)
+        out_depths = np.empty(size, dtype=np.int32)
+        out_parents = np.empty(size, dtype=np.int32)
+        out_dirs = np.empty(size, dtype=np.uint8)
+        out_cycles = np.empty(size, dtype=np.int32)
+        # Room for every slot plus one exit marker per expanded node
+        stack = np.empty(2 * size, dtype=np.int32)
+        visited = np.zeros(n_nodes, dtype=np.uint8)
+        in_path = np.zeros(n_nodes, dtype=np.uint8)
+
+        top = 0
+        for dr in range(n_dirs):
+            out_nodes[dr] = root
+            out_depths[dr] = 0
+            out_parents[dr] = -1
+            out_dirs[dr] = dr
+            stack[top] = n_dirs - 1 - dr
+            top += 1
+        n = n_dirs
+        n_cycles = 0
+
+        while top > 0:
+            top -= 1
+            k = stack[top]
+            if k < 0:
+                in_path[out_nodes[~k]] ^= np.uint8(1 << out_dirs[~k])
+                continue
+
+            u = out_nodes[k]
+            d = out_depths[k]
+            dr = out_dirs[k]
+            bit = np.uint8(1 << dr)
+            if d >= max_depth or visited[u] & bit:
+                continue
+            visited[u] |= bit
+            in_path[u] |= bit
+            stack[top] = ~k
+            top += 1
+
+            if dr == 0:
+                indptr = indptr_a
+                indices = indices_a
+            else:
+                indptr = indptr_b
+                indices = indices_b
+
+            start = n
+            for e in range(indptr[u], indptr[u + 1]):
+                v = indices[e]
+                if in_path[v] & bit:
+                    out_cycles[n_cycles] = n
+                    n_cycles += 1
+                out_nodes[n] = v
+                out_depths[n] = d + 1
+                out_parents[n] = k
+                out_dirs[n] = dr
+                n += 1
+
+            for j in range(n - 1, start - 1, -1):
+                stack[top] = j
+                top += 1
+
+        return out_nodes[:n], out_depths[:n], out_parents[:n], out_cycles[:n_cycles]
+
+
+def trace(
+    root: int,
+    adjacency: Sequence[Tuple[array, array]],
+    max_depth: int,
+) -> Tuple[Sequence[int], Sequence[int], Sequence[int], Sequence[int]]:
+    """
+    Depth-first trace from a node over one or two sets of CSR arrays.
+
+    All directions are walked in a single pass, in adjacency order, each
+    with its own visited flags. Every neighbour of an expanded node is
+    emitted, but each node is expanded at most once per direction and
+    never at or beyond max_depth. Output is three parallel sequences (node
+    id, depth, parent slot) where slots 0..len(adjacency)-1 are the root,
+    once per direction (parent -1), and a parent's children occupy
+    consecutive slots in edge order, plus the slots whose node is already
+    on the current DFS path - each one closes a dependency cycle.
+
+    Args:
+        root: Node id to start from
+        adjacency: (indptr, indices) CSR pairs, one per direction (1 or 2)
+        max_depth: Maximum depth to trace
+
+    Returns:
+        Tuple of (node ids, depths, parent slots, cycle-closing slots)
+    """
+    n_nodes = len(adjacency[0][0]) - 1
+    if NUMBA_AVAILABLE:
+        indptr_a, indices_a = adjacency[0]
+        indptr_b, indices_b = adjacency[-1]
+        return _trace_jit(
+            root,
+            np.frombuffer(indptr_a, dtype=np.int32),
+            np.frombuffer(indices_a, dtype=np.int32),
+            np.frombuffer(indptr_b, dtype=np.int32),
+            np.frombuffer(indices_b, dtype=np.int32),
+            len(adjacency),
+            max_depth,
+            n_nodes,
+        )
+    return _trace_python(root, adjacency, max_depth, n_nodes)
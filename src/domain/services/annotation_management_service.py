@@ -1,16 +1,110 @@
 """Annotation management service."""
 
-from typing import List, Optional
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from rtree import index as rtree_index
+except ImportError:
+    rtree_index = None  # Fall back to linear scan per sheet
 
 from src.domain.models.annotation import Annotation
 from src.domain.models.selection import Range
-from src.infrastructure.config.config_loader import Config
+from src.infrastructure.config.config_schema import Config
 from src.infrastructure.storage.annotation_storage import AnnotationStorage
 from src.shared.logging import get_logger
 from src.shared.types import SheetName
 
 logger = get_logger(__name__)
 
+# Grid bucket size (rows, columns) for the fallback spatial index
+_BUCKET_ROWS = 64
+_BUCKET_COLS = 16
+# Ranges covering more buckets than this are scanned instead of bucketed
+_MAX_BUCKETS = 64
+
+
+class _SheetIndex:
+    """
+    Spatial index over one sheet's annotations.
+
+    Uses an R-tree when rtree is installed, otherwise a coarse grid of
+    row/column buckets (very large ranges are kept in a list that every
+    query scans). Results keep storage order either way.
+    """
+
+    def __init__(self, annotations: List[Annotation]):
+        """
+        Build index.
+
+        Args:
+            annotations: Annotations on a single sheet
+        """
+        self.annotations: List[Annotation] = []
+        self._rtree = rtree_index.Index() if rtree_index is not None else None
+        self._buckets: Dict[Tuple[int, int], List[int]] = {}
+        self._wide: List[int] = []
+        for annotation in annotations:
+            self.add(annotation)
+
+    def add(self, annotation: Annotation) -> None:
+        """Add an annotation to the index."""
+        i = len(self.annotations)
+        self.annotations.append(annotation)
+
+        if self._rtree is not None:
+            self._rtree.insert(i, self._bbox(annotation.range))
+            return
+
+        keys = self._bucket_keys(annotation.range)
+        if keys is None:
+            self._wide.append(i)
+        else:
+            for key in keys:
+                self._buckets.setdefault(key, []).append(i)
+
+    def query(self, range_obj: Range) -> List[Annotation]:
+        """
+        Get annotations overlapping a range.
+
+        Args:
+            range_obj: Range to check
+
+        Returns:
+            Overlapping annotations
+        """
+        if self._rtree is not None:
+            hits = sorted(self._rtree.intersection(self._bbox(range_obj)))
+            return [self.annotations[i] for i in hits]
+
+        keys = self._bucket_keys(range_obj)
+        if keys is None:
+            return [ann for ann in self.annotations if ann.matches_range(range_obj)]
+
+        candidates = set(self._wide)
+        for key in keys:
+            candidates.update(self._buckets.get(key, ()))
+
+        annotations = self.annotations
+        return [
+            annotations[i] for i in sorted(candidates)
+            if annotations[i].matches_range(range_obj)
+        ]
+
+    @staticmethod
+    def _bucket_keys(range_obj: Range) -> Optional[List[Tuple[int, int]]]:
+        """Grid buckets covered by a range, or None if it covers too many."""
+        rows = range(range_obj.start_row // _BUCKET_ROWS, range_obj.end_row // _BUCKET_ROWS + 1)
+        cols = range(range_obj.start_col // _BUCKET_COLS, range_obj.end_col // _BUCKET_COLS + 1)
+        if len(rows) * len(cols) > _MAX_BUCKETS:
+            return None
+        return [(row, col) for row in rows for col in cols]
+
+    @staticmethod
+    def _bbox(range_obj: Range) -> tuple:
+        """Bounding box as (min_col, min_row, max_col, max_row)."""
+        return (range_obj.start_col, range_obj.start_row, range_obj.end_col, range_obj.end_row)
+
 
 class AnnotationManagementService:
     """
@@ -29,6 +123,13 @@ class AnnotationManagementService:
         self.config = config
         self.storage = AnnotationStorage(config.annotations.file_location)
         self._current_workbook_path: Optional[str] = None
+        self._wb_ok = False  # Set once set_workbook() has been called
+        # Sheet -> index, loaded lazily from storage for the current workbook
+        self._by_sheet: Optional[Dict[Optional[SheetName], _SheetIndex]] = None
+        # All annotations in storage order, kept alongside _by_sheet
+        self._all_annotations: List[Annotation] = []
+        # Storage file mtime the index was loaded at (detects outside edits)
+        self._index_version: Optional[int] = None
 
     def set_workbook(self, workbook_path: str) -> None:
         """
@@ -38,6 +139,8 @@ class AnnotationManagementService:
             workbook_path: Path to Excel workbook
         """
         self._current_workbook_path = workbook_path
+        self._wb_ok = workbook_path is not None
+        self._by_sheet = None
         logger.debug(f"Set current workbook for annotations: {workbook_path}")
 
     def add_annotation(
@@ -68,12 +171,53 @@ class AnnotationManagementService:
             description=description,
         )
 
+        # Only update the index in place if it matches the file being updated
+        index_current = (
+            self._by_sheet is not None and self._storage_version() == self._index_version
+        )
         self.storage.add(annotation, self._current_workbook_path)
+        self._update_index([annotation], index_current)
 
         logger.info(f"Added annotation: '{label}' for {range_address}")
 
         return annotation
 
+    def add_annotations(
+        self,
+        items: Iterable[Tuple[str, str, Optional[str]]],
+    ) -> List[Annotation]:
+        """
+        Add several annotations at once.
+
+        The annotation file is read and written once for the whole batch,
+        rather than once per annotation as with add_annotation().
+
+        Args:
+            items: (range_address, label, description) tuples
+
+        Returns:
+            Created annotations
+
+        Raises:
+            AnnotationError: If operation fails
+        """
+        self._ensure_workbook_set()
+
+        annotations = [
+            Annotation.from_address(address=range_address, label=label, description=description)
+            for range_address, label, description in items
+        ]
+
+        index_current = (
+            self._by_sheet is not None and self._storage_version() == self._index_version
+        )
+        self.storage.add_many(annotations, self._current_workbook_path)
+        self._update_index(annotations, index_current)
+
+        logger.info(f"Added {len(annotations)} annotations")
+
+        return annotations
+
     def get_annotations(
         self,
         sheet: Optional[SheetName] = None,
@@ -90,10 +234,12 @@ class AnnotationManagementService:
         self._ensure_workbook_set()
 
         if sheet:
-            annotations = self.storage.get_for_sheet(sheet, self._current_workbook_path)
+            sheet_index = self._get_index().get(sheet)
+            annotations = list(sheet_index.annotations) if sheet_index else []
             logger.debug(f"Retrieved {len(annotations)} annotations for sheet '{sheet}'")
         else:
-            annotations = self.storage.load(self._current_workbook_path)
+            self._get_index()
+            annotations = list(self._all_annotations)
             logger.debug(f"Retrieved {len(annotations)} annotations")
 
         return annotations
@@ -126,10 +272,12 @@ class AnnotationManagementService:
         Returns:
             True if annotation was removed
         """
-        self._ensure_workbook_path()
+        self._ensure_workbook_set()
 
         range_obj = Range.from_address(range_address)
         removed = self.storage.remove(range_obj, self._current_workbook_path)
+        if removed:
+            self._by_sheet = None
 
         if removed:
             logger.info(f"Removed annotation for {range_address}")
@@ -155,18 +303,14 @@ class AnnotationManagementService:
         """
         self._ensure_workbook_set()
 
-        # Get all annotations for the sheet
-        all_annotations = self.storage.get_for_sheet(
-            range_obj.sheet,
-            self._current_workbook_path,
-        )
+        sheet_index = self._get_index().get(range_obj.sheet)
+        if sheet_index is None:
+            return []
 
-        # Filter by range
-        matching = [
-            ann
-            for ann in all_annotations
-            if ann.matches_range(range_obj, strict=exact_match)
-        ]
+        # Overlap candidates from the index, then exact filter if requested
+        matching = sheet_index.query(range_obj)
+        if exact_match:
+            matching = [ann for ann in matching if ann.matches_range(range_obj, strict=True)]
 
         return matching
 
@@ -175,6 +319,7 @@ class AnnotationManagementService:
         self._ensure_workbook_set()
 
         self.storage.clear(self._current_workbook_path)
+        self._by_sheet = None
         logger.info("Cleared all annotations")
 
     def has_annotations(self) -> bool:
@@ -188,7 +333,57 @@ class AnnotationManagementService:
 
         return self.storage.exists(self._current_workbook_path)
 
+    def _get_index(self) -> Dict[Optional[SheetName], _SheetIndex]:
+        """
+        Get per-sheet annotation indexes, loading from storage on first use.
+
+        Also (re)loads _all_annotations, so every read is served from memory
+        until the annotation file changes.
+
+        Returns:
+            Mapping of sheet name to index
+        """
+        version = self._storage_version()
+        if self._by_sheet is None or version != self._index_version:
+            annotations = self.storage.load(self._current_workbook_path)
+            grouped: Dict[Optional[SheetName], List[Annotation]] = {}
+            for ann in annotations:
+                grouped.setdefault(ann.sheet, []).append(ann)
+            self._by_sheet = {sheet: _SheetIndex(anns) for sheet, anns in grouped.items()}
+            self._all_annotations = annotations
+            self._index_version = version
+
+        return self._by_sheet
+
+    def _update_index(self, added: List[Annotation], index_current: bool) -> None:
+        """
+        Add newly stored annotations to the index, or drop it if it was stale.
+
+        Args:
+            added: Annotations just written to storage
+            index_current: Whether the index matched storage before the write
+        """
+        if not index_current:
+            self._by_sheet = None
+            return
+
+        self._all_annotations.extend(added)
+        for annotation in added:
+            sheet_index = self._by_sheet.get(annotation.sheet)
+            if sheet_index is None:
+                self._by_sheet[annotation.sheet] = _SheetIndex([annotation])
+            else:
+                sheet_index.add(annotation)
+        self._index_version = self._storage_version()
+
+    def _storage_version(self) -> Optional[int]:
+        """Get the annotation file's mtime (None if it doesn't exist)."""
+        try:
+            return os.stat(self.storage.get_storage_path(self._current_workbook_path)).st_mtime_ns
+        except OSError:
+            return None
+
     def _ensure_workbook_set(self) -> None:
         """Ensure workbook path is set."""
-        if self._current_workbook_path is None:
+        if not self._wb_ok:
             raise ValueError("Workbook path not set. Call set_workbook() first.")
@@ -1,6 +1,12 @@
 """Dependency analysis service for building and analyzing dependency graphs."""
 
-from typing import List, Optional, Set
+import hashlib
+from array import array
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import groupby
+from sys import intern
+from typing import Deque, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 from src.domain.models.dependency import (
     DependencyGraph,
@@ -9,16 +15,58 @@ from src.domain.models.dependency import (
     DependencyTreeNode,
 )
 from src.domain.models.selection import Range
-from src.domain.models.workbook import Cell, Workbook
+from src.domain.models.workbook import Formula, Workbook
+from src.domain.services import _graph_kernels
 from src.domain.services.workbook_data_service import WorkbookDataService
-from src.infrastructure.config.config_loader import Config
+from src.infrastructure.config.config_schema import Config
 from src.infrastructure.storage.graph_cache import GraphCache
 from src.shared.exceptions import DependencyGraphError
 from src.shared.logging import get_logger
-from src.shared.types import CellAddress, DependencyMode, TraceDirection
+from src.shared.types import CellAddress, DependencyMode, SheetName, TraceDirection
 
 logger = get_logger(__name__)
 
+# (sheet name, cell addresses, formula texts) read from one batch of a sheet
+_FormulaBatch = Tuple[SheetName, List[CellAddress], List[str]]
+
+
+class _FormulaHasher:
+    """
+    Incremental digest of a workbook's formulas, fed batch by batch.
+
+    Covers sheet names, addresses and formula texts in read order, so it
+    changes whenever the graph could, but not on value or format edits.
+    Batch boundaries don't affect the digest.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty digest."""
+        self._hash = hashlib.blake2b(digest_size=16)
+        self._sheet: Optional[SheetName] = None
+
+    def feed(self, batches: Iterable[_FormulaBatch]) -> Iterator[_FormulaBatch]:
+        """
+        Pass batches through, adding each to the digest.
+
+        Args:
+            batches: Formula batches
+
+        Yields:
+            The same batches
+        """
+        update = self._hash.update
+        for batch in batches:
+            sheet_name, addresses, formulas = batch
+            if sheet_name != self._sheet:
+                self._sheet = sheet_name
+                update(f"\x01{sheet_name}\x01".encode())
+            update("".join(f"{a}\0{f}\0" for a, f in zip(addresses, formulas)).encode())
+            yield batch
+
+    def hexdigest(self) -> str:
+        """Digest of everything fed so far."""
+        return self._hash.hexdigest()
+
 
 class DependencyAnalysisService:
     """
@@ -66,27 +114,45 @@ class DependencyAnalysisService:
         Raises:
             DependencyGraphError: If graph building fails
         """
+        cache_enabled = self.config.dependencies.cache.enabled
+        hasher = _FormulaHasher()
+        batches: Iterable[_FormulaBatch] = hasher.feed(self._read_workbook_batches(workbook))
+
         # Check cache
-        if use_cache and self.config.dependencies.cache.enabled:
+        if use_cache and cache_enabled:
             cached_graph = self._load_from_cache(workbook.path)
             if cached_graph:
+                cached_graph.freeze()
                 self._current_graph = cached_graph
                 return cached_graph
 
+            # The file changed since caching, but a resave often leaves the
+            # formulas alone. Read and digest them before parsing anything,
+            # so an unchanged workbook costs the Excel reads only.
+            if self._has_cached_digest(workbook.path):
+                try:
+                    batches = list(batches)
+                except Exception as e:
+                    raise DependencyGraphError(f"Failed to build dependency graph: {e}")
+
+                cached_graph = self._load_if_unchanged(workbook.path, hasher.hexdigest())
+                if cached_graph:
+                    cached_graph.freeze()
+                    self._current_graph = cached_graph
+                    return cached_graph
+
         # Build graph
         logger.info(f"Building dependency graph for {workbook.name}...")
 
         try:
-            graph = DependencyGraph(workbook_name=workbook.name)
+            graph = self._build_from_batches(workbook.name, batches)
 
-            # Process each sheet
-            for sheet in workbook.sheets:
-                logger.debug(f"Processing sheet: {sheet.name}")
-                self._process_sheet(sheet.name, graph)
+            # Building is done - compact edge sets
+            graph.freeze()
 
             # Cache graph
-            if self.config.dependencies.cache.enabled:
-                self._save_to_cache(graph, workbook.path)
+            if cache_enabled:
+                self._save_to_cache(graph, workbook.path, hasher.hexdigest())
 
             self._current_graph = graph
             logger.info(
@@ -99,14 +165,69 @@ class DependencyAnalysisService:
         except Exception as e:
             raise DependencyGraphError(f"Failed to build dependency graph: {e}")
 
-    def _process_sheet(self, sheet_name: str, graph: DependencyGraph) -> None:
+    def _build_from_batches(
+        self,
+        workbook_name: str,
+        batches: Iterable[_FormulaBatch],
+    ) -> DependencyGraph:
+        """
+        Build an unfrozen graph from formula batches.
+
+        Batches are consumed on this thread (when read lazily from Excel,
+        COM objects belong to it), while a worker turns each batch into a
+        partial graph. Reads block on Excel with the GIL released, so
+        parsing overlaps them. Partial graphs are merged in read order,
+        which gives the same graph as adding the cells one by one.
+
+        Args:
+            workbook_name: Name recorded on the graph
+            batches: (sheet name, addresses, formula texts) in sheet order
+
+        Returns:
+            Dependency graph (not yet frozen)
+        """
+        graph = DependencyGraph(workbook_name=workbook_name)
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="graph-build") as pool:
+            partials: Deque[Future] = deque()
+            for batch in batches:
+                partials.append(pool.submit(self._build_subgraph, *batch))
+                # Merge finished batches as we go to free them early
+                while partials and partials[0].done():
+                    graph.merge(partials.popleft().result())
+
+            while partials:
+                graph.merge(partials.popleft().result())
+
+        return graph
+
+    def _read_workbook_batches(self, workbook: Workbook) -> Iterator[_FormulaBatch]:
+        """
+        Read the formulas of every sheet from Excel.
+
+        Args:
+            workbook: Workbook to read
+
+        Yields:
+            (sheet name, addresses, formula texts) per batch, in sheet order
         """
-        Process a single sheet and add its dependencies to graph.
+        for sheet in workbook.sheets:
+            logger.debug(f"Processing sheet: {sheet.name}")
+            for addresses, formulas in self._read_sheet_batches(sheet.name):
+                yield sheet.name, addresses, formulas
+
+    def _read_sheet_batches(
+        self, sheet_name: str
+    ) -> Iterator[Tuple[List[CellAddress], List[str]]]:
+        """
+        Read a sheet's formulas from Excel.
         Uses row-based batching to prevent Excel crashes on large sheets.
 
         Args:
-            sheet_name: Name of sheet to process
-            graph: Graph to add nodes to
+            sheet_name: Name of sheet to read
+
+        Yields:
+            (addresses, formula texts) per batch (failed batches are skipped)
         """
         # Get sheet structure to find used range
         workbook_structure = self.workbook_data.get_workbook_structure()
@@ -129,7 +250,7 @@ class DependencyAnalysisService:
         if total_rows <= batch_size:
             # Small sheet - read all at once
             logger.info(f"Sheet {sheet_name}: Reading {total_rows} rows in single batch")
-            self._process_sheet_batch(sheet_name, range_obj, graph)
+            yield from self._read_batch(sheet_name, range_obj)
         else:
             # Large sheet - use batching to prevent Excel crashes
             logger.info(
@@ -157,88 +278,133 @@ class DependencyAnalysisService:
                     f"(rows {batch_start_row}-{batch_end_row})"
                 )
 
-                self._process_sheet_batch(sheet_name, batch_range, graph)
+                yield from self._read_batch(sheet_name, batch_range)
 
-    def _process_sheet_batch(
-        self, sheet_name: str, range_obj: Range, graph: DependencyGraph
-    ) -> None:
+    def _read_batch(
+        self, sheet_name: str, range_obj: Range
+    ) -> Iterator[Tuple[List[CellAddress], List[str]]]:
         """
-        Process a single batch of cells from a sheet.
+        Read the formulas of a single batch from a sheet.
+
+        Only formulas are fetched (as parallel address/formula lists), since
+        values and Cell objects for the mostly non-formula cells of a used
+        range aren't needed to build the graph.
 
         Args:
-            sheet_name: Name of sheet being processed
+            sheet_name: Name of sheet being read
             range_obj: Range to read (may be full sheet or a batch)
-            graph: Graph to add nodes to
+
+        Yields:
+            (addresses, formula texts) of the batch, or nothing if reading failed
         """
-        # Get cells in this batch
+        range_address = range_obj.to_address(include_sheet=False)
         try:
-            cells = self.workbook_data.get_range_data(range_obj)
-            logger.debug(f"Retrieved {len(cells)} cells from {sheet_name}!{range_obj.to_address(include_sheet=False)}")
+            addresses, formulas = self.workbook_data.get_formula_arrays(range_obj)
+            logger.debug(
+                f"Retrieved {len(formulas)} formulas from {sheet_name}!{range_address}"
+            )
         except Exception as e:
-            logger.error(f"Failed to get range data for {sheet_name}!{range_obj.to_address(include_sheet=False)}: {e}")
-            logger.warning(f"Skipping batch due to error reading cell data")
+            logger.error(f"Failed to get range data for {sheet_name}!{range_address}: {e}")
+            logger.warning("Skipping batch due to error reading cell data")
             return
 
-        # Process cells with formulas
-        formula_cells = 0
-        for cell in cells:
-            if cell.has_formula():
-                self._add_cell_to_graph(cell, graph)
-                formula_cells += 1
+        yield addresses, formulas
 
-        logger.info(
-            f"Batch complete: Processed {len(cells)} cells, "
-            f"added {formula_cells} formula cells to graph"
-        )
+    def _build_subgraph(
+        self,
+        sheet_name: str,
+        addresses: List[CellAddress],
+        formulas: List[str],
+    ) -> DependencyGraph:
+        """
+        Build a partial graph from one batch of formulas (runs on a worker thread).
 
-    def _add_cell_to_graph(self, cell: Cell, graph: DependencyGraph) -> None:
+        Args:
+            sheet_name: Sheet the batch was read from
+            addresses: Addresses of the batch's formula cells
+            formulas: Formula texts, aligned with addresses
+
+        Returns:
+            Graph of the batch's formula cells and their references
         """
-        Add a cell and its dependencies to the graph.
+        graph = DependencyGraph()
+        sheet_name = intern(sheet_name)
+
+        for address, formula_text in zip(addresses, formulas):
+            self._add_formula_to_graph(address, sheet_name, Formula.parse(formula_text), graph)
+
+        logger.info(f"Batch complete: added {len(formulas)} formula cells to graph")
+
+        return graph
+
+    def _add_formula_to_graph(
+        self,
+        address: CellAddress,
+        sheet: SheetName,
+        formula: Formula,
+        graph: DependencyGraph,
+    ) -> None:
+        """
+        Add a formula cell and its dependencies to the graph.
 
         Args:
-            cell: Cell to add
+            address: Cell address without sheet
+            sheet: Sheet name
+            formula: Parsed formula
             graph: Graph to add to
         """
-        full_address = cell.full_address
+        # Addresses recur in many nodes' edge sets; keep one string per address
+        full_address = intern(f"{sheet}!{address}")
+        formula_text = str(formula)
 
         # Create or get node for this cell
         node = graph.get_node(full_address)
         if node is None:
             node = DependencyNode(
-                cell_address=cell.address,
-                sheet=cell.sheet,
-                formula=str(cell.formula) if cell.formula else None,
+                cell_address=address,
+                sheet=sheet,
+                formula=formula_text,
             )
             graph.add_node(node)
+        elif node.formula is None:
+            # Node was created earlier as a reference target
+            graph.set_formula(node, formula_text)
 
         # Add dependencies (predecessors)
-        if cell.formula:
-            for ref_address in cell.formula.referenced_cells:
-                # Normalize address (add sheet if missing)
-                if "!" not in ref_address:
-                    ref_address = f"{cell.sheet}!{ref_address}"
-
-                # Add predecessor
-                node.add_predecessor(ref_address)
-
-                # Create node for referenced cell if it doesn't exist
-                ref_node = graph.get_node(ref_address)
-                if ref_node is None:
-                    # Extract sheet and cell address
-                    if "!" in ref_address:
-                        ref_sheet, ref_cell = ref_address.split("!", 1)
-                    else:
-                        ref_sheet = cell.sheet
-                        ref_cell = ref_address
+        get_node = graph.get_node
+        add_node = graph.add_node
+        add_predecessor = node.add_predecessor
+
+        # References are unique per formula already; only qualifying them can
+        # create duplicates ("A1" and "Sheet1!A1" on Sheet1), which needs
+        # both forms - so a qualified reference must be present
+        references = formula.referenced_cells
+        if formula.has_cross_sheet_references():
+            references = dict.fromkeys(
+                ref if "!" in ref else intern(f"{sheet}!{ref}") for ref in references
+            )
 
-                    ref_node = DependencyNode(
-                        cell_address=ref_cell,
-                        sheet=ref_sheet,
-                    )
-                    graph.add_node(ref_node)
+        for ref_address in references:
+            # Split sheet and cell in one pass; add sheet if missing
+            ref_sheet, sep, ref_cell = ref_address.rpartition("!")
+            if not sep:
+                ref_sheet = sheet
+                ref_address = intern(f"{ref_sheet}!{ref_cell}")
+
+            # Add predecessor
+            add_predecessor(ref_address)
+
+            # Create node for referenced cell if it doesn't exist
+            ref_node = get_node(ref_address)
+            if ref_node is None:
+                ref_node = DependencyNode(
+                    cell_address=ref_cell,
+                    sheet=ref_sheet,
+                )
+                add_node(ref_node)
 
-                # Add this cell as successor to referenced cell
-                ref_node.add_successor(full_address)
+            # Add this cell as successor to referenced cell
+            ref_node.add_successor(full_address)
 
     def trace_dependencies(
         self,
@@ -282,6 +448,11 @@ class DependencyAnalysisService:
             if node is None:
                 raise DependencyGraphError(f"Cell not found in graph: {cell_address}")
 
+            # Traversal runs over the CSR arrays built when build_graph()
+            # froze the graph
+            graph = self._current_graph
+            root_id = graph.id_of[f"{node.sheet}!{node.cell_address}"]
+
             # Build tree
             root = DependencyTreeNode(
                 cell_address=node.cell_address,
@@ -290,17 +461,16 @@ class DependencyAnalysisService:
                 depth=0,
             )
 
-            # Trace based on direction
-            visited: Set[str] = set()
-
+            # Trace based on direction (one pass; each direction has its own
+            # visited flags)
+            adjacency = []
             if direction in (TraceDirection.UPSTREAM, TraceDirection.BOTH):
-                self._trace_upstream(root, depth, visited)
+                adjacency.append((graph.pred_indptr, graph.pred_indices))
 
             if direction in (TraceDirection.DOWNSTREAM, TraceDirection.BOTH):
-                # Reset visited for downstream trace
-                if direction == TraceDirection.BOTH:
-                    visited = set()
-                self._trace_downstream(root, depth, visited)
+                adjacency.append((graph.succ_indptr, graph.succ_indices))
+
+            self._trace_graph(root, root_id, adjacency, depth)
 
             tree = DependencyTree(
                 root=root,
@@ -312,6 +482,36 @@ class DependencyAnalysisService:
 
             return tree
 
+    def depends_on(self, cell_address: CellAddress, other_address: CellAddress) -> bool:
+        """
+        Check if a cell depends, directly or indirectly, on another cell.
+
+        Uses the graph's memoized transitive closures, so repeated checks
+        against the same cell are a set lookup.
+
+        Args:
+            cell_address: Dependent cell
+            other_address: Possible precedent cell
+
+        Returns:
+            True if other_address is upstream of cell_address
+
+        Raises:
+            DependencyGraphError: If no graph has been built
+        """
+        graph = self._current_graph
+        if graph is None:
+            raise DependencyGraphError("No dependency graph available. Build graph first.")
+
+        node = graph.get_node(cell_address)
+        other = graph.get_node(other_address, node.sheet if node else None)
+        if node is None or other is None:
+            return False
+
+        return graph.depends_on(
+            f"{node.sheet}!{node.cell_address}", f"{other.sheet}!{other.cell_address}"
+        )
+
     # =========================================================================
     # ON-DEMAND MODE - Read cells as needed without building full graph
     # =========================================================================
@@ -361,15 +561,10 @@ class DependencyAnalysisService:
         )
 
         # Trace based on direction
-        visited: Set[str] = set()
-
         if direction in (TraceDirection.UPSTREAM, TraceDirection.BOTH):
-            self._trace_upstream_on_demand(root, depth, visited)
+            self._trace_upstream_on_demand(root, depth, set())
 
         if direction in (TraceDirection.DOWNSTREAM, TraceDirection.BOTH):
-            # Reset visited for downstream trace
-            if direction == TraceDirection.BOTH:
-                visited = set()
             # Note: Downstream tracing requires graph or formula parsing
             # For now, we'll skip downstream in on-demand mode
             logger.warning("Downstream tracing not yet supported in on-demand mode")
@@ -386,36 +581,49 @@ class DependencyAnalysisService:
 
     def _trace_upstream_on_demand(
         self,
-        node: DependencyTreeNode,
+        root: DependencyTreeNode,
         max_depth: int,
         visited: Set[str],
     ) -> None:
         """
-        Recursively trace upstream dependencies on-demand.
+        Trace upstream dependencies on-demand.
+
+        Depth-first with an explicit stack, so long formula chains can't hit
+        the recursion limit. Children are expanded in reference order, giving
+        the same tree as a recursive walk.
 
         Args:
-            node: Current node
+            root: Node to trace from
             max_depth: Maximum depth to trace
             visited: Set of visited cells (to prevent cycles)
         """
-        if node.depth >= max_depth:
-            return
+        get_cell = self.workbook_data.get_cell
 
-        full_address = node.full_address
-        if full_address in visited:
-            return
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if node.depth >= max_depth:
+                continue
 
-        visited.add(full_address)
+            full_address = node.full_address
+            if full_address in visited:
+                continue
 
-        # Read the cell if we haven't already
-        try:
-            cell = self.workbook_data.get_cell(node.cell_address, node.sheet)
-        except Exception as e:
-            logger.warning(f"Failed to read cell {full_address}: {e}")
-            return
+            visited.add(full_address)
+
+            # Read the cell if we haven't already
+            try:
+                cell = get_cell(node.cell_address, node.sheet)
+            except Exception as e:
+                logger.warning(f"Failed to read cell {full_address}: {e}")
+                continue
 
-        # If cell has formula, trace its dependencies
-        if cell.formula:
+            # If cell has formula, trace its dependencies
+            if not cell.formula:
+                continue
+
+            child_depth = node.depth + 1
+            first_child = len(node.children)
             for ref_address in cell.formula.referenced_cells:
                 # Normalize address (add sheet if missing)
                 if "!" not in ref_address:
@@ -426,115 +634,84 @@ class DependencyAnalysisService:
 
                 # Read the referenced cell
                 try:
-                    ref_cell_obj = self.workbook_data.get_cell(ref_cell, ref_sheet)
+                    ref_cell_obj = get_cell(ref_cell, ref_sheet)
                 except Exception as e:
                     logger.warning(f"Failed to read referenced cell {ref_address}: {e}")
                     continue
 
                 # Create child node
-                child = DependencyTreeNode(
+                node.add_child(DependencyTreeNode(
                     cell_address=ref_cell_obj.address,
                     sheet=ref_cell_obj.sheet,
                     formula=str(ref_cell_obj.formula) if ref_cell_obj.formula else None,
-                    depth=node.depth + 1,
-                )
+                    depth=child_depth,
+                ))
 
-                node.add_child(child)
+            # Reversed so the first reference is expanded first
+            stack.extend(reversed(node.children[first_child:]))
 
-                # Recurse
-                self._trace_upstream_on_demand(child, max_depth, visited)
-
-    def _trace_upstream(
+    def _trace_graph(
         self,
-        node: DependencyTreeNode,
+        root: DependencyTreeNode,
+        root_id: int,
+        adjacency: Sequence[Tuple[array, array]],
         max_depth: int,
-        visited: Set[str],
     ) -> None:
         """
-        Recursively trace upstream dependencies.
-
-        Args:
-            node: Current node
-            max_depth: Maximum depth to trace
-            visited: Set of visited cells (to prevent cycles)
-        """
-        if node.depth >= max_depth:
-            return
+        Trace dependencies over CSR adjacency arrays of the current graph.
 
-        full_address = node.full_address
-        if full_address in visited:
-            return
-
-        visited.add(full_address)
-
-        # Get graph node
-        graph_node = self._current_graph.get_node(full_address)
-        if graph_node is None:
-            return
-
-        # Add predecessors as children
-        for pred_address in graph_node.predecessors:
-            pred_graph_node = self._current_graph.get_node(pred_address)
-            if pred_graph_node is None:
-                continue
-
-            child = DependencyTreeNode(
-                cell_address=pred_graph_node.cell_address,
-                sheet=pred_graph_node.sheet,
-                formula=pred_graph_node.formula,
-                depth=node.depth + 1,
-            )
-
-            node.add_child(child)
-
-            # Recurse
-            self._trace_upstream(child, max_depth, visited)
-
-    def _trace_downstream(
-        self,
-        node: DependencyTreeNode,
-        max_depth: int,
-        visited: Set[str],
-    ) -> None:
-        """
-        Recursively trace downstream dependencies.
+        Depth-first, in the same order as a recursive walk: every neighbour
+        becomes a child, but each cell is expanded at most once per
+        direction. All directions are walked in one kernel call (Numba-
+        compiled when available), and its node ids index the graph's node
+        list directly, so no address is looked up per visited cell.
+        Circular references met on the way are logged.
 
         Args:
-            node: Current node
+            root: Tree node to attach children to
+            root_id: Graph node id of root
+            adjacency: (indptr, indices) pairs to trace, in order - e.g.
+                       (pred_indptr, pred_indices) for upstream
             max_depth: Maximum depth to trace
-            visited: Set of visited cells (to prevent cycles)
         """
-        if node.depth >= max_depth:
-            return
-
-        full_address = node.full_address
-        if full_address in visited:
+        if not adjacency:
             return
 
-        visited.add(full_address)
-
-        # Get graph node
-        graph_node = self._current_graph.get_node(full_address)
-        if graph_node is None:
-            return
+        graph = self._current_graph
+        node_of = graph.node_of
 
-        # Add successors as children
-        for succ_address in graph_node.successors:
-            succ_graph_node = self._current_graph.get_node(succ_address)
-            if succ_graph_node is None:
-                continue
-
-            child = DependencyTreeNode(
-                cell_address=succ_graph_node.cell_address,
-                sheet=succ_graph_node.sheet,
-                formula=succ_graph_node.formula,
-                depth=node.depth + 1,
+        ids, depths, parents, cycles = _graph_kernels.trace(root_id, adjacency, max_depth)
+        if len(cycles):
+            # Cyclic children are shown but never expanded again
+            logger.warning(
+                f"Circular reference through {graph.addr_of[ids[cycles[0]]]} "
+                f"({len(cycles)} cycle edge(s) in trace)"
             )
 
-            node.add_child(child)
-
-            # Recurse
-            self._trace_downstream(child, max_depth, visited)
+        # Slots 0..n_roots-1 are the root (once per direction); parents
+        # always precede their children
+        n_roots = len(adjacency)
+        base_depth = root.depth
+        tree_nodes = [root] * n_roots
+        for i in range(n_roots, len(ids)):
+            graph_node = node_of[ids[i]]
+            tree_nodes.append(DependencyTreeNode(
+                cell_address=graph_node.cell_address,
+                sheet=graph_node.sheet,
+                formula=graph_node.formula,
+                depth=base_depth + int(depths[i]),
+            ))
+
+        # Each parent's children occupy one run of consecutive slots, so
+        # its child list is a single exactly-sized slice of tree_nodes
+        for parent, run in groupby(range(n_roots, len(ids)), parents.__getitem__):
+            first = next(run)
+            last = first + sum(1 for _ in run)
+            if parent < n_roots:
+                # Root collects children from every direction
+                root.children.extend(tree_nodes[first:last + 1])
+            else:
+                tree_nodes[parent].children = tree_nodes[first:last + 1]
 
     # =========================================================================
     # SHARED UTILITIES - Used by both modes
@@ -564,16 +741,52 @@ class DependencyAnalysisService:
 
         return graph
 
-    def _save_to_cache(self, graph: DependencyGraph, workbook_path: str) -> None:
+    def _has_cached_digest(self, workbook_path: str) -> bool:
+        """Check if the cached graph (if any) recorded a formula digest."""
+        metadata = self.cache.get_metadata(workbook_path)
+        return bool(metadata and metadata.get("workbook_hash"))
+
+    def _load_if_unchanged(self, workbook_path: str, digest: str) -> Optional[DependencyGraph]:
+        """
+        Load the cached graph if the workbook's formulas still match it.
+
+        On a match the cache is marked fresh, so later loads pass the
+        cheap modification time check again.
+
+        Args:
+            workbook_path: Path to workbook
+            digest: Digest of the workbook's current formulas
+
+        Returns:
+            Cached graph or None
+        """
+        if self.cache.is_stale(workbook_path, digest):
+            logger.debug("Formulas changed since caching, will rebuild")
+            return None
+
+        graph = self.cache.load(workbook_path)
+        if graph:
+            logger.info("Workbook formulas unchanged, loaded dependency graph from cache")
+            self.cache.mark_fresh(workbook_path)
+
+        return graph
+
+    def _save_to_cache(
+        self,
+        graph: DependencyGraph,
+        workbook_path: str,
+        workbook_hash: Optional[str] = None,
+    ) -> None:
         """
         Save graph to cache.
 
         Args:
             graph: Graph to save
             workbook_path: Path to workbook
+            workbook_hash: Digest of the formulas the graph was built from
         """
         try:
-            self.cache.save(graph, workbook_path)
+            self.cache.save(graph, workbook_path, workbook_hash)
         except Exception as e:
             logger.warning(f"Failed to cache dependency graph: {e}")
 
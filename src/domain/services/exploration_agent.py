@@ -1,17 +1,20 @@
 """Exploration agent for intelligently analyzing Excel workbooks."""
 
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 from src.domain.models.annotation import Annotation
-from src.domain.models.query import AssistantResponse, QuestionContext
+from src.domain.models.dependency import DependencyTree
+from src.domain.models.query import AssistantResponse, LLMResponse, QuestionContext
 from src.domain.models.selection import Range, Selection
 from src.domain.services.annotation_management_service import AnnotationManagementService
 from src.domain.services.dependency_analysis_service import DependencyAnalysisService
 from src.domain.services.llm_interaction_service import LLMInteractionService
 from src.domain.services.workbook_data_service import WorkbookDataService
-from src.infrastructure.config.config_loader import Config
+from src.infrastructure.config.config_schema import Config
+from src.shared.exceptions import AgentError
 from src.shared.logging import get_logger
-from src.shared.types import TraceDirection
+from src.shared.types import DependencyMode, TraceDirection
 
 logger = get_logger(__name__)
 
@@ -46,6 +49,7 @@ class ExplorationAgent:
         self.dependency_analysis = dependency_analysis
         self.annotation_management = annotation_management
         self.llm_interaction = llm_interaction
+        self._pending_batches: Dict[str, Dict[str, AssistantResponse]] = {}
 
     def explore_and_answer(self, context: QuestionContext) -> AssistantResponse:
         """
@@ -57,6 +61,97 @@ class ExplorationAgent:
         Returns:
             Assistant response with answer and context
         """
+        response = self._gather_context(context)
+
+        # Step 2: Query LLM with gathered context
+        self._query_llm(context, response)
+
+        logger.info("Exploration complete")
+
+        return response
+
+    async def aexplore_and_answer(self, context: QuestionContext) -> AssistantResponse:
+        """
+        Explore workbook and answer question, awaiting the LLM call.
+
+        Context gathering talks to Excel and stays on the calling thread;
+        only the LLM round-trip is awaited, so many questions can be in
+        flight at once.
+
+        Args:
+            context: Question context with question and optional selection
+
+        Returns:
+            Assistant response with answer and context
+        """
+        response = self._gather_context(context)
+
+        # Step 2: Query LLM with gathered context
+        await self._aquery_llm(context, response)
+
+        logger.info("Exploration complete")
+
+        return response
+
+    def submit_batch(self, contexts: Dict[str, QuestionContext]) -> str:
+        """
+        Gather context for many questions and submit them as one LLM batch.
+
+        Args:
+            contexts: Mapping of custom_id -> question context
+
+        Returns:
+            Batch ID for collect_batch()
+        """
+        responses = {}
+        requests = {}
+        for custom_id, context in contexts.items():
+            response = self._gather_context(context)
+            responses[custom_id] = response
+            requests[custom_id] = self._llm_query_args(context, response)
+
+        batch_id = self.llm_interaction.submit_batch(requests)
+        self._pending_batches[batch_id] = responses
+
+        return batch_id
+
+    def collect_batch(self, batch_id: str) -> Optional[Dict[str, AssistantResponse]]:
+        """
+        Collect answers for a submitted batch.
+
+        Args:
+            batch_id: Batch ID returned by submit_batch()
+
+        Returns:
+            Mapping of custom_id -> response, or None if batch is still running
+        """
+        if batch_id not in self._pending_batches:
+            raise AgentError(f"Unknown batch: {batch_id}")
+
+        results = self.llm_interaction.get_batch_results(batch_id)
+        if results is None:
+            return None
+
+        responses = self._pending_batches.pop(batch_id)
+        for custom_id, response in responses.items():
+            llm_response = results.get(custom_id)
+            if llm_response is None:
+                logger.warning(f"No batch result for {custom_id}")
+                continue
+            self._apply_llm_response(response, llm_response)
+
+        return responses
+
+    def _gather_context(self, context: QuestionContext) -> AssistantResponse:
+        """
+        Gather workbook context for a question.
+
+        Args:
+            context: Question context with question and optional selection
+
+        Returns:
+            Response populated with context but no answer yet
+        """
         logger.info(f"Starting exploration: {context.question}")
 
         response = AssistantResponse(
@@ -77,11 +172,6 @@ class ExplorationAgent:
             response.add_context("active_sheet", active_sheet)
             self._explore_active_sheet(active_sheet, context, response)
 
-        # Step 2: Query LLM with gathered context
-        self._query_llm(context, response)
-
-        logger.info("Exploration complete")
-
         return response
 
     def _explore_from_selection(
@@ -98,45 +188,62 @@ class ExplorationAgent:
             context: Question context
             response: Response to populate
         """
-        # Get snapshot of selection + surrounding context
-        logger.debug("Getting snapshot of selection")
-        expanded_range = self.workbook_data.expand_selection_context(selection)
-
-        snapshot = self.workbook_data.get_snapshot(
-            sheet=selection.sheet_name,
-            range_address=expanded_range.to_address(include_sheet=False),
-        )
-
-        response.add_context("snapshot", snapshot)
-
         # Get formulas in selection
+        formulas: Optional[List[str]] = None
+        trace_address: Optional[str] = None
         if selection.has_formulas:
             logger.debug("Getting formulas from selection")
-            cells = self.workbook_data.get_range_data(selection.range)
-            formulas = [str(cell.formula) for cell in cells if cell.has_formula()]
+            formulas = []
+            for cell in self.workbook_data.iter_range_data(selection.range):
+                if cell.has_formula():
+                    formulas.append(str(cell.formula))
+                    # Trace dependencies from the first formula cell if requested
+                    if trace_address is None and context.include_dependencies:
+                        trace_address = cell.full_address
+
+        if trace_address and self.config.dependencies.mode != DependencyMode.ON_DEMAND:
+            # Full-graph tracing doesn't touch Excel, so a worker runs it
+            # while the snapshot is read here (COM reads stay on this thread)
+            logger.debug("Tracing dependencies")
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent-trace") as pool:
+                trace_future = pool.submit(self._trace, trace_address, context.max_depth)
+                snapshot = self._read_snapshot(selection)
+                response.dependencies_traced = trace_future.result()
+        else:
+            snapshot = self._read_snapshot(selection)
+            # On-demand tracing reads cells from Excel, so it runs here
+            if trace_address:
+                logger.debug("Tracing dependencies")
+                response.dependencies_traced = self._trace(trace_address, context.max_depth)
+
+        response.add_context("snapshot", snapshot)
+
+        if formulas is not None:
             response.add_context("formulas", formulas)
 
-            # Trace dependencies if requested
-            if context.include_dependencies and formulas:
-                logger.debug("Tracing dependencies")
-                # Pick first formula cell to trace from
-                formula_cells = [cell for cell in cells if cell.has_formula()]
-                if formula_cells:
-                    first_cell = formula_cells[0]
-                    dep_tree = self.dependency_analysis.trace_dependencies(
-                        cell_address=first_cell.full_address,
-                        direction=TraceDirection.BOTH,
-                        depth=context.max_depth,
-                    )
-                    response.dependencies_traced = dep_tree
-
-        # Get annotations for sheet
+        # Get annotations for sheet (served from the in-memory index)
         if context.include_annotations:
             logger.debug("Getting annotations")
-            annotations = self.annotation_management.get_annotations(
+            response.annotations_found = self.annotation_management.get_annotations(
                 sheet=selection.sheet_name
             )
-            response.annotations_found = annotations
+
+    def _trace(self, cell_address: str, depth: int) -> DependencyTree:
+        """Trace dependencies both ways from a cell."""
+        return self.dependency_analysis.trace_dependencies(
+            cell_address=cell_address,
+            direction=TraceDirection.BOTH,
+            depth=depth,
+        )
+
+    def _read_snapshot(self, selection: Selection) -> str:
+        """Get snapshot of selection + surrounding context."""
+        logger.debug("Getting snapshot of selection")
+        expanded_range = self.workbook_data.expand_selection_context(selection)
+
+        return self.workbook_data.get_snapshot(
+            selection.sheet_name, expanded_range.to_address(include_sheet=False)
+        )
 
     def _explore_active_sheet(
         self,
@@ -179,23 +286,62 @@ class ExplorationAgent:
         """
         logger.debug("Querying LLM")
 
-        # Build formulas list
-        formulas = response.context_used.get("formulas", [])
+        llm_response = self.llm_interaction.query(
+            **self._llm_query_args(context, response),
+            workbook_revision=self.workbook_data.workbook_revision,
+        )
 
-        # Build spatial context
-        spatial_context = response.context_used.get("snapshot")
+        self._apply_llm_response(response, llm_response)
 
-        # Query LLM
-        llm_response = self.llm_interaction.query(
-            question=context.question,
-            selection=context.selection,
-            formulas=formulas,
-            dependency_tree=response.dependencies_traced,
-            annotations=response.annotations_found,
-            spatial_context=spatial_context,
-            mode=context.mode,
+    async def _aquery_llm(
+        self,
+        context: QuestionContext,
+        response: AssistantResponse,
+    ) -> None:
+        """
+        Query LLM asynchronously with gathered context.
+
+        Args:
+            context: Question context
+            response: Response with gathered context
+        """
+        logger.debug("Querying LLM (async)")
+
+        llm_response = await self.llm_interaction.aquery(
+            **self._llm_query_args(context, response),
+            workbook_revision=self.workbook_data.workbook_revision,
         )
 
+        self._apply_llm_response(response, llm_response)
+
+    @staticmethod
+    def _llm_query_args(
+        context: QuestionContext,
+        response: AssistantResponse,
+    ) -> Dict[str, Any]:
+        """
+        Build LLM query arguments from gathered context.
+
+        Args:
+            context: Question context
+            response: Response with gathered context
+
+        Returns:
+            Keyword arguments for LLMInteractionService.query/aquery
+        """
+        return {
+            "question": context.question,
+            "selection": context.selection,
+            "formulas": response.context_used.get("formulas", []),
+            "dependency_tree": response.dependencies_traced,
+            "annotations": response.annotations_found,
+            "spatial_context": response.context_used.get("snapshot"),
+            "mode": context.mode,
+        }
+
+    @staticmethod
+    def _apply_llm_response(response: AssistantResponse, llm_response: LLMResponse) -> None:
+        """Copy LLM answer and metadata onto the assistant response."""
         response.answer = llm_response.content
         response.metadata["llm_provider"] = llm_response.provider
         response.metadata["llm_model"] = llm_response.model
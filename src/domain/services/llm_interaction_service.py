@@ -1,21 +1,31 @@
 """LLM interaction service."""
 
-from typing import Dict, List, Optional
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from src.domain.models.annotation import Annotation
 from src.domain.models.dependency import DependencyTree
 from src.domain.models.query import LLMContext, LLMResponse
 from src.domain.models.selection import Selection
-from src.infrastructure.config.config_loader import Config
+from src.infrastructure.config.config_schema import Config
 from src.infrastructure.llm.prompt_builder import PromptBuilder
 from src.infrastructure.llm.providers.base_provider import BaseLLMProvider
 from src.infrastructure.llm.providers.manual_provider import ManualLLMProvider
 from src.infrastructure.llm.providers.mock_provider import MockLLMProvider
-from src.shared.exceptions import LLMProviderError
+from src.infrastructure.llm.retry import AsyncRateLimiter, retry_async
+from src.infrastructure.llm.semantic_cache import SemanticCache
+from src.shared.exceptions import LLMProviderError, LLMTransientError
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Appended to a snapshot cut short by _trim_context
+_TRUNCATED_MARKER = "\n... (truncated to fit the context budget)"
+
 
 class LLMInteractionService:
     """
@@ -32,25 +42,42 @@ class LLMInteractionService:
             config: Application configuration
         """
         self.config = config
-        self.providers: Dict[str, BaseLLMProvider] = {}
+        # Providers are registered as factories and created on first use
+        self._provider_factories: Dict[str, Callable[[], BaseLLMProvider]] = {}
+        self._provider_instances: Dict[str, BaseLLMProvider] = {}
+        self._provider_lock = threading.Lock()
+        self._batch_providers: Dict[str, str] = {}  # batch_id -> provider name
+        self._rate_limiter: Optional[AsyncRateLimiter] = None
+        if config.llm.max_qpm > 0:
+            self._rate_limiter = AsyncRateLimiter(config.llm.max_qpm, 60.0)
+        # Exact (scope, question) digest -> response, in LRU order
+        self._memo: "OrderedDict[bytes, LLMResponse]" = OrderedDict()
+        self._memo_size = config.llm.cache_size
+        self.response_cache: Optional[SemanticCache] = None
+        if config.llm.semantic_cache.enabled:
+            self.response_cache = SemanticCache(
+                threshold=config.llm.semantic_cache.similarity_threshold,
+                max_entries=config.llm.semantic_cache.max_entries,
+            )
         self._initialize_providers()
 
     def _initialize_providers(self) -> None:
-        """Initialize configured LLM providers."""
+        """Register configured LLM providers (instantiated by get_provider())."""
         providers_config = self.config.llm.providers
 
         # Manual provider
         if providers_config.manual.enabled:
-            self.providers["manual"] = ManualLLMProvider(
+            self._provider_factories["manual"] = partial(
+                ManualLLMProvider,
                 input_file=providers_config.manual.input_file,
                 output_file=providers_config.manual.output_file,
             )
-            logger.debug("Manual LLM provider initialized")
+            logger.debug("Manual LLM provider registered")
 
         # Mock provider (always available for testing)
         if providers_config.mock.enabled:
-            self.providers["mock"] = MockLLMProvider()
-            logger.debug("Mock LLM provider initialized")
+            self._provider_factories["mock"] = MockLLMProvider
+            logger.debug("Mock LLM provider registered")
 
         # TODO: Add other providers (internal_api, openai, claude) in Phase 2
 
@@ -64,6 +91,7 @@ class LLMInteractionService:
         spatial_context: Optional[str] = None,
         mode: str = "educational",
         provider_name: Optional[str] = None,
+        workbook_revision: Optional[int] = None,
     ) -> LLMResponse:
         """
         Query LLM with context.
@@ -77,6 +105,9 @@ class LLMInteractionService:
             spatial_context: Snapshot or spatial info
             mode: Query mode (educational, technical, concise)
             provider_name: Specific provider to use (None for default)
+            workbook_revision: WorkbookDataService.workbook_revision the
+                context was read at; cached answers from other revisions
+                are not reused
 
         Returns:
             LLM response
@@ -84,6 +115,283 @@ class LLMInteractionService:
         Raises:
             LLMProviderError: If query fails
         """
+        context, system_prompt, provider_name, provider, trimmed = self._prepare_query(
+            question=question,
+            selection=selection,
+            formulas=formulas,
+            dependency_tree=dependency_tree,
+            annotations=annotations,
+            spatial_context=spatial_context,
+            mode=mode,
+            provider_name=provider_name,
+        )
+
+        scope = self._cache_scope(context, system_prompt, provider_name, workbook_revision)
+        memo_key = self._memo_key(scope, question, provider)
+        cached = self._get_cached(scope, question, provider, memo_key)
+        if cached is not None:
+            return cached
+
+        response = provider.query(context, system_prompt)
+
+        logger.info(f"Received response from {provider_name}")
+        if trimmed:
+            response.metadata["context_trimmed_tokens"] = trimmed
+
+        self._put_cached(scope, question, provider, response, memo_key)
+
+        return response
+
+    async def aquery(
+        self,
+        question: str,
+        selection: Optional[Selection] = None,
+        formulas: Optional[List[str]] = None,
+        dependency_tree: Optional[DependencyTree] = None,
+        annotations: Optional[List[Annotation]] = None,
+        spatial_context: Optional[str] = None,
+        mode: str = "educational",
+        provider_name: Optional[str] = None,
+        workbook_revision: Optional[int] = None,
+    ) -> LLMResponse:
+        """
+        Query LLM with context without blocking the event loop.
+
+        Same arguments and behaviour as query(), plus rate limiting
+        (llm.max_qpm) and retries with backoff when the provider raises
+        LLMTransientError.
+
+        Returns:
+            LLM response
+
+        Raises:
+            LLMProviderError: If query fails
+        """
+        context, system_prompt, provider_name, provider, trimmed = self._prepare_query(
+            question=question,
+            selection=selection,
+            formulas=formulas,
+            dependency_tree=dependency_tree,
+            annotations=annotations,
+            spatial_context=spatial_context,
+            mode=mode,
+            provider_name=provider_name,
+        )
+
+        scope = self._cache_scope(context, system_prompt, provider_name, workbook_revision)
+        memo_key = self._memo_key(scope, question, provider)
+        cached = self._get_cached(scope, question, provider, memo_key)
+        if cached is not None:
+            return cached
+
+        async def attempt() -> LLMResponse:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+            return await provider.aquery(context, system_prompt)
+
+        retry = self.config.llm.retry
+        response = await retry_async(
+            attempt,
+            retry_on=(LLMTransientError,),
+            max_attempts=retry.max_attempts,
+            min_wait=retry.min_wait,
+            max_wait=retry.max_wait,
+        )
+
+        logger.info(f"Received response from {provider_name}")
+        if trimmed:
+            response.metadata["context_trimmed_tokens"] = trimmed
+
+        self._put_cached(scope, question, provider, response, memo_key)
+
+        return response
+
+    def submit_batch(
+        self,
+        requests: Dict[str, Dict[str, Any]],
+        provider_name: Optional[str] = None,
+    ) -> str:
+        """
+        Submit many queries as one batch job.
+
+        Batch jobs are not interactive: results are collected later with
+        get_batch_results(). Providers with a batch API process them at
+        lower cost and higher throughput than individual queries.
+
+        Args:
+            requests: Mapping of custom_id -> query() keyword arguments
+                      (question, selection, formulas, ..., mode)
+            provider_name: Specific provider to use (None for default)
+
+        Returns:
+            Batch ID
+
+        Raises:
+            LLMProviderError: If provider doesn't support batches or submit fails
+        """
+        if provider_name is None:
+            provider_name = self.config.llm.default_provider
+
+        provider = self.get_provider(provider_name)
+        if not provider.supports_batch():
+            raise LLMProviderError(f"Provider '{provider_name}' does not support batch queries")
+
+        batch_requests = {}
+        for custom_id, query_args in requests.items():
+            mode = query_args.get("mode", "educational")
+            context = PromptBuilder.build_context(**query_args)
+            system_prompt = PromptBuilder.get_system_prompt(mode)
+            self._trim_context(context, system_prompt, query_args.get("dependency_tree"))
+            batch_requests[custom_id] = (context, system_prompt)
+
+        batch_id = provider.submit_batch(batch_requests)
+        self._batch_providers[batch_id] = provider_name
+
+        logger.info(
+            f"Submitted batch {batch_id} with {len(batch_requests)} requests to {provider_name}"
+        )
+
+        return batch_id
+
+    def get_batch_results(self, batch_id: str) -> Optional[Dict[str, LLMResponse]]:
+        """
+        Get results of a submitted batch.
+
+        Args:
+            batch_id: Batch ID returned by submit_batch()
+
+        Returns:
+            Mapping of custom_id -> response, or None if batch is still running
+
+        Raises:
+            LLMProviderError: If batch is unknown or failed
+        """
+        if batch_id not in self._batch_providers:
+            raise LLMProviderError(f"Unknown batch: {batch_id}")
+
+        provider = self.get_provider(self._batch_providers[batch_id])
+        results = provider.get_batch_results(batch_id)
+
+        if results is not None:
+            logger.info(f"Batch {batch_id} complete: {len(results)} responses")
+
+        return results
+
+    def _get_cached(
+        self,
+        scope: str,
+        question: str,
+        provider: BaseLLMProvider,
+        memo_key: Optional[bytes] = None,
+    ) -> Optional[LLMResponse]:
+        """Return cached response for question in scope, if any."""
+        if memo_key is not None:
+            cached = self._memo.get(memo_key)
+            if cached is not None:
+                self._memo.move_to_end(memo_key)
+                logger.info("Using memoized LLM response")
+                return cached
+
+        # Same rule as the memo: interactive providers must always be asked
+        if self.response_cache is None or not provider.supports_response_memo():
+            return None
+
+        cached = self.response_cache.get(scope, question)
+        if cached is not None:
+            logger.info("Using cached LLM response")
+        return cached
+
+    def _put_cached(
+        self,
+        scope: str,
+        question: str,
+        provider: BaseLLMProvider,
+        response: LLMResponse,
+        memo_key: Optional[bytes] = None,
+    ) -> None:
+        """Cache response for question in scope."""
+        if memo_key is not None:
+            self._memo[memo_key] = response
+            self._memo.move_to_end(memo_key)
+            while len(self._memo) > self._memo_size:
+                self._memo.popitem(last=False)
+
+        if self.response_cache is not None and provider.supports_response_memo():
+            self.response_cache.put(scope, question, response)
+
+    def _memo_key(
+        self,
+        scope: str,
+        question: str,
+        provider: BaseLLMProvider,
+    ) -> Optional[bytes]:
+        """
+        Digest identifying an exact query, for the in-memory memo.
+
+        Args:
+            scope: Digest of everything sent except the question
+            question: User's question (whitespace-normalized here)
+            provider: Provider that would answer
+
+        Returns:
+            Memo key, or None if this query must not be memoized
+        """
+        if self._memo_size <= 0 or not provider.supports_response_memo():
+            return None
+
+        normalized = " ".join(question.split())
+        return hashlib.blake2b(
+            f"{scope}\0{normalized}".encode("utf-8"), digest_size=16
+        ).digest()
+
+    @staticmethod
+    def _cache_scope(
+        context: LLMContext,
+        system_prompt: str,
+        provider_name: str,
+        workbook_revision: Optional[int] = None,
+    ) -> str:
+        """
+        Digest everything sent to the LLM except the question.
+
+        Two questions can only share a cached answer if they were asked
+        against identical workbook context, prompt and provider, at the
+        same workbook revision.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        for part in (
+            "" if workbook_revision is None else str(workbook_revision),
+            provider_name,
+            system_prompt,
+            context.selection_info or "",
+            context.spatial_context or "",
+            "\n".join(context.formulas),
+            context.dependencies or "",
+            "\n".join(context.annotations),
+            repr(sorted(context.additional_context.items())),
+        ):
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\x00")
+        return hasher.hexdigest()
+
+    def _prepare_query(
+        self,
+        question: str,
+        selection: Optional[Selection],
+        formulas: Optional[List[str]],
+        dependency_tree: Optional[DependencyTree],
+        annotations: Optional[List[Annotation]],
+        spatial_context: Optional[str],
+        mode: str,
+        provider_name: Optional[str],
+    ) -> Tuple[LLMContext, str, str, BaseLLMProvider, int]:
+        """
+        Build context and system prompt and resolve the provider for a query.
+
+        Returns:
+            Tuple of (context, system_prompt, provider_name, provider,
+            estimated tokens trimmed from the context)
+        """
         # Build context
         context = PromptBuilder.build_context(
             question=question,
@@ -98,22 +406,96 @@ class LLMInteractionService:
         # Get system prompt
         system_prompt = PromptBuilder.get_system_prompt(mode)
 
+        trimmed = self._trim_context(context, system_prompt, dependency_tree)
+
         # Get provider
         if provider_name is None:
             provider_name = self.config.llm.default_provider
 
         provider = self.get_provider(provider_name)
 
-        # Query
         logger.info(f"Querying LLM provider: {provider_name}")
         logger.debug(f"Question: {question}")
-        logger.debug(f"Context token estimate: {context.token_estimate()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Context token estimate: {self._estimate_tokens(context, system_prompt)}")
 
-        response = provider.query(context, system_prompt)
+        return context, system_prompt, provider_name, provider, trimmed
 
-        logger.info(f"Received response from {provider_name}")
+    def _trim_context(
+        self,
+        context: LLMContext,
+        system_prompt: str,
+        dependency_tree: Optional[DependencyTree],
+    ) -> int:
+        """
+        Shrink a context in place until it fits llm.max_context_tokens.
 
-        return response
+        Drops, in order and only as far as needed: the deepest levels of the
+        dependency tree, annotations from the end of the list, then the end
+        of the spatial snapshot.
+
+        Args:
+            context: Context to trim
+            system_prompt: System prompt sent with it (counts toward budget)
+            dependency_tree: Tree the context's dependencies came from
+
+        Returns:
+            Estimated number of tokens removed (0 if within budget)
+        """
+        budget = self.config.llm.max_context_tokens
+        if budget <= 0:
+            return 0
+
+        overhead = len(system_prompt) // 4
+        initial = tokens = context.token_estimate() + overhead
+        if tokens <= budget:
+            return 0
+
+        # Deepest tree levels first: far precedents matter least
+        if dependency_tree is not None and context.dependencies:
+            depth = dependency_tree.actual_max_depth()
+            while tokens > budget and depth > 0:
+                depth -= 1
+                context.dependencies = PromptBuilder._format_dependency_tree(
+                    dependency_tree, depth
+                )
+                tokens = context.token_estimate() + overhead
+
+        # Then annotations, from the end (estimated per bullet, checked below)
+        if tokens > budget and context.annotations:
+            while tokens > budget and context.annotations:
+                tokens -= (len(context.annotations.pop()) + 3) // 4
+            tokens = context.token_estimate() + overhead
+
+        # Finally cut the snapshot at a line boundary
+        if tokens > budget and context.spatial_context:
+            snapshot = context.spatial_context
+            keep = len(snapshot) - (tokens - budget) * 4 - len(_TRUNCATED_MARKER)
+            cut = snapshot.rfind("\n", 0, max(keep, 0))
+            context.spatial_context = snapshot[:cut] + _TRUNCATED_MARKER if cut > 0 else None
+            tokens = context.token_estimate() + overhead
+
+        if tokens > budget:
+            logger.warning(f"Context still ~{tokens} tokens after trimming (budget {budget})")
+        logger.info(f"Trimmed ~{initial - tokens} tokens of context to fit the token budget")
+
+        return initial - tokens
+
+    def _estimate_tokens(self, context: LLMContext, system_prompt: str) -> int:
+        """
+        Estimate prompt token count from the rendered prompt.
+
+        The prompt is memoized on the context, so the provider call that
+        follows reuses this render.
+
+        Args:
+            context: LLM context
+            system_prompt: System prompt
+
+        Returns:
+            Estimated token count (assuming ~4 chars per token)
+        """
+        return len(context.to_prompt(system_prompt)) // 4
 
     def get_provider(self, name: str) -> BaseLLMProvider:
         """
@@ -128,19 +510,43 @@ class LLMInteractionService:
         Raises:
             LLMProviderError: If provider not found or unavailable
         """
-        if name not in self.providers:
-            available = ", ".join(self.providers.keys())
-            raise LLMProviderError(
-                f"Provider '{name}' not found. Available providers: {available}"
-            )
-
-        provider = self.providers[name]
+        provider = self._provider_instances.get(name)
+        if provider is None:
+            factory = self._provider_factories.get(name)
+            if factory is None:
+                available = ", ".join(self._provider_factories.keys())
+                raise LLMProviderError(
+                    f"Provider '{name}' not found. Available providers: {available}"
+                )
+
+            # One instance per name, even if several threads ask at once
+            with self._provider_lock:
+                provider = self._provider_instances.get(name)
+                if provider is None:
+                    provider = factory()
+                    self._provider_instances[name] = provider
+                    logger.debug(f"Created LLM provider: {name}")
 
         if not provider.is_available():
             raise LLMProviderError(f"Provider '{name}' is not available")
 
         return provider
 
+    def supports_response_memo(self, provider_name: Optional[str] = None) -> bool:
+        """
+        Check if a provider's answers may be reused for repeated questions.
+
+        Args:
+            provider_name: Provider name (None for default)
+
+        Returns:
+            True if the provider allows cached answers
+        """
+        if provider_name is None:
+            provider_name = self.config.llm.default_provider
+
+        return self.get_provider(provider_name).supports_response_memo()
+
     def list_providers(self) -> List[str]:
         """
         List available provider names.
@@ -148,7 +554,7 @@ class LLMInteractionService:
         Returns:
             List of provider names
         """
-        return list(self.providers.keys())
+        return list(self._provider_factories.keys())
 
     def is_provider_available(self, name: str) -> bool:
         """
@@ -160,7 +566,10 @@ class LLMInteractionService:
         Returns:
             True if provider exists and is available
         """
-        if name not in self.providers:
+        if name not in self._provider_factories:
             return False
 
-        return self.providers[name].is_available()
+        try:
+            return self.get_provider(name).is_available()
+        except LLMProviderError:
+            return False
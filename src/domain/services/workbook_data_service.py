@@ -1,10 +1,15 @@
 """Workbook data service for Excel data access."""
 
-from typing import List, Optional
+import functools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple, TypeVar
 
 from src.domain.models.selection import Range, Selection
 from src.domain.models.workbook import Cell, Workbook, WorkbookStructure
-from src.infrastructure.config.config_loader import Config
+from src.infrastructure.config.config_schema import Config
 from src.infrastructure.excel.snapshot_generator import SnapshotGenerator
 from src.infrastructure.excel.workbook_discovery import WorkbookInfo
 from src.infrastructure.excel.xlwings_connector import XlwingsConnector
@@ -14,6 +19,49 @@ from src.shared.types import CellAddress, SheetName
 
 logger = get_logger(__name__)
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# (sheet, range address, strategy, workbook revision)
+_SnapshotKey = Tuple[SheetName, str, Optional[str], int]
+
+# Disconnected connectors from closed services, reused by new ones
+_CONNECTOR_POOL: List[XlwingsConnector] = []
+_CONNECTOR_POOL_SIZE = 4
+_connector_pool_lock = threading.Lock()
+
+
+def _acquire_connector() -> XlwingsConnector:
+    """Take a pooled connector, or create one if the pool is empty."""
+    with _connector_pool_lock:
+        if _CONNECTOR_POOL:
+            return _CONNECTOR_POOL.pop()
+    return XlwingsConnector()
+
+
+def _release_connector(connector: XlwingsConnector) -> None:
+    """Return a disconnected connector to the pool (dropped if it's full)."""
+    with _connector_pool_lock:
+        # Membership check guards against a double close()
+        if len(_CONNECTOR_POOL) < _CONNECTOR_POOL_SIZE and connector not in _CONNECTOR_POOL:
+            _CONNECTOR_POOL.append(connector)
+
+
+def require_connected(method: _F) -> _F:
+    """
+    Decorate a WorkbookDataService method to fail fast when not connected.
+
+    Raises:
+        ExcelConnectionError: If the service is not connected
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: "WorkbookDataService", *args: Any, **kwargs: Any) -> Any:
+        if not self._connected:
+            raise ExcelConnectionError("Not connected to workbook")
+        return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
 
 class WorkbookDataService:
     """
@@ -31,9 +79,17 @@ class WorkbookDataService:
             config: Application configuration
         """
         self.config = config
-        self.connector = XlwingsConnector()
+        # Config is frozen, so the expansion defaults can be read once
+        self._default_expand_rows = config.selection.expand_rows
+        self._default_expand_cols = config.selection.expand_cols
+        self.connector = _acquire_connector()
         self.snapshot_generator = SnapshotGenerator(config)
         self._workbook: Optional[Workbook] = None
+        # Mirrors the connector state, updated by connect*/disconnect
+        self._connected = False
+        self._revision = 0
+        # Snapshot key -> (time read, snapshot), in LRU order
+        self._snapshots: "OrderedDict[_SnapshotKey, Tuple[float, str]]" = OrderedDict()
 
     def connect(self, workbook_name: Optional[str] = None) -> Workbook:
         """
@@ -55,6 +111,8 @@ class WorkbookDataService:
         )
 
         self._workbook = self.connector.connect(workbook_name)
+        self._connected = True
+        self.mark_workbook_changed()
         logger.info(
             f"Connected to '{self._workbook.name}' "
             f"({len(self._workbook.sheets)} sheets)"
@@ -83,6 +141,8 @@ class WorkbookDataService:
         )
 
         self._workbook = self.connector.connect_to_workbook_info(workbook_info)
+        self._connected = True
+        self.mark_workbook_changed()
         logger.info(
             f"Connected to '{self._workbook.name}' "
             f"({len(self._workbook.sheets)} sheets)"
@@ -92,14 +152,43 @@ class WorkbookDataService:
 
     def disconnect(self) -> None:
         """Disconnect from Excel."""
+        self._connected = False
         self.connector.disconnect()
         self._workbook = None
+        self.mark_workbook_changed()
         logger.info("Disconnected from Excel")
 
+    @property
+    def workbook_revision(self) -> int:
+        """Counter bumped whenever the workbook (or its known contents) changes."""
+        return self._revision
+
+    def mark_workbook_changed(self) -> None:
+        """
+        Record that workbook contents may have changed.
+
+        Bumps workbook_revision, so snapshots read before are not reused.
+        The assistant response cache and the LLM response caches key on the
+        revision as well, so this one call invalidates all of them. Called
+        on connect/disconnect; callers that know of edits can call it too.
+        """
+        self._revision += 1
+        self._snapshots.clear()
+
+    def close(self) -> None:
+        """
+        Disconnect and hand the connector back to the shared pool.
+
+        The service must not be used afterwards.
+        """
+        self.disconnect()
+        _release_connector(self.connector)
+
     def is_connected(self) -> bool:
         """Check if currently connected to a workbook."""
-        return self.connector.is_connected()
+        return self._connected
 
+    @require_connected
     def get_workbook_structure(self) -> WorkbookStructure:
         """
         Get high-level workbook structure.
@@ -110,11 +199,9 @@ class WorkbookDataService:
         Raises:
             ExcelConnectionError: If not connected
         """
-        if not self.is_connected():
-            raise ExcelConnectionError("Not connected to workbook")
-
         return self.connector.get_workbook_structure()
 
+    @require_connected
     def get_current_selection(self) -> Optional[Selection]:
         """
         Get user's current selection in Excel.
@@ -125,11 +212,9 @@ class WorkbookDataService:
         Raises:
             ExcelConnectionError: If not connected
         """
-        if not self.is_connected():
-            raise ExcelConnectionError("Not connected to workbook")
-
         return self.connector.get_current_selection()
 
+    @require_connected
     def get_active_sheet(self) -> SheetName:
         """
         Get name of active sheet.
@@ -140,11 +225,22 @@ class WorkbookDataService:
         Raises:
             ExcelConnectionError: If not connected
         """
-        if not self.is_connected():
-            raise ExcelConnectionError("Not connected to workbook")
-
         return self.connector.get_active_sheet()
 
+    @require_connected
+    def has_unsaved_changes(self) -> bool:
+        """
+        Check whether the workbook has edits not yet saved to disk.
+
+        Returns:
+            True if Excel reports unsaved changes
+
+        Raises:
+            ExcelConnectionError: If not connected
+        """
+        return self.connector.has_unsaved_changes()
+
+    @require_connected
     def get_cell(
         self,
         address: CellAddress,
@@ -163,11 +259,9 @@ class WorkbookDataService:
         Raises:
             ExcelConnectionError: If not connected
         """
-        if not self.is_connected():
-            raise ExcelConnectionError("Not connected to workbook")
-
         return self.connector.get_cell(address, sheet)
 
+    @require_connected
     def get_range_data(self, range_obj: Range) -> List[Cell]:
         """
         Get data for a range of cells.
@@ -181,11 +275,53 @@ class WorkbookDataService:
         Raises:
             ExcelConnectionError: If not connected
         """
-        if not self.is_connected():
-            raise ExcelConnectionError("Not connected to workbook")
-
         return self.connector.get_range_data(range_obj)
 
+    @require_connected
+    def iter_range_data(self, range_obj: Range, chunk_rows: int = 4096) -> Iterator[Cell]:
+        """
+        Iterate over the cells of a range, reading it in row chunks.
+
+        Yields the same cells in the same order as get_range_data(), but
+        only one chunk of rows is held in memory at a time.
+
+        Args:
+            range_obj: Range to read
+            chunk_rows: Rows read from Excel per chunk
+
+        Yields:
+            Cells in row-major order
+
+        Raises:
+            ExcelConnectionError: If not connected
+        """
+        for start_row in range(range_obj.start_row, range_obj.end_row + 1, chunk_rows):
+            chunk = Range(
+                sheet=range_obj.sheet,
+                start_col=range_obj.start_col,
+                start_row=start_row,
+                end_col=range_obj.end_col,
+                end_row=min(start_row + chunk_rows - 1, range_obj.end_row),
+            )
+            yield from self.connector.get_range_data(chunk)
+
+    @require_connected
+    def get_formula_arrays(self, range_obj: Range) -> Tuple[List[CellAddress], List[str]]:
+        """
+        Get the formulas in a range as parallel address/formula lists.
+
+        Args:
+            range_obj: Range to read
+
+        Returns:
+            Tuple of (cell addresses, formula texts) for formula cells only
+
+        Raises:
+            ExcelConnectionError: If not connected
+        """
+        return self.connector.get_formula_arrays(range_obj)
+
+    @require_connected
     def get_snapshot(
         self,
         sheet: SheetName,
@@ -195,6 +331,12 @@ class WorkbookDataService:
         """
         Get markdown snapshot of a range.
 
+        Recent snapshots are kept in an LRU keyed by (sheet, range,
+        strategy, workbook_revision), so the agent asking about the same
+        range again doesn't re-read it from Excel. Entries also expire
+        after agent.snapshot_cache.ttl_seconds, since cell values can change
+        in Excel without any notification.
+
         Args:
             sheet: Sheet name
             range_address: Range address (e.g., "A1:B10")
@@ -206,19 +348,40 @@ class WorkbookDataService:
         Raises:
             ExcelConnectionError: If not connected
         """
-        if not self.is_connected():
-            raise ExcelConnectionError("Not connected to workbook")
+        cache_config = self.config.agent.snapshot_cache
+        if cache_config.max_entries <= 0:
+            return self._read_snapshot(sheet, range_address, strategy)
+
+        key = (sheet, range_address, strategy, self._revision)
+        now = time.monotonic()
+        entry = self._snapshots.get(key)
+        if entry is not None and now - entry[0] <= cache_config.ttl_seconds:
+            self._snapshots.move_to_end(key)
+            logger.debug(f"Reusing snapshot of {sheet}!{range_address}")
+            return entry[1]
+
+        snapshot = self._read_snapshot(sheet, range_address, strategy)
+        self._snapshots[key] = (now, snapshot)
+        self._snapshots.move_to_end(key)
+        while len(self._snapshots) > cache_config.max_entries:
+            self._snapshots.popitem(last=False)
+
+        return snapshot
 
+    def _read_snapshot(
+        self,
+        sheet: SheetName,
+        range_address: str,
+        strategy: Optional[str],
+    ) -> str:
+        """Read a range from Excel and render its markdown snapshot."""
         # Parse range
         range_obj = Range.from_address(f"{sheet}!{range_address}")
 
-        # Get cell data
-        cells = self.get_range_data(range_obj)
-
-        # Generate snapshot
-        snapshot = self.snapshot_generator.generate(cells, range_obj, strategy)
+        # Read values and formulas in bulk (no per-cell Cell objects)
+        values, formulas = self.connector.read_block(range_obj)
 
-        return snapshot
+        return self.snapshot_generator.generate_from_arrays(values, formulas, range_obj, strategy)
 
     def expand_selection_context(
         self,
@@ -238,36 +401,105 @@ class WorkbookDataService:
             Expanded range
         """
         if rows is None:
-            rows = self.config.selection.expand_rows
+            rows = self._default_expand_rows
         if cols is None:
-            cols = self.config.selection.expand_cols
+            cols = self._default_expand_cols
 
         return selection.range.expand(rows=rows, cols=cols)
 
+    @require_connected
     def search_cells(
         self,
         value_contains: Optional[str] = None,
         sheet: Optional[SheetName] = None,
+        chunk_rows: int = 4096,
     ) -> List[CellAddress]:
         """
         Search for cells matching criteria.
 
+        Each sheet's used range is read in bulk, chunk_rows rows per Excel
+        call. Excel is read on this thread (COM objects belong to it) while
+        a worker scans the previous chunk, so scanning overlaps the reads.
+
         Args:
-            value_contains: Search for cells containing this text
+            value_contains: Search for cells whose value contains this text
+                (case-insensitive); None matches every non-empty cell
             sheet: Limit search to specific sheet (None for all sheets)
+            chunk_rows: Rows read from Excel per call
 
         Returns:
-            List of matching cell addresses
+            List of matching sheet-qualified cell addresses (e.g. "Data!B4"),
+            in sheet order, then row-major
 
-        Note:
-            This is a basic implementation. For production, would need
-            more sophisticated search with formula matching, etc.
+        Raises:
+            ExcelConnectionError: If not connected
+        """
+        workbook = self.get_workbook_structure().workbook
+        sheets = [workbook.get_sheet(sheet)] if sheet is not None else workbook.sheets
+        needle = value_contains.casefold() if value_contains is not None else None
+
+        matches: List[CellAddress] = []
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="cell-search") as pool:
+            scans: List[Future] = []
+            for xl_sheet in sheets:
+                if xl_sheet is None or not xl_sheet.used_range:
+                    continue
+
+                used = Range.from_address(f"{xl_sheet.name}!{xl_sheet.used_range}")
+                col_letters = used.col_letters()
+
+                for start_row in range(used.start_row, used.end_row + 1, chunk_rows):
+                    chunk = Range(
+                        sheet=xl_sheet.name,
+                        start_col=used.start_col,
+                        start_row=start_row,
+                        end_col=used.end_col,
+                        end_row=min(start_row + chunk_rows - 1, used.end_row),
+                    )
+                    values = self.connector.read_values(chunk)
+                    scans.append(pool.submit(
+                        self._scan_values, xl_sheet.name, col_letters, start_row, values, needle
+                    ))
+
+            # Collected in submission order, so matches stay in read order
+            for scan in scans:
+                matches.extend(scan.result())
+
+        logger.debug(f"Cell search for {value_contains!r} found {len(matches)} matches")
+
+        return matches
+
+    @staticmethod
+    def _scan_values(
+        sheet_name: SheetName,
+        col_letters: Sequence[str],
+        start_row: int,
+        values: Sequence[Sequence[Any]],
+        needle: Optional[str],
+    ) -> List[CellAddress]:
         """
-        # TODO: Implement full search functionality
-        # For now, this is a placeholder that would need to iterate
-        # through ranges and check values
-        raise NotImplementedError("Cell search not yet implemented")
+        Find the non-empty cells of a value grid that contain needle.
+
+        Args:
+            sheet_name: Sheet the grid was read from
+            col_letters: Column letter of each grid column
+            start_row: Row number of the grid's first row
+            values: Row-major cell values
+            needle: Casefolded search text (None matches any non-empty cell)
 
+        Returns:
+            Sheet-qualified addresses of the matching cells, row-major
+        """
+        matches: List[CellAddress] = []
+        for row_num, row in enumerate(values, start=start_row):
+            for col_letter, value in zip(col_letters, row):
+                if value is None or value == "":
+                    continue
+                if needle is None or needle in str(value).casefold():
+                    matches.append(f"{sheet_name}!{col_letter}{row_num}")
+        return matches
+
+    @require_connected
     def get_workbook_info(self) -> Workbook:
         """
         Get current workbook info.
@@ -278,9 +510,6 @@ class WorkbookDataService:
         Raises:
             ExcelConnectionError: If not connected
         """
-        if not self.is_connected():
-            raise ExcelConnectionError("Not connected to workbook")
-
         if self._workbook is None:
             raise ExcelConnectionError("No workbook loaded")
 
@@ -292,4 +521,4 @@ class WorkbookDataService:
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Context manager exit."""
-        self.disconnect()
+        self.close()
@@ -1,257 +1,123 @@
 """Configuration loader for Excel Sidekick."""
 
+import json
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple
 
-import yaml
-from pydantic import BaseModel, Field, field_validator
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
 
+from pydantic import ValidationError
+
+from src.infrastructure.config.config_schema import (  # noqa: F401 (re-exported)
+    Config,
+    get_project_root,
+    resolve_path,
+)
 from src.shared.exceptions import ConfigurationError
-from src.shared.types import DependencyMode, LogLevel, SnapshotFormat, TraceDirection
 
 
-# Project root for resolving relative paths
-def get_project_root() -> Path:
-    """Get project root directory (where config/ folder lives)."""
-    # This file is at src/infrastructure/config/config_loader.py
-    # Project root is 4 levels up
-    return Path(__file__).parent.parent.parent.parent
+# Resolved config path -> (file mtime_ns, loaded config)
+_CONFIG_CACHE: Dict[Path, Tuple[int, Config]] = {}
+
+
+def _parsed_cache_path(config_path: Path) -> Path:
+    """Side-car file holding the parsed YAML of a config file as JSON."""
+    return config_path.with_name(config_path.name + ".cache.json")
 
 
-def resolve_path(path_value: Union[str, Path]) -> Path:
+def _read_parsed_cache(config_path: Path, mtime_ns: int) -> Optional[bytes]:
     """
-    Resolve path, supporting both relative and absolute paths.
+    Read the parsed config from the side-car cache.
 
-    Relative paths are resolved from project root.
-    Absolute paths are used as-is.
+    The side-car is the source file's mtime_ns on the first line, then the
+    parsed config as JSON.
 
     Args:
-        path_value: Path string or Path object
+        config_path: Config (YAML) file path
+        mtime_ns: Current modification time of the config file
 
     Returns:
-        Resolved Path object
+        Config JSON, or None if there is no cache for this version
     """
-    path = Path(path_value)
-
-    if path.is_absolute():
-        # Use absolute path as-is
-        return path
-    else:
-        # Resolve relative path from project root
-        return (get_project_root() / path).resolve()
-
-
-class ExcelConfig(BaseModel):
-    """Excel connection configuration."""
-
-    platform: str = "windows"
-    auto_connect: bool = True
-
-
-class ConnectionConfig(BaseModel):
-    """Connection workflow configuration."""
-
-    auto_list_on_error: bool = True  # Show workbook list when connection fails
-    auto_build_graph: str = "prompt"  # prompt | always | never
-    build_graph_timeout: int = 300  # seconds before timeout warning
-    prefer_most_recent: bool = False  # Auto-select most recently modified if ambiguous
-
-
-class SelectionConfig(BaseModel):
-    """Selection behaviour configuration."""
-
-    auto_expand_context: bool = True
-    expand_rows: int = 5
-    expand_cols: int = 3
-
-
-class SnapshotCollapseConfig(BaseModel):
-    """Snapshot collapse configuration."""
-
-    empty_rows: bool = True
-    empty_columns: bool = True
-    show_summary: bool = True
-
-
-class SnapshotSamplingConfig(BaseModel):
-    """Snapshot sampling configuration."""
-
-    enabled: bool = True
-    threshold_cells: int = 3000
-    sample_every_n_rows: int = 10
-    always_show_first_n: int = 10
-    always_show_last_n: int = 5
-
-
-class SnapshotConfig(BaseModel):
-    """Snapshot generation configuration."""
-
-    format: SnapshotFormat = SnapshotFormat.MARKDOWN
-    max_cells_per_snapshot: int = 10000
-    collapse: SnapshotCollapseConfig = Field(default_factory=SnapshotCollapseConfig)
-    sampling: SnapshotSamplingConfig = Field(default_factory=SnapshotSamplingConfig)
-
-
-class DependencyCacheConfig(BaseModel):
-    """Dependency cache configuration."""
-
-    enabled: bool = True
-    location: Path = Path(".cache")
-    auto_rebuild_on_change: bool = True
-
-    @field_validator('location', mode='before')
-    @classmethod
-    def resolve_cache_location(cls, v):
-        """Resolve path (supports relative and absolute)."""
-        return resolve_path(v)
-
-
-class DependenciesConfig(BaseModel):
-    """Dependency analysis configuration."""
-
-    mode: DependencyMode = DependencyMode.ON_DEMAND
-    batch_size: int = 1000  # Rows per batch for full_graph mode
-    default_depth: int = 3
-    max_depth: int = 10
-    default_direction: TraceDirection = TraceDirection.BOTH
-    cross_sheet: bool = True
-    cache: DependencyCacheConfig = Field(default_factory=DependencyCacheConfig)
-
-
-class AnnotationsConfig(BaseModel):
-    """Annotations configuration."""
-
-    storage: str = "separate_file"
-    file_location: Path = Path(".cache")
-    default_sheet_scope: bool = True
-
-    @field_validator('file_location', mode='before')
-    @classmethod
-    def resolve_annotation_location(cls, v):
-        """Resolve path (supports relative and absolute)."""
-        return resolve_path(v)
-
-
-class ManualProviderConfig(BaseModel):
-    """Manual LLM provider configuration."""
-
-    enabled: bool = True
-    input_file: Path = Path("llm_input.txt")
-    output_file: Path = Path("llm_output.txt")
-
-    @field_validator('input_file', 'output_file', mode='before')
-    @classmethod
-    def resolve_llm_file(cls, v):
-        """Resolve path (supports relative and absolute)."""
-        return resolve_path(v)
-
-
-class InternalAPIProviderConfig(BaseModel):
-    """Internal API provider configuration."""
-
-    enabled: bool = False
-    endpoint: str = ""
-    auth_type: str = ""
-    tenant_id: str = ""
-    model: str = ""
-
-
-class MockProviderConfig(BaseModel):
-    """Mock provider configuration."""
-
-    enabled: bool = True
-
-
-class LLMProvidersConfig(BaseModel):
-    """LLM providers configuration."""
-
-    manual: ManualProviderConfig = Field(default_factory=ManualProviderConfig)
-    internal_api: InternalAPIProviderConfig = Field(default_factory=InternalAPIProviderConfig)
-    mock: MockProviderConfig = Field(default_factory=MockProviderConfig)
-
-
-class LLMConfig(BaseModel):
-    """LLM configuration."""
-
-    default_provider: str = "manual"
-    providers: LLMProvidersConfig = Field(default_factory=LLMProvidersConfig)
+    try:
+        data = _parsed_cache_path(config_path).read_bytes()
+    except OSError:
+        return None
 
+    header, _, config_json = data.partition(b"\n")
+    if header != str(mtime_ns).encode("ascii"):
+        return None
+    return config_json
 
-class AgentConfig(BaseModel):
-    """Agent configuration."""
 
-    max_iterations: int = 15
-    verbose: bool = True
-    tools: list[str] = Field(
-        default_factory=lambda: [
-            "get_workbook_overview",
-            "get_snapshot",
-            "search_cells",
-            "get_cell_details",
-            "get_formulas",
-            "trace_dependencies",
-            "get_current_selection",
-            "get_annotations",
-            "add_annotation",
-            "search_annotations",
-        ]
+def _write_parsed_cache(config_path: Path, mtime_ns: int, config_dict: Dict[str, Any]) -> None:
+    """Write the parsed config to the side-car cache (best effort)."""
+    try:
+        if orjson is not None:
+            config_json = orjson.dumps(config_dict)
+        else:
+            config_json = json.dumps(config_dict).encode("utf-8")
+        _parsed_cache_path(config_path).write_bytes(
+            str(mtime_ns).encode("ascii") + b"\n" + config_json
+        )
+    except (OSError, TypeError, ValueError):
+        # Read-only location or YAML values JSON can't hold: parse YAML next time
+        pass
+
+
+def _validation_message(error: ValidationError) -> str:
+    """Summarize a config ValidationError as one line per invalid field."""
+    problems = "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or '<root>'}: {err['msg']}"
+        for err in error.errors()
     )
+    return f"Invalid configuration: {problems}"
 
 
-class LoggingConfig(BaseModel):
-    """Logging configuration.
-
-    Note: Console output and rich tracebacks are always enabled.
-    The {date} placeholder in file path is replaced with YYYY-MM-DD at runtime.
+def _parse_yaml(config_path: Path) -> Any:
     """
+    Parse a YAML config file.
 
-    level: LogLevel = LogLevel.INFO
-    file: Path = Path("logs/excel_sidekick_{date}.log")
-    format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-
-    @field_validator('file', mode='before')
-    @classmethod
-    def resolve_log_file(cls, v):
-        """Resolve path (supports relative and absolute)."""
-        return resolve_path(v)
-
+    Args:
+        config_path: Config (YAML) file path
 
-class CLIConfig(BaseModel):
-    """CLI configuration.
+    Returns:
+        Parsed document ({} for an empty file)
 
-    Note: Welcome message is always shown in REPL mode.
+    Raises:
+        ConfigurationError: If the file can't be read or parsed
     """
+    # Imported here so cache hits and Config() users don't pay for PyYAML
+    import yaml
 
-    prompt: str = "excel-sidekick> "
-    history_file: Path = Path("logs/cli_history.txt")
-
-    @field_validator('history_file', mode='before')
-    @classmethod
-    def resolve_history_file(cls, v):
-        """Resolve path (supports relative and absolute)."""
-        return resolve_path(v)
-
+    # libyaml-backed loader when available, same semantics as SafeLoader
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-class Config(BaseModel):
-    """Main configuration class for Excel Sidekick."""
+    try:
+        with open(config_path, "r") as f:
+            config_dict = yaml.load(f, Loader=loader)
+    except yaml.YAMLError as e:
+        raise ConfigurationError(f"Invalid YAML in config file: {e}")
+    except (OSError, UnicodeDecodeError) as e:
+        raise ConfigurationError(f"Failed to load configuration: {e}")
 
-    excel: ExcelConfig = Field(default_factory=ExcelConfig)
-    connection: ConnectionConfig = Field(default_factory=ConnectionConfig)
-    selection: SelectionConfig = Field(default_factory=SelectionConfig)
-    snapshot: SnapshotConfig = Field(default_factory=SnapshotConfig)
-    dependencies: DependenciesConfig = Field(default_factory=DependenciesConfig)
-    annotations: AnnotationsConfig = Field(default_factory=AnnotationsConfig)
-    llm: LLMConfig = Field(default_factory=LLMConfig)
-    agent: AgentConfig = Field(default_factory=AgentConfig)
-    logging: LoggingConfig = Field(default_factory=LoggingConfig)
-    cli: CLIConfig = Field(default_factory=CLIConfig)
+    return {} if config_dict is None else config_dict
 
 
 def load_config(config_path: Optional[Path] = None) -> Config:
     """
     Load configuration from YAML file.
 
+    The result is cached per file and reused until the file's modification
+    time changes, so repeated calls skip YAML parsing and validation. The
+    cached Config is shared between callers; use load_config.cache_clear()
+    to force a reload. Across runs, the parsed YAML is kept as JSON in a
+    "<config file>.cache.json" side-car, so a warm start skips PyYAML.
+
     Args:
         config_path: Path to config file. If None, uses default 'config/config.yaml'
 
@@ -266,27 +132,43 @@ def load_config(config_path: Optional[Path] = None) -> Config:
         project_root = Path(__file__).parent.parent.parent.parent
         config_path = project_root / "config" / "config.yaml"
 
-    if not config_path.exists():
+    config_path = Path(config_path).absolute()
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except OSError:
         raise ConfigurationError(f"Configuration file not found: {config_path}")
 
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    # Parsed-YAML side-car from an earlier run, if the file is unchanged:
+    # validated straight from JSON bytes, without PyYAML
+    config_json = _read_parsed_cache(config_path, mtime_ns)
     try:
-        with open(config_path, "r") as f:
-            config_dict = yaml.safe_load(f)
+        if config_json is not None:
+            config = Config.model_validate_json(config_json)
+        else:
+            config_dict = _parse_yaml(config_path)
+            config = Config.model_validate(config_dict)
+            _write_parsed_cache(config_path, mtime_ns, config_dict)
+    except ValidationError as e:
+        raise ConfigurationError(_validation_message(e)) from e
 
-        if config_dict is None:
-            config_dict = {}
+    _CONFIG_CACHE[config_path] = (mtime_ns, config)
+    return config
 
-        return Config(**config_dict)
 
-    except yaml.YAMLError as e:
-        raise ConfigurationError(f"Invalid YAML in config file: {e}")
-    except Exception as e:
-        raise ConfigurationError(f"Failed to load configuration: {e}")
+# Same name as functools.lru_cache's helper, for tests
+load_config.cache_clear = _CONFIG_CACHE.clear
 
 
 def get_config(config_path: Optional[Path] = None) -> Config:
     """
-    Get configuration instance (convenience function).
+    Get configuration instance (convenience function, cached like load_config).
+
+    Falls back to Config.defaults() when no path is given and the default
+    config file doesn't exist.
 
     Args:
         config_path: Path to config file
@@ -294,4 +176,6 @@ def get_config(config_path: Optional[Path] = None) -> Config:
     Returns:
         Configuration object
     """
+    if config_path is None and not (get_project_root() / "config" / "config.yaml").exists():
+        return Config.defaults()
     return load_config(config_path)
@@ -0,0 +1,329 @@
+"""Configuration schema (Pydantic models) for Excel Sidekick."""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Union
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from src.shared.types import DependencyMode, LogLevel, SnapshotFormat, TraceDirection
+
+
+# Project root for resolving relative paths
+@lru_cache(maxsize=None)
+def get_project_root() -> Path:
+    """Get project root directory (where config/ folder lives)."""
+    # This file is at src/infrastructure/config/config_schema.py
+    # Project root is 4 levels up
+    return Path(__file__).absolute().parent.parent.parent.parent
+
+
+@lru_cache(maxsize=128)
+def resolve_path(path_value: Union[str, Path]) -> Path:
+    """
+    Resolve path, supporting both relative and absolute paths.
+
+    Relative paths are joined onto the project root (purely lexically:
+    no filesystem access, since many configured files are never opened).
+    Absolute paths are used as-is. Results are memoized, since config
+    validation resolves the same few paths on every load.
+
+    Args:
+        path_value: Path string or Path object
+
+    Returns:
+        Absolute Path object
+    """
+    path = Path(path_value)
+
+    if path.is_absolute():
+        # Use absolute path as-is
+        return path
+    else:
+        # Resolve relative path from project root
+        return get_project_root() / path
+
+
+class _ConfigModel(BaseModel):
+    """
+    Base for configuration models that nest others or validate fields.
+
+    Frozen, so one loaded Config can be shared safely (load_config caches
+    it). Defaults are not re-validated. Plain leaf sections are frozen,
+    slotted dataclasses instead; Pydantic still validates them as fields.
+    """
+
+    model_config = ConfigDict(frozen=True, validate_default=False)
+
+
+@dataclass(frozen=True, slots=True)
+class ExcelConfig:
+    """Excel connection configuration."""
+
+    platform: str = "windows"
+    auto_connect: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class ConnectionConfig:
+    """Connection workflow configuration."""
+
+    auto_list_on_error: bool = True  # Show workbook list when connection fails
+    auto_build_graph: str = "prompt"  # prompt | always | never
+    build_graph_timeout: int = 300  # seconds before timeout warning
+    prefer_most_recent: bool = False  # Auto-select most recently modified if ambiguous
+
+
+@dataclass(frozen=True, slots=True)
+class SelectionConfig:
+    """Selection behaviour configuration."""
+
+    auto_expand_context: bool = True
+    expand_rows: int = 5
+    expand_cols: int = 3
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotCollapseConfig:
+    """Snapshot collapse configuration."""
+
+    empty_rows: bool = True
+    empty_columns: bool = True
+    show_summary: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotSamplingConfig:
+    """Snapshot sampling configuration."""
+
+    enabled: bool = True
+    threshold_cells: int = 3000
+    sample_every_n_rows: int = 10
+    always_show_first_n: int = 10
+    always_show_last_n: int = 5
+
+
+class SnapshotConfig(_ConfigModel):
+    """Snapshot generation configuration."""
+
+    format: SnapshotFormat = SnapshotFormat.MARKDOWN
+    max_cells_per_snapshot: int = 10000
+    collapse: SnapshotCollapseConfig = Field(default_factory=SnapshotCollapseConfig)
+    sampling: SnapshotSamplingConfig = Field(default_factory=SnapshotSamplingConfig)
+
+
+class DependencyCacheConfig(_ConfigModel):
+    """Dependency cache configuration."""
+
+    enabled: bool = True
+    location: Path = Path(".cache")
+    auto_rebuild_on_change: bool = True
+
+    @field_validator('location', mode='after')
+    @classmethod
+    def resolve_cache_location(cls, v):
+        """Resolve path (supports relative and absolute)."""
+        return resolve_path(v)
+
+
+class DependenciesConfig(_ConfigModel):
+    """Dependency analysis configuration."""
+
+    mode: DependencyMode = DependencyMode.ON_DEMAND
+    batch_size: int = 1000  # Rows per batch for full_graph mode
+    default_depth: int = 3
+    max_depth: int = 10
+    default_direction: TraceDirection = TraceDirection.BOTH
+    cross_sheet: bool = True
+    cache: DependencyCacheConfig = Field(default_factory=DependencyCacheConfig)
+
+
+class AnnotationsConfig(_ConfigModel):
+    """Annotations configuration."""
+
+    storage: str = "separate_file"
+    file_location: Path = Path(".cache")
+    default_sheet_scope: bool = True
+
+    @field_validator('file_location', mode='after')
+    @classmethod
+    def resolve_annotation_location(cls, v):
+        """Resolve path (supports relative and absolute)."""
+        return resolve_path(v)
+
+
+class ManualProviderConfig(_ConfigModel):
+    """Manual LLM provider configuration."""
+
+    enabled: bool = True
+    input_file: Path = Path("llm_input.txt")
+    output_file: Path = Path("llm_output.txt")
+
+    @field_validator('input_file', 'output_file', mode='after')
+    @classmethod
+    def resolve_llm_file(cls, v):
+        """Resolve path (supports relative and absolute)."""
+        return resolve_path(v)
+
+
+@dataclass(frozen=True, slots=True)
+class InternalAPIProviderConfig:
+    """Internal API provider configuration."""
+
+    enabled: bool = False
+    endpoint: str = ""
+    auth_type: str = ""
+    tenant_id: str = ""
+    model: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class MockProviderConfig:
+    """Mock provider configuration."""
+
+    enabled: bool = True
+
+
+class LLMProvidersConfig(_ConfigModel):
+    """LLM providers configuration."""
+
+    manual: ManualProviderConfig = Field(default_factory=ManualProviderConfig)
+    internal_api: InternalAPIProviderConfig = Field(default_factory=InternalAPIProviderConfig)
+    mock: MockProviderConfig = Field(default_factory=MockProviderConfig)
+
+
+@dataclass(frozen=True, slots=True)
+class SemanticCacheConfig:
+    """
+    Paraphrase-matching LLM response cache configuration.
+
+    Off by default: questions are compared as bags of words, so word order
+    and negation are ignored ("Is A1 greater than B1?" matches "Is B1
+    greater than A1?"). Exact repeats are still served by llm.cache_size.
+    """
+
+    enabled: bool = False
+    similarity_threshold: float = 0.93  # Min question similarity for a cache hit
+    max_entries: int = 256
+
+
+@dataclass(frozen=True, slots=True)
+class LLMRetryConfig:
+    """Retry policy for transient LLM errors."""
+
+    max_attempts: int = 6
+    min_wait: float = 1.0   # Seconds
+    max_wait: float = 32.0  # Seconds
+
+
+class LLMConfig(_ConfigModel):
+    """LLM configuration."""
+
+    default_provider: str = "manual"
+    max_concurrency: int = 4  # Max in-flight LLM requests for ask_many
+    max_qpm: int = 0  # Max LLM requests per minute (0 = unlimited)
+    cache_size: int = 128  # Identical queries memoized in memory (0 = off)
+    max_context_tokens: int = 100000  # Trim prompt context beyond this (0 = no limit)
+    retry: LLMRetryConfig = Field(default_factory=LLMRetryConfig)
+    providers: LLMProvidersConfig = Field(default_factory=LLMProvidersConfig)
+    semantic_cache: SemanticCacheConfig = Field(default_factory=SemanticCacheConfig)
+
+
+@dataclass(frozen=True, slots=True)
+class ResponseCacheConfig:
+    """Assistant response cache configuration."""
+
+    enabled: bool = True
+    ttl_seconds: float = 600.0  # Entries expire after this many seconds
+    max_entries: int = 128
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotCacheConfig:
+    """Range snapshot cache configuration (used by WorkbookDataService.get_snapshot)."""
+
+    max_entries: int = 32  # Recent range snapshots kept (0 = off)
+    ttl_seconds: float = 30.0  # Re-read from Excel after this many seconds
+
+
+class AgentConfig(_ConfigModel):
+    """Agent configuration."""
+
+    max_iterations: int = 15
+    verbose: bool = True
+    response_cache: ResponseCacheConfig = Field(default_factory=ResponseCacheConfig)
+    snapshot_cache: SnapshotCacheConfig = Field(default_factory=SnapshotCacheConfig)
+    tools: list[str] = Field(
+        default_factory=lambda: [
+            "get_workbook_overview",
+            "get_snapshot",
+            "search_cells",
+            "get_cell_details",
+            "get_formulas",
+            "trace_dependencies",
+            "get_current_selection",
+            "get_annotations",
+            "add_annotation",
+            "search_annotations",
+        ]
+    )
+
+
+class LoggingConfig(_ConfigModel):
+    """Logging configuration.
+
+    Note: Console output and rich tracebacks are always enabled.
+    The {date} placeholder in file path is replaced with YYYY-MM-DD at runtime.
+    """
+
+    level: LogLevel = LogLevel.INFO
+    file: Path = Path("logs/excel_sidekick_{date}.log")
+    format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+    @field_validator('file', mode='after')
+    @classmethod
+    def resolve_log_file(cls, v):
+        """Resolve path (supports relative and absolute)."""
+        return resolve_path(v)
+
+
+class CLIConfig(_ConfigModel):
+    """CLI configuration.
+
+    Note: Welcome message is always shown in REPL mode.
+    """
+
+    prompt: str = "excel-sidekick> "
+    history_file: Path = Path("logs/cli_history.txt")
+
+    @field_validator('history_file', mode='after')
+    @classmethod
+    def resolve_history_file(cls, v):
+        """Resolve path (supports relative and absolute)."""
+        return resolve_path(v)
+
+
+class Config(_ConfigModel):
+    """Main configuration class for Excel Sidekick."""
+
+    excel: ExcelConfig = Field(default_factory=ExcelConfig)
+    connection: ConnectionConfig = Field(default_factory=ConnectionConfig)
+    selection: SelectionConfig = Field(default_factory=SelectionConfig)
+    snapshot: SnapshotConfig = Field(default_factory=SnapshotConfig)
+    dependencies: DependenciesConfig = Field(default_factory=DependenciesConfig)
+    annotations: AnnotationsConfig = Field(default_factory=AnnotationsConfig)
+    llm: LLMConfig = Field(default_factory=LLMConfig)
+    agent: AgentConfig = Field(default_factory=AgentConfig)
+    logging: LoggingConfig = Field(default_factory=LoggingConfig)
+    cli: CLIConfig = Field(default_factory=CLIConfig)
+
+    @classmethod
+    def defaults(cls) -> "Config":
+        """
+        Build a default configuration without running validation.
+
+        Returns:
+            Config with every field at its default
+        """
+        return cls.model_construct()
@@ -1,14 +1,21 @@
 """Snapshot generator for creating markdown views of Excel data."""
 
-from typing import List, Optional
+import re
+from functools import lru_cache
+from itertools import chain, cycle, repeat
+from operator import attrgetter, eq
+from typing import Any, Iterable, Iterator, List, Optional, Sequence
 
 from src.domain.models.selection import Range
 from src.domain.models.workbook import Cell
-from src.infrastructure.config.config_loader import Config
+from src.infrastructure.config.config_schema import Config
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Column letters and row number of an A1 cell address (absolute or not)
+_ADDR_RE = re.compile(r"\$?([A-Za-z]+)\$?(\d+)")
+
 
 class SnapshotGenerator:
     """
@@ -45,14 +52,172 @@ class SnapshotGenerator:
         Returns:
             Markdown formatted snapshot
         """
+        return "".join(self.generate_iter(cells, range_obj, strategy))
+
+    def generate_iter(
+        self,
+        cells: List[Cell],
+        range_obj: Range,
+        strategy: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Stream markdown snapshot in chunks, for writing to a file or socket.
+
+        Concatenating the chunks gives exactly generate()'s result, so only
+        one row is held in memory at a time.
+
+        Args:
+            cells: List of cells to include in snapshot
+            range_obj: Range being snapshotted
+            strategy: Override strategy ("auto", "full", or None for config default)
+
+        Yields:
+            Snapshot text chunks (one per line, newline-terminated except the last)
+        """
+        return self._newline_terminated(self.iter_lines(cells, range_obj, strategy))
+
+    def iter_lines(
+        self,
+        cells: List[Cell],
+        range_obj: Range,
+        strategy: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Generate markdown snapshot one line at a time (without newlines).
+
+        Args:
+            cells: List of cells to include in snapshot
+            range_obj: Range being snapshotted
+            strategy: Override strategy ("auto", "full", or None for config default)
+
+        Yields:
+            Snapshot lines
+        """
         if not cells:
-            return self._empty_snapshot(range_obj)
+            yield self._empty_snapshot(range_obj)
+            return
+
+        # Generate based on strategy
+        if self._resolve_strategy(len(cells), strategy) == "sampled":
+            yield from self._generate_sampled(cells, range_obj)
+        else:
+            yield from self._generate_full(cells, range_obj)
+
+    def generate_from_arrays(
+        self,
+        values: Sequence[Sequence[Any]],
+        formulas: Sequence[Sequence[Any]],
+        range_obj: Range,
+        strategy: Optional[str] = None,
+    ) -> str:
+        """
+        Generate markdown snapshot from 2D value/formula grids.
+
+        Same output as generate() for the cells of those grids, without
+        building Cell objects.
+
+        Args:
+            values: Row-major cell values covering range_obj
+            formulas: Row-major formula texts, index-aligned with values
+            range_obj: Range being snapshotted
+            strategy: Override strategy ("auto", "full", or None for config default)
+
+        Returns:
+            Markdown formatted snapshot
+        """
+        return "".join(self.generate_iter_from_arrays(values, formulas, range_obj, strategy))
+
+    def generate_iter_from_arrays(
+        self,
+        values: Sequence[Sequence[Any]],
+        formulas: Sequence[Sequence[Any]],
+        range_obj: Range,
+        strategy: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Stream markdown snapshot of 2D value/formula grids in chunks.
+
+        Concatenating the chunks gives exactly generate_from_arrays()'s result.
+
+        Args:
+            values: Row-major cell values covering range_obj
+            formulas: Row-major formula texts, index-aligned with values
+            range_obj: Range being snapshotted
+            strategy: Override strategy ("auto", "full", or None for config default)
+
+        Yields:
+            Snapshot text chunks (one per line, newline-terminated except the last)
+        """
+        return self._newline_terminated(
+            self.iter_lines_from_arrays(values, formulas, range_obj, strategy)
+        )
+
+    @staticmethod
+    def _newline_terminated(lines: Iterator[str]) -> Iterator[str]:
+        """Yield each line with a newline, except the last one."""
+        previous = next(lines, None)
+        for line in lines:
+            yield previous + "\n"
+            previous = line
+        if previous is not None:
+            yield previous
+
+    def iter_lines_from_arrays(
+        self,
+        values: Sequence[Sequence[Any]],
+        formulas: Sequence[Sequence[Any]],
+        range_obj: Range,
+        strategy: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Generate markdown snapshot from 2D grids one line at a time.
 
+        Args:
+            values: Row-major cell values covering range_obj
+            formulas: Row-major formula texts, index-aligned with values
+            range_obj: Range being snapshotted
+            strategy: Override strategy ("auto", "full", or None for config default)
+
+        Yields:
+            Snapshot lines
+        """
+        cell_count = sum(len(row) for row in values)
+        if not cell_count:
+            yield self._empty_snapshot(range_obj)
+            return
+
+        is_sampled = self._resolve_strategy(cell_count, strategy) == "sampled"
+        if is_sampled:
+            yield from self._sampled_header(range_obj)
+            included = self._sampled_row_indices(range_obj)
+        else:
+            yield from self._full_header(range_obj)
+
+        cols_count = range_obj.col_count()
+        format_value = self._format_value
+
+        def formatted_rows() -> Iterator[Optional[List[str]]]:
+            # Formatted lazily, one row per table line
+            for row_idx in range(range_obj.row_count()):
+                if row_idx >= len(values) or (is_sampled and not included[row_idx]):
+                    yield None
+                    continue
+                row = [""] * cols_count
+                for col_idx, (value, text) in enumerate(zip(values[row_idx], formulas[row_idx])):
+                    if col_idx >= cols_count:
+                        break
+                    formula = text if isinstance(text, str) and text.startswith("=") else None
+                    row[col_idx] = format_value(value, formula)
+                yield row
+
+        yield from self._table_lines(formatted_rows(), range_obj, is_sampled)
+
+    def _resolve_strategy(self, cell_count: int, strategy: Optional[str]) -> str:
+        """Pick "full" or "sampled" for a snapshot of cell_count cells."""
         # Determine strategy
         if strategy is None:
             strategy = "auto"
 
-        cell_count = len(cells)
         max_cells = self.snapshot_config.max_cells_per_snapshot
 
         # Auto strategy selection
@@ -70,93 +235,100 @@ class SnapshotGenerator:
             )
             strategy = "sampled"
 
-        # Generate based on strategy
-        if strategy == "sampled":
-            return self._generate_sampled(cells, range_obj)
-        else:
-            return self._generate_full(cells, range_obj)
+        return strategy
 
-    def _generate_full(self, cells: List[Cell], range_obj: Range) -> str:
+    def _generate_full(self, cells: List[Cell], range_obj: Range) -> Iterator[str]:
         """Generate full snapshot with all cells."""
-        lines = []
-
-        # Header
-        lines.append(f"## Snapshot: {range_obj.to_address()}")
-        lines.append(f"")
-        lines.append(f"Size: {range_obj.row_count()} rows x {range_obj.col_count()} columns")
-        lines.append(f"")
+        yield from self._full_header(range_obj)
 
         # Build table
-        table = self._build_table(cells, range_obj)
-        lines.extend(table)
-
-        return "\n".join(lines)
+        yield from self._build_table(cells, range_obj)
 
-    def _generate_sampled(self, cells: List[Cell], range_obj: Range) -> str:
+    def _generate_sampled(self, cells: List[Cell], range_obj: Range) -> Iterator[str]:
         """Generate sampled snapshot for large ranges."""
-        lines = []
-
-        # Header
-        lines.append(f"## Snapshot: {range_obj.to_address()} (Sampled)")
-        lines.append(f"")
-        lines.append(f"Size: {range_obj.row_count()} rows x {range_obj.col_count()} columns")
-        lines.append(f"*Showing sample due to size*")
-        lines.append(f"")
+        yield from self._sampled_header(range_obj)
 
         # Sample cells
         sampled_cells = self._sample_cells(cells, range_obj)
 
         # Build table
-        table = self._build_table(sampled_cells, range_obj, is_sampled=True)
-        lines.extend(table)
+        yield from self._build_table(sampled_cells, range_obj, is_sampled=True)
+
+    @staticmethod
+    def _full_header(range_obj: Range) -> Iterator[str]:
+        """Header lines of a full snapshot."""
+        yield f"## Snapshot: {range_obj.to_address()}"
+        yield ""
+        yield f"Size: {range_obj.row_count()} rows x {range_obj.col_count()} columns"
+        yield ""
 
-        return "\n".join(lines)
+    @staticmethod
+    def _sampled_header(range_obj: Range) -> Iterator[str]:
+        """Header lines of a sampled snapshot."""
+        yield f"## Snapshot: {range_obj.to_address()} (Sampled)"
+        yield ""
+        yield f"Size: {range_obj.row_count()} rows x {range_obj.col_count()} columns"
+        yield "*Showing sample due to size*"
+        yield ""
 
     def _sample_cells(self, cells: List[Cell], range_obj: Range) -> List[Cell]:
         """
-        Sample cells from a large range.
+        Sample cells from a large range (rows per _sampled_row_indices()).
+
+        Cells are in row-major order, so each kept row is one slice.
+        """
+        cols_count = range_obj.col_count()
+        rows_to_include = self._sampled_row_indices(range_obj)
+
+        # Copy the kept rows' slices (no per-cell work)
+        sampled: List[Cell] = []
+        for row_idx, included in enumerate(rows_to_include):
+            if included:
+                start = row_idx * cols_count
+                sampled.extend(cells[start:start + cols_count])
+
+        return sampled
+
+    def _sampled_row_indices(self, range_obj: Range) -> bytearray:
+        """
+        Flag the row offsets (0-based within the range) kept by sampling.
 
         Always includes:
         - First N rows (headers)
         - Last N rows (totals)
         - Every Nth row in between
+
+        Returns:
+            One byte per range row, 1 if the row is kept
         """
         sampling_config = self.snapshot_config.sampling
 
-        rows_per_row = range_obj.col_count()
         total_rows = range_obj.row_count()
 
         # Calculate which rows to include
-        rows_to_include = set()
+        rows_to_include = bytearray(total_rows)
 
         # First N rows
         for i in range(min(sampling_config.always_show_first_n, total_rows)):
-            rows_to_include.add(i)
+            rows_to_include[i] = 1
 
         # Last N rows
         for i in range(max(0, total_rows - sampling_config.always_show_last_n), total_rows):
-            rows_to_include.add(i)
+            rows_to_include[i] = 1
 
         # Sampled rows in between
         sample_every = sampling_config.sample_every_n_rows
         for i in range(sampling_config.always_show_first_n, total_rows - sampling_config.always_show_last_n, sample_every):
-            rows_to_include.add(i)
+            rows_to_include[i] = 1
 
-        # Filter cells
-        sampled = []
-        for idx, cell in enumerate(cells):
-            row_idx = idx // rows_per_row
-            if row_idx in rows_to_include:
-                sampled.append(cell)
-
-        return sampled
+        return rows_to_include
 
     def _build_table(
         self,
         cells: List[Cell],
         range_obj: Range,
         is_sampled: bool = False,
-    ) -> List[str]:
+    ) -> Iterator[str]:
         """
         Build markdown table from cells.
 
@@ -165,53 +337,123 @@ class SnapshotGenerator:
             range_obj: Range info
             is_sampled: Whether this is a sampled view
 
-        Returns:
-            List of markdown table lines
+        Yields:
+            Markdown table lines
         """
-        lines = []
-
         rows_count = range_obj.row_count()
         cols_count = range_obj.col_count()
 
         if rows_count == 0 or cols_count == 0:
-            return ["*Empty range*"]
+            yield "*Empty range*"
+            return
+
+        # Build grid: flat, row-major, plus a flag per row that got a cell
+        if self._is_row_major_block(cells, range_obj):
+            # Already in grid order (as read from Excel) - no parsing needed
+            grid: List[Optional[Cell]] = list(cells)
+            row_has_cells = bytearray(b"\x01") * rows_count
+        else:
+            grid = [None] * (rows_count * cols_count)
+            row_has_cells = bytearray(rows_count)
+
+            col_letter_to_index = self._col_letter_to_index
+            for cell in cells:
+                # Parse cell address to get row/col
+                match = _ADDR_RE.match(cell.address)
+                if match is None:
+                    continue
+
+                # Calculate position in grid
+                row_idx = int(match.group(2)) - range_obj.start_row
+                col_idx = col_letter_to_index(match.group(1)) - range_obj.start_col
+
+                if 0 <= row_idx < rows_count and 0 <= col_idx < cols_count:
+                    grid[row_idx * cols_count + col_idx] = cell
+                    row_has_cells[row_idx] = 1
+
+        format_cell = self._format_cell_value
+
+        def formatted_rows() -> Iterator[Optional[List[str]]]:
+            # Formatted lazily, one row per table line; None if no cells
+            for row_idx in range(rows_count):
+                if not row_has_cells[row_idx]:
+                    yield None
+                    continue
+                start = row_idx * cols_count
+                yield [
+                    "" if cell is None else format_cell(cell)
+                    for cell in grid[start:start + cols_count]
+                ]
+
+        yield from self._table_lines(formatted_rows(), range_obj, is_sampled)
+
+    @staticmethod
+    def _is_row_major_block(cells: List[Cell], range_obj: Range) -> bool:
+        """
+        Check whether cells are exactly the range's cells in row-major order.
+
+        That's how get_range_data() returns them; the comparison runs in C
+        (map/eq over the expected addresses), far cheaper than parsing each
+        address.
+        """
+        cols_count = range_obj.col_count()
+        if not cells or len(cells) != range_obj.row_count() * cols_count:
+            return False
+
+        col_letters = range_obj.col_letters()
+        row_numbers = chain.from_iterable(
+            repeat(str(row), cols_count)
+            for row in range(range_obj.start_row, range_obj.end_row + 1)
+        )
+        expected = map(str.__add__, cycle(col_letters), row_numbers)
+        return all(map(eq, map(attrgetter("address"), cells), expected))
+
+    def _table_lines(
+        self,
+        rows: Iterable[Optional[List[str]]],
+        range_obj: Range,
+        is_sampled: bool = False,
+    ) -> Iterator[str]:
+        """
+        Stream markdown table lines from formatted rows.
 
-        # Build grid
-        grid = [[None for _ in range(cols_count)] for _ in range(rows_count)]
+        Lines are yielded as they are built, so a large table is never
+        held as a list of lines.
 
-        for cell in cells:
-            # Parse cell address to get row/col
-            row_num = int(''.join(filter(str.isdigit, cell.address)))
-            col_letter = ''.join(filter(str.isalpha, cell.address))
+        Args:
+            rows: One entry per range row, in order: formatted cell texts,
+                or None if the row has no cells (skipped when sampled,
+                blank otherwise)
+            range_obj: Range info
+            is_sampled: Whether this is a sampled view
 
-            # Calculate position in grid
-            row_idx = row_num - range_obj.start_row
-            col_idx = self._col_letter_to_index(col_letter) - range_obj.start_col
+        Yields:
+            Markdown table lines
+        """
+        rows_count = range_obj.row_count()
+        cols_count = range_obj.col_count()
 
-            if 0 <= row_idx < rows_count and 0 <= col_idx < cols_count:
-                grid[row_idx][col_idx] = cell
+        if rows_count == 0 or cols_count == 0:
+            yield "*Empty range*"
+            return
 
         # Generate column headers (A, B, C, ...)
-        col_headers = []
-        for col_idx in range(cols_count):
-            actual_col = range_obj.start_col + col_idx
-            col_headers.append(Range._col_index_to_letter(actual_col))
+        col_headers = range_obj.col_letters()
 
         # Header row
-        header = "| " + " | ".join(col_headers) + " |"
-        lines.append(header)
+        yield "| " + " | ".join(col_headers) + " |"
 
         # Separator
-        separator = "|" + "|".join(["---" for _ in range(cols_count)]) + "|"
-        lines.append(separator)
+        yield "|---" * cols_count + "|"
+
+        # Fixed pieces of the empty-row and gap lines, built once per table
+        empty_line = "| " + " | ".join([""] * cols_count) + " |"
+        gap_tail = "| " * (cols_count - 1) + "|"
 
         # Data rows
         last_included_row = -1
-        for row_idx in range(rows_count):
-            row_cells = grid[row_idx]
-
-            # Check if row should be included (if sampled)
-            if is_sampled and not any(row_cells):
+        for row_idx, row_values in enumerate(rows):
+            if row_values is None and is_sampled:
                 # Skip empty rows in sampled view
                 continue
 
@@ -219,24 +461,14 @@ class SnapshotGenerator:
             if is_sampled and row_idx > last_included_row + 1:
                 # Show gap indicator
                 gap_size = row_idx - last_included_row - 1
-                lines.append(f"| *... {gap_size} rows omitted ...* " + "| " * (cols_count - 1) + "|")
+                yield f"| *... {gap_size} rows omitted ...* " + gap_tail
 
             last_included_row = row_idx
 
-            # Format row
-            row_values = []
-            for cell in row_cells:
-                if cell is None:
-                    row_values.append("")
-                else:
-                    # Format cell value
-                    value_str = self._format_cell_value(cell)
-                    row_values.append(value_str)
-
-            row_line = "| " + " | ".join(row_values) + " |"
-            lines.append(row_line)
-
-        return lines
+            if row_values is None:
+                yield empty_line
+            else:
+                yield "| " + " | ".join(row_values) + " |"
 
     def _format_cell_value(self, cell: Cell) -> str:
         """
@@ -245,39 +477,51 @@ class SnapshotGenerator:
         Args:
             cell: Cell to format
 
+        Returns:
+            Formatted string
+        """
+        formula = cell.formula
+        return self._format_value(cell.value, formula.formula_text if formula else None)
+
+    @staticmethod
+    def _format_value(value: Any, formula: Optional[str]) -> str:
+        """
+        Format a cell's value (or formula, if it has one) for display.
+
+        Args:
+            value: Cell value
+            formula: Formula text, or None for constant cells
+
         Returns:
             Formatted string
         """
         # Show formula if present
-        if cell.formula:
-            formula_str = str(cell.formula)
-            value_str = f"{formula_str}"
+        if formula:
             # Add value in parentheses if different
-            if cell.value is not None:
-                value_str += f" `[{cell.value}]`"
-            return value_str
+            if value is not None:
+                return f"{formula} `[{value}]`"
+            return formula
 
         # Show value
-        if cell.value is None or cell.value == "":
+        if value is None or value == "":
             return ""
 
         # Format based on type
-        if isinstance(cell.value, float):
-            # Format numbers nicely
-            if cell.value == int(cell.value):
-                return str(int(cell.value))
-            else:
-                return f"{cell.value:.2f}"
-        else:
-            return str(cell.value)
+        if isinstance(value, float):
+            # Format numbers nicely (is_integer is also safe for inf/nan)
+            if value.is_integer():
+                return str(int(value))
+            return format(value, ".2f")
+        return str(value)
 
     def _empty_snapshot(self, range_obj: Range) -> str:
         """Generate snapshot for empty range."""
         return f"## Snapshot: {range_obj.to_address()}\n\n*Range is empty*"
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _col_letter_to_index(col_letter: str) -> int:
-        """Convert column letter to 0-based index."""
+        """Convert column letter to 0-based index (memoized: columns repeat per row)."""
         col_index = 0
         for char in col_letter.upper():
             col_index = col_index * 26 + (ord(char) - ord('A') + 1)
@@ -1,9 +1,13 @@
 """Workbook discovery service for listing open Excel workbooks."""
 
+import os
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import xlwings as xw
 
@@ -12,6 +16,52 @@ from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Back-to-back discovery calls (e.g. find_by_path then find_by_name) reuse
+# one COM walk for this long
+_DISCOVERY_TTL_SECONDS = 0.5
+# (time discovered, workbooks) from the last successful discovery
+_discovery_cache: Optional[Tuple[float, List["WorkbookInfo"]]] = None
+# Threads used to resolve/stat workbook files (slow on network drives)
+_FILE_DETAIL_WORKERS = 8
+
+
+def _normalize_path(path: str) -> str:
+    """
+    Resolve a path to the form used for workbook path comparisons.
+
+    Case-folded on case-insensitive filesystems (Windows). Falls back to
+    the unresolved path when it cannot be resolved (e.g. a cloud URL).
+
+    Args:
+        path: File path
+
+    Returns:
+        Normalized path string
+    """
+    try:
+        return os.path.normcase(str(Path(path).resolve()))
+    except (OSError, RuntimeError, ValueError):
+        return os.path.normcase(path)
+
+
+def _read_file_details(info: "WorkbookInfo") -> None:
+    """
+    Fill in resolved_path and modified_time from the filesystem.
+
+    Touches no COM objects, so it is safe to run on a worker thread.
+
+    Args:
+        info: Workbook to update in place
+    """
+    info.resolved_path = _normalize_path(info.full_path)
+
+    # Modification time needs a saved file; a missing one surfaces as OSError
+    if info.is_saved and info.full_path != info.workbook_name:
+        try:
+            info.modified_time = datetime.fromtimestamp(os.path.getmtime(info.full_path))
+        except (OSError, ValueError):
+            pass
+
 
 @dataclass
 class WorkbookInfo:
@@ -23,6 +73,7 @@ class WorkbookInfo:
     sheet_count: int  # Number of sheets
     is_saved: bool  # Whether workbook has unsaved changes
     modified_time: Optional[datetime] = None  # Last modification time
+    resolved_path: Optional[str] = None  # Normalized full_path for comparisons
     app_instance: Optional[any] = None  # xlwings app instance (not serialised)
     workbook_instance: Optional[any] = None  # xlwings workbook instance (not serialised)
 
@@ -44,66 +95,82 @@ class WorkbookDiscovery:
         """
         List all open Excel workbooks across all Excel instances.
 
+        Results are reused for _DISCOVERY_TTL_SECONDS, so lookups made in
+        quick succession walk Excel only once. Call invalidate() after
+        opening or closing workbooks to force a fresh walk.
+
         Returns:
             List of WorkbookInfo objects
 
         Raises:
             ExcelConnectionError: If no Excel instances are running
         """
+        global _discovery_cache
+
+        cached = _discovery_cache
+        if cached is not None and time.monotonic() - cached[0] < _DISCOVERY_TTL_SECONDS:
+            return list(cached[1])
+
+        workbooks = WorkbookDiscovery._discover_workbooks()
+        _discovery_cache = (time.monotonic(), workbooks)
+        return list(workbooks)
+
+    @staticmethod
+    def invalidate() -> None:
+        """Drop the cached discovery result."""
+        global _discovery_cache
+        _discovery_cache = None
+
+    @staticmethod
+    def _discover_workbooks() -> List[WorkbookInfo]:
+        """
+        Walk all Excel instances and their open workbooks over COM.
+
+        Returns:
+            List of WorkbookInfo objects
+
+        Raises:
+            ExcelConnectionError: If no workbooks can be discovered
+        """
         workbooks: List[WorkbookInfo] = []
         excel_instance_count = 0
         total_books_attempted = 0
         access_errors = []
 
         try:
-            # Get all Excel application instances
-            apps = xw.apps
-            excel_instances = list(apps)  # Convert to list to count
-            excel_instance_count = len(excel_instances)
-
-            logger.debug(f"Found {excel_instance_count} Excel instance(s)")
-
-            if excel_instance_count == 0:
-                raise ExcelConnectionError(
-                    "No Excel instances running. Please open Excel first."
-                )
-
-            # Iterate through all app instances
-            for app in excel_instances:
+            # Iterate through all Excel application instances, counting as we
+            # go rather than materializing the COM collections up front
+            for app in xw.apps:
+                excel_instance_count += 1
                 try:
                     pid = app.pid
-                    books_in_app = list(app.books)  # Convert to list to count
-                    book_count = len(books_in_app)
-                    total_books_attempted += book_count
-
-                    logger.debug(f"Excel PID {pid}: {book_count} workbook(s)")
-
-                    if book_count == 0:
-                        logger.debug(f"Excel instance PID {pid} has no open workbooks")
-                        continue
+                    book_count = 0
 
                     # Iterate through all workbooks in this app
-                    for book in books_in_app:
+                    for book in app.books:
+                        book_count += 1
+                        total_books_attempted += 1
                         try:
-                            # Get workbook details
+                            # Each property read is a COM round trip to Excel,
+                            # so read every one exactly once
+                            book_api = book.api
+                            name = book_api.Name
+                            # xlwings' fullname maps cloud URLs to local paths
+                            fullname = book.fullname
+
+                            # Get workbook details (file details are read below)
                             info = WorkbookInfo(
                                 excel_pid=pid,
-                                workbook_name=book.name,
-                                full_path=book.fullname if book.fullname else book.name,
-                                sheet_count=len(book.sheets),
-                                is_saved=book.api.Saved,
+                                workbook_name=name,
+                                full_path=fullname if fullname else name,
+                                sheet_count=book_api.Sheets.Count,
+                                is_saved=book_api.Saved,
                                 app_instance=app,
                                 workbook_instance=book,
                             )
 
-                            # Try to get modification time (file must be saved)
-                            if book.api.Saved and book.fullname and Path(book.fullname).exists():
-                                info.modified_time = datetime.fromtimestamp(
-                                    Path(book.fullname).stat().st_mtime
-                                )
-
                             workbooks.append(info)
-                            logger.debug(f"Successfully accessed workbook: {book.name} (PID {pid})")
+                            logger.debug(f"Successfully accessed workbook: {name} (PID {pid})")
 
                         except Exception as e:
                             # Track access errors for better error reporting
@@ -112,11 +179,18 @@ class WorkbookDiscovery:
                             logger.warning(f"Could not access workbook: {error_msg}")
                             continue
 
+                    if book_count == 0:
+                        logger.debug(f"Excel instance PID {pid} has no open workbooks")
+                    else:
+                        logger.debug(f"Excel PID {pid}: {book_count} workbook(s)")
+
                 except Exception as e:
                     # Skip this app instance if we can't read it
                     logger.warning(f"Could not access Excel instance: {e}")
                     continue
 
+            logger.debug(f"Found {excel_instance_count} Excel instance(s)")
+
             # Provide detailed error message based on what we found
             if not workbooks:
                 if excel_instance_count == 0:
@@ -141,6 +215,19 @@ class WorkbookDiscovery:
                         "but could not access any workbooks."
                     )
 
+            # COM proxies belong to this thread, so only the filesystem
+            # lookups (independent per workbook) are spread over workers
+            if len(workbooks) > 1:
+                workers = min(_FILE_DETAIL_WORKERS, len(workbooks))
+                with ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="workbook-stat"
+                ) as pool:
+                    for _ in pool.map(_read_file_details, workbooks):
+                        pass
+            else:
+                for info in workbooks:
+                    _read_file_details(info)
+
             logger.info(f"Successfully discovered {len(workbooks)} workbook(s)")
             return workbooks
 
@@ -165,20 +252,15 @@ class WorkbookDiscovery:
         """
         all_workbooks = WorkbookDiscovery.list_all_workbooks()
 
-        # Normalize paths for comparison
-        target_path = Path(full_path).resolve()
-
-        matches = []
-        for wb_info in all_workbooks:
-            try:
-                wb_path = Path(wb_info.full_path).resolve()
-                if wb_path == target_path:
-                    matches.append(wb_info)
-            except Exception:
-                # Skip if path can't be resolved
-                continue
+        # Workbook paths were normalized during discovery, so only the
+        # target needs resolving here
+        target_path = _normalize_path(full_path)
 
-        return matches
+        return [
+            wb_info
+            for wb_info in all_workbooks
+            if (wb_info.resolved_path or _normalize_path(wb_info.full_path)) == target_path
+        ]
 
     @staticmethod
     def find_by_name(workbook_name: str) -> List[WorkbookInfo]:
@@ -216,15 +298,11 @@ class WorkbookDiscovery:
         Returns:
             Dictionary mapping full_path -> list of WorkbookInfo objects
         """
-        groups: dict[str, List[WorkbookInfo]] = {}
-
+        groups: defaultdict[str, List[WorkbookInfo]] = defaultdict(list)
         for wb_info in workbooks:
-            path = wb_info.full_path
-            if path not in groups:
-                groups[path] = []
-            groups[path].append(wb_info)
+            groups[wb_info.full_path].append(wb_info)
 
-        return groups
+        return dict(groups)
 
     @staticmethod
     def has_duplicates(workbooks: List[WorkbookInfo]) -> bool:
@@ -237,8 +315,13 @@ class WorkbookDiscovery:
         Returns:
             True if duplicates exist
         """
-        groups = WorkbookDiscovery.group_duplicates(workbooks)
-        return any(len(group) > 1 for group in groups.values())
+        # Stops at the first repeated path instead of grouping everything
+        seen: set[str] = set()
+        for wb_info in workbooks:
+            if wb_info.full_path in seen:
+                return True
+            seen.add(wb_info.full_path)
+        return False
 
     @staticmethod
     def get_duplicate_paths(workbooks: List[WorkbookInfo]) -> List[str]:
@@ -251,5 +334,5 @@ class WorkbookDiscovery:
         Returns:
             List of file paths that appear multiple times
         """
-        groups = WorkbookDiscovery.group_duplicates(workbooks)
-        return [path for path, group in groups.items() if len(group) > 1]
+        counts = Counter(wb_info.full_path for wb_info in workbooks)
+        return [path for path, count in counts.items() if count > 1]
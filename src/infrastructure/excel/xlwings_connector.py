@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     import xlwings as xw
@@ -292,6 +292,23 @@ class XlwingsConnector:
         except Exception as e:
             raise ExcelConnectionError(f"Failed to get active sheet: {e}")
 
+    def has_unsaved_changes(self) -> bool:
+        """
+        Check whether the workbook has edits not yet saved to disk.
+
+        Returns:
+            True if Excel reports unsaved changes
+
+        Raises:
+            ExcelConnectionError: If not connected
+        """
+        self._ensure_connected()
+
+        try:
+            return not self._workbook.api.Saved
+        except Exception as e:
+            raise ExcelConnectionError(f"Failed to read workbook saved state: {e}")
+
     def get_cell(self, address: CellAddress, sheet: Optional[SheetName] = None) -> Cell:
         """
         Get single cell data.
@@ -327,7 +344,9 @@ class XlwingsConnector:
 
             # Get formula
             formula_text = xw_cell.formula
-            formula = Formula(formula_text) if formula_text and formula_text.startswith("=") else None
+            formula = None
+            if formula_text and formula_text.startswith("="):
+                formula = Formula.parse(formula_text)
 
             # Determine data type
             data_type = self._get_data_type(value)
@@ -438,7 +457,7 @@ class XlwingsConnector:
                     logger.debug(f"Could not access formula at row {row_idx}, col {col_idx}: {e}")
 
                 formula = (
-                    Formula(formula_text)
+                    Formula.parse(formula_text)
                     if formula_text and isinstance(formula_text, str) and formula_text.startswith("=")
                     else None
                 )
@@ -464,6 +483,152 @@ class XlwingsConnector:
 
         return cells
 
+    def _xw_range(self, range_obj: Range) -> Tuple[SheetName, str, Any]:
+        """
+        Look up the xlwings range for a Range model.
+
+        Returns:
+            Tuple of (sheet name, address without sheet, xlwings range)
+
+        Raises:
+            SheetNotFoundError: If sheet doesn't exist
+            InvalidRangeError: If range is invalid
+        """
+        self._ensure_connected()
+
+        sheet_name = range_obj.sheet
+        if sheet_name is None:
+            sheet_name = self.get_active_sheet()
+
+        try:
+            xw_sheet = self._workbook.sheets[sheet_name]
+        except KeyError:
+            raise SheetNotFoundError(f"Sheet '{sheet_name}' not found")
+
+        range_address = range_obj.to_address(include_sheet=False)
+
+        try:
+            return sheet_name, range_address, xw_sheet.range(range_address)
+        except Exception as e:
+            raise InvalidRangeError(f"Failed to access range {range_address}: {e}")
+
+    def read_values(self, range_obj: Range) -> List[List[Any]]:
+        """
+        Read a range's values as a 2D grid in one bulk read.
+
+        Args:
+            range_obj: Range to read
+
+        Returns:
+            Row-major list of rows of cell values
+
+        Raises:
+            SheetNotFoundError: If sheet doesn't exist
+            InvalidRangeError: If range is invalid or values can't be read
+        """
+        _, range_address, xw_range = self._xw_range(range_obj)
+
+        try:
+            return xw_range.options(ndim=2).value
+        except Exception as e:
+            raise InvalidRangeError(f"Failed to read values from range {range_address}: {e}")
+
+    def read_block(
+        self, range_obj: Range
+    ) -> Tuple[List[List[Any]], List[List[Any]]]:
+        """
+        Read a range's values and formulas as two 2D grids.
+
+        One bulk read per property and no Cell objects, for callers that
+        only render the data (e.g. snapshots).
+
+        Args:
+            range_obj: Range to read
+
+        Returns:
+            Tuple of (values, formulas), both row-major lists of rows. A
+            formula entry is the formula text, or the cell's constant for
+            non-formula cells; all None if formulas couldn't be read.
+
+        Raises:
+            SheetNotFoundError: If sheet doesn't exist
+            InvalidRangeError: If range is invalid or values can't be read
+        """
+        sheet_name, range_address, xw_range = self._xw_range(range_obj)
+
+        try:
+            values = xw_range.options(ndim=2).value
+        except Exception as e:
+            raise InvalidRangeError(f"Failed to read values from range {range_address}: {e}")
+
+        try:
+            formulas = xw_range.formula
+        except Exception as e:
+            logger.warning(f"Failed to read formulas from range {sheet_name}!{range_address}: {e}")
+            formulas = None
+
+        # Normalize to 2D (single cells and single rows come back flat)
+        if formulas is None:
+            formulas = [[None] * len(row) for row in values]
+        elif not isinstance(formulas, (list, tuple)):
+            formulas = [[formulas]]
+        elif formulas and not isinstance(formulas[0], (list, tuple)):
+            formulas = [formulas]
+
+        logger.debug(f"Read block {sheet_name}!{range_address}")
+
+        return values, formulas
+
+    def get_formula_arrays(
+        self, range_obj: Range
+    ) -> Tuple[List[CellAddress], List[str]]:
+        """
+        Get the formulas in a range as parallel address/formula lists.
+
+        Lighter than get_range_data() when only formulas are needed: values
+        aren't read from Excel and no Cell objects are created. Cells
+        without a formula are left out.
+
+        Args:
+            range_obj: Range to read
+
+        Returns:
+            Tuple of (cell addresses, formula texts), index-aligned
+
+        Raises:
+            SheetNotFoundError: If sheet doesn't exist
+            InvalidRangeError: If range is invalid or can't be read
+        """
+        sheet_name, range_address, xw_range = self._xw_range(range_obj)
+
+        try:
+            formulas = xw_range.formula
+        except Exception as e:
+            raise InvalidRangeError(f"Failed to read formulas from range {range_address}: {e}")
+
+        # Normalize to 2D (single cells and single rows come back flat)
+        if not isinstance(formulas, (list, tuple)):
+            formulas = [[formulas]]
+        elif formulas and not isinstance(formulas[0], (list, tuple)):
+            formulas = [formulas]
+
+        col_letters = range_obj.col_letters()
+
+        addresses: List[CellAddress] = []
+        texts: List[str] = []
+        for row_num, row in enumerate(formulas, start=range_obj.start_row):
+            for col_letter, text in zip(col_letters, row):
+                # Non-formula cells come back as their constant (or "")
+                if isinstance(text, str) and text.startswith("="):
+                    addresses.append(f"{col_letter}{row_num}")
+                    texts.append(text)
+
+        logger.debug(
+            f"Read {len(texts)} formulas from {sheet_name}!{range_address}"
+        )
+
+        return addresses, texts
+
     @staticmethod
     def _get_data_type(value: Any) -> str:
         """Determine data type of cell value."""
@@ -7,6 +7,49 @@ from src.domain.models.dependency import DependencyTree
 from src.domain.models.query import LLMContext
 from src.domain.models.selection import Selection
 
+# System prompts by mode, built once at import
+_SYSTEM_PROMPTS = {
+    "educational": """You are an expert financial analyst and Excel specialist helping someone understand complex risk management spreadsheets.
+
+Your role:
+- Explain calculations in terms of financial concepts and business logic
+- Focus on the "why" and "what" rather than just the "how"
+- Use clear, educational language
+- Connect Excel formulas to their business meaning
+- Explain financial concepts when relevant (VaR, Greeks, P&L, etc.)
+
+Guidelines:
+- Start with the high-level purpose before diving into details
+- Explain dependencies and how data flows through calculations
+- Highlight key assumptions or important aspects
+- Use examples when helpful
+- Be thorough but accessible""",
+    "technical": """You are an Excel and financial engineering expert providing technical analysis.
+
+Your role:
+- Provide precise technical explanations of formulas and calculations
+- Explain mathematical relationships and dependencies
+- Highlight formula structure and logic
+- Note any technical issues or edge cases
+
+Guidelines:
+- Be precise and technical
+- Focus on accuracy and completeness
+- Explain formula syntax and functions used
+- Highlight dependencies and data flow""",
+    "concise": """You are an expert providing quick, direct answers about Excel calculations.
+
+Your role:
+- Provide brief, accurate answers
+- Focus on the essentials
+- Be direct and clear
+
+Guidelines:
+- Keep responses short
+- Answer the specific question asked
+- Avoid unnecessary detail""",
+}
+
 
 class PromptBuilder:
     """
@@ -71,23 +114,25 @@ class PromptBuilder:
         return context
 
     @staticmethod
-    def _format_dependency_tree(tree: DependencyTree) -> str:
+    def _format_dependency_tree(tree: DependencyTree, max_depth: Optional[int] = None) -> str:
         """
         Format dependency tree for prompt.
 
         Args:
             tree: Dependency tree to format
+            max_depth: Cut the tree below this depth (None for the whole tree)
 
         Returns:
             Formatted string representation
         """
+        depth = tree.max_depth if max_depth is None else max_depth
         lines = [
-            f"Dependency Tree ({tree.direction}, depth={tree.max_depth}):",
+            f"Dependency Tree ({tree.direction}, depth={depth}):",
             "",
         ]
 
         # Add tree lines
-        lines.extend(tree.to_lines())
+        lines.extend(tree.iter_lines(max_depth))
 
         return "\n".join(lines)
 
@@ -102,46 +147,4 @@ class PromptBuilder:
         Returns:
             System prompt string
         """
-        prompts = {
-            "educational": """You are an expert financial analyst and Excel specialist helping someone understand complex risk management spreadsheets.
-
-Your role:
-- Explain calculations in terms of financial concepts and business logic
-- Focus on the "why" and "what" rather than just the "how"
-- Use clear, educational language
-- Connect Excel formulas to their business meaning
-- Explain financial concepts when relevant (VaR, Greeks, P&L, etc.)
-
-Guidelines:
-- Start with the high-level purpose before diving into details
-- Explain dependencies and how data flows through calculations
-- Highlight key assumptions or important aspects
-- Use examples when helpful
-- Be thorough but accessible""",
-            "technical": """You are an Excel and financial engineering expert providing technical analysis.
-
-Your role:
-- Provide precise technical explanations of formulas and calculations
-- Explain mathematical relationships and dependencies
-- Highlight formula structure and logic
-- Note any technical issues or edge cases
-
-Guidelines:
-- Be precise and technical
-- Focus on accuracy and completeness
-- Explain formula syntax and functions used
-- Highlight dependencies and data flow""",
-            "concise": """You are an expert providing quick, direct answers about Excel calculations.
-
-Your role:
-- Provide brief, accurate answers
-- Focus on the essentials
-- Be direct and clear
-
-Guidelines:
-- Keep responses short
-- Answer the specific question asked
-- Avoid unnecessary detail""",
-        }
-
-        return prompts.get(mode, prompts["educational"])
+        return _SYSTEM_PROMPTS.get(mode, _SYSTEM_PROMPTS["educational"])
@@ -1,8 +1,11 @@
 """Base LLM provider interface."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
 
 from src.domain.models.query import LLMContext, LLMResponse
+from src.shared.exceptions import LLMProviderError
 
 
 class BaseLLMProvider(ABC):
@@ -29,6 +32,74 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def aquery(self, context: LLMContext, system_prompt: str = "") -> LLMResponse:
+        """
+        Query the LLM asynchronously.
+
+        The default implementation runs the blocking query() in a worker
+        thread so concurrent callers don't block the event loop. Providers
+        with a native async client should override this.
+
+        Args:
+            context: LLM context with question and supporting information
+            system_prompt: Optional system prompt
+
+        Returns:
+            LLM response
+
+        Raises:
+            LLMProviderError: If query fails
+        """
+        return await asyncio.to_thread(self.query, context, system_prompt)
+
+    def supports_batch(self) -> bool:
+        """
+        Check if provider supports batch (offline, discounted) queries.
+
+        Returns:
+            True if submit_batch/get_batch_results are implemented
+        """
+        return False
+
+    def supports_response_memo(self) -> bool:
+        """
+        Check if identical queries may be answered from memory.
+
+        Returns:
+            True unless each query needs a fresh (e.g. interactive) answer
+        """
+        return True
+
+    def submit_batch(self, requests: Dict[str, Tuple[LLMContext, str]]) -> str:
+        """
+        Submit many queries as a single batch job.
+
+        Args:
+            requests: Mapping of custom_id -> (context, system_prompt)
+
+        Returns:
+            Batch ID used to collect results later
+
+        Raises:
+            LLMProviderError: If provider doesn't support batches or submit fails
+        """
+        raise LLMProviderError(f"Provider '{self.get_name()}' does not support batch queries")
+
+    def get_batch_results(self, batch_id: str) -> Optional[Dict[str, LLMResponse]]:
+        """
+        Get results of a submitted batch.
+
+        Args:
+            batch_id: Batch ID returned by submit_batch()
+
+        Returns:
+            Mapping of custom_id -> response, or None if batch is still running
+
+        Raises:
+            LLMProviderError: If provider doesn't support batches or batch failed
+        """
+        raise LLMProviderError(f"Provider '{self.get_name()}' does not support batch queries")
+
     @abstractmethod
     def is_available(self) -> bool:
         """
@@ -1,5 +1,7 @@
 """Manual LLM provider using file-based interaction."""
 
+import asyncio
+import threading
 from pathlib import Path
 
 from src.domain.models.query import LLMContext, LLMResponse
@@ -28,6 +30,7 @@ class ManualLLMProvider(BaseLLMProvider):
         """
         self.input_file = Path(input_file)
         self.output_file = Path(output_file)
+        self._lock = threading.Lock()
 
     def query(self, context: LLMContext, system_prompt: str = "") -> LLMResponse:
         """
@@ -99,6 +102,31 @@ class ManualLLMProvider(BaseLLMProvider):
         except Exception as e:
             raise LLMProviderError(f"Manual provider failed: {e}")
 
+    async def aquery(self, context: LLMContext, system_prompt: str = "") -> LLMResponse:
+        """
+        Query asynchronously, one prompt at a time.
+
+        All queries share the same input/output file pair and need the user
+        to paste a response, so concurrent calls are serialised.
+
+        Args:
+            context: LLM context
+            system_prompt: Optional system prompt
+
+        Returns:
+            LLM response
+        """
+        return await asyncio.to_thread(self._query_locked, context, system_prompt)
+
+    def _query_locked(self, context: LLMContext, system_prompt: str) -> LLMResponse:
+        """Run query() while holding the file lock."""
+        with self._lock:
+            return self.query(context, system_prompt)
+
+    def supports_response_memo(self) -> bool:
+        """Each manual query is answered interactively, so never memoize it."""
+        return False
+
     def is_available(self) -> bool:
         """Check if manual provider is available (always true)."""
         return True
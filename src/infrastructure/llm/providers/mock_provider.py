@@ -1,7 +1,11 @@
 """Mock LLM provider for testing."""
 
+import uuid
+from typing import Dict, Optional, Tuple
+
 from src.domain.models.query import LLMContext, LLMResponse
 from src.infrastructure.llm.providers.base_provider import BaseLLMProvider
+from src.shared.exceptions import LLMProviderError
 
 
 class MockLLMProvider(BaseLLMProvider):
@@ -22,6 +26,7 @@ class MockLLMProvider(BaseLLMProvider):
         self.last_context: LLMContext | None = None
         self.last_system_prompt: str = ""
         self.call_count = 0
+        self._batches: Dict[str, Dict[str, LLMResponse]] = {}
 
     def query(self, context: LLMContext, system_prompt: str = "") -> LLMResponse:
         """
@@ -46,6 +51,41 @@ class MockLLMProvider(BaseLLMProvider):
             model="mock-model-v1",
         )
 
+    def supports_batch(self) -> bool:
+        """Mock provider supports batches (completed immediately)."""
+        return True
+
+    def submit_batch(self, requests: Dict[str, Tuple[LLMContext, str]]) -> str:
+        """
+        Run all queries immediately and store results under a new batch ID.
+
+        Args:
+            requests: Mapping of custom_id -> (context, system_prompt)
+
+        Returns:
+            Batch ID
+        """
+        batch_id = f"mock-batch-{uuid.uuid4().hex[:12]}"
+        self._batches[batch_id] = {
+            custom_id: self.query(context, system_prompt)
+            for custom_id, (context, system_prompt) in requests.items()
+        }
+        return batch_id
+
+    def get_batch_results(self, batch_id: str) -> Optional[Dict[str, LLMResponse]]:
+        """
+        Get stored batch results.
+
+        Args:
+            batch_id: Batch ID returned by submit_batch()
+
+        Returns:
+            Mapping of custom_id -> response
+        """
+        if batch_id not in self._batches:
+            raise LLMProviderError(f"Unknown batch: {batch_id}")
+        return self._batches[batch_id]
+
     def is_available(self) -> bool:
         """Mock provider is always available."""
         return True
@@ -0,0 +1,105 @@
+"""Rate limiting and retry helpers for async LLM calls."""
+
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Optional, Tuple, Type, TypeVar
+
+from src.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncRateLimiter:
+    """
+    Token-bucket rate limiter for coroutines.
+
+    Allows bursts of up to max_rate calls, refilling at max_rate per
+    time_period. Safe to reuse across event loops (e.g. repeated
+    asyncio.run calls).
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        """
+        Initialize rate limiter.
+
+        Args:
+            max_rate: Calls allowed per time period
+            time_period: Period length in seconds
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._refill_rate = max_rate / time_period
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def acquire(self) -> None:
+        """Wait until a call is allowed."""
+        async with self._get_lock():
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.max_rate, self._tokens + (now - self._updated) * self._refill_rate
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._refill_rate)
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Get a lock bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+
+async def retry_async(
+    func: Callable[[], Awaitable[T]],
+    retry_on: Tuple[Type[BaseException], ...],
+    max_attempts: int = 6,
+    min_wait: float = 1.0,
+    max_wait: float = 32.0,
+) -> T:
+    """
+    Call a coroutine function, retrying with jittered exponential backoff.
+
+    The wait before retry n is uniform in [0, min(max_wait, min_wait * 2**n)],
+    floored at min_wait.
+
+    Args:
+        func: Zero-argument coroutine function to call
+        retry_on: Exception types that trigger a retry
+        max_attempts: Total attempts including the first
+        min_wait: Minimum wait between attempts in seconds
+        max_wait: Maximum wait between attempts in seconds
+
+    Returns:
+        Result of func
+
+    Raises:
+        The last exception if all attempts fail, or any non-retryable exception
+    """
+    attempt = 1
+    while True:
+        try:
+            return await func()
+        except retry_on as e:
+            if attempt >= max_attempts:
+                raise
+
+            delay = max(min_wait, random.uniform(0, min(max_wait, min_wait * 2**attempt)))
+            logger.warning(
+                f"LLM call failed (attempt {attempt}/{max_attempts}): {e}. "
+                f"Retrying in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
@@ -0,0 +1,143 @@
+"""Semantic cache for LLM responses."""
+
+import math
+import re
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from src.domain.models.query import LLMResponse
+from src.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+_TOKEN_RE = re.compile(r"[a-z0-9$!:]+")
+
+
+@dataclass
+class _CacheEntry:
+    """Cached response with its question vector."""
+
+    scope: str
+    vector: Counter
+    norm: float
+    response: LLMResponse
+
+
+class SemanticCache:
+    """
+    LRU cache of LLM responses that also matches paraphrased questions.
+
+    Entries are grouped by a scope key (a digest of everything sent to the
+    LLM except the question). Within a scope, a question is a hit if its
+    cosine similarity to a cached question is at least the threshold.
+    Questions are compared as bags of lowercase tokens, so "explain this"
+    and "Explain this please" match while different selections never do.
+    Word order and negation are ignored too ("Is A1 greater than B1?"
+    matches "Is B1 greater than A1?"), which is why it is opt-in.
+    """
+
+    def __init__(self, threshold: float = 0.93, max_entries: int = 256):
+        """
+        Initialize semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit (0-1)
+            max_entries: Maximum cached responses before LRU eviction
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], _CacheEntry]" = OrderedDict()
+
+    def get(self, scope: str, question: str) -> Optional[LLMResponse]:
+        """
+        Look up a cached response.
+
+        Args:
+            scope: Digest of the non-question context
+            question: User's question
+
+        Returns:
+            Cached response or None on miss
+        """
+        key = (scope, self._normalize(question))
+
+        # Exact match
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry.response
+
+        # Similarity match within the same scope
+        vector = self._vectorize(question)
+        norm = self._norm(vector)
+        if norm == 0:
+            return None
+
+        best_key = None
+        best_sim = 0.0
+        for entry_key, entry in self._entries.items():
+            if entry.scope != scope or entry.norm == 0:
+                continue
+            sim = self._dot(vector, entry.vector) / (norm * entry.norm)
+            if sim > best_sim:
+                best_key, best_sim = entry_key, sim
+
+        if best_key is None or best_sim < self.threshold:
+            return None
+
+        logger.debug(f"Semantic cache hit (similarity {best_sim:.3f})")
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key].response
+
+    def put(self, scope: str, question: str, response: LLMResponse) -> None:
+        """
+        Store a response.
+
+        Args:
+            scope: Digest of the non-question context
+            question: User's question
+            response: LLM response to cache
+        """
+        key = (scope, self._normalize(question))
+        vector = self._vectorize(question)
+        self._entries[key] = _CacheEntry(
+            scope=scope,
+            vector=vector,
+            norm=self._norm(vector),
+            response=response,
+        )
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of cached responses."""
+        return len(self._entries)
+
+    @staticmethod
+    def _normalize(question: str) -> str:
+        """Normalize question text for exact matching."""
+        return " ".join(question.lower().split())
+
+    @staticmethod
+    def _vectorize(question: str) -> Counter:
+        """Convert question to a token-count vector."""
+        return Counter(_TOKEN_RE.findall(question.lower()))
+
+    @staticmethod
+    def _norm(vector: Dict[str, int]) -> float:
+        """Euclidean norm of a sparse vector."""
+        return math.sqrt(sum(v * v for v in vector.values()))
+
+    @staticmethod
+    def _dot(a: Dict[str, int], b: Dict[str, int]) -> float:
+        """Dot product of two sparse vectors."""
+        if len(a) > len(b):
+            a, b = b, a
+        return sum(v * b.get(k, 0) for k, v in a.items())
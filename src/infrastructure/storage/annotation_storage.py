@@ -2,7 +2,12 @@
 
 import json
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Iterable, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
 
 from src.domain.models.annotation import Annotation
 from src.domain.models.selection import Range
@@ -12,6 +17,25 @@ from src.shared.types import SheetName
 
 logger = get_logger(__name__)
 
+_JSON_DECODE_ERRORS = (json.JSONDecodeError,) + ((orjson.JSONDecodeError,) if orjson else ())
+
+
+def _dump_json(data: Any, path: Path) -> None:
+    """Write data as indented JSON, using orjson when available."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
+
+def _load_json(path: Path) -> Any:
+    """Read JSON from file, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r") as f:
+        return json.load(f)
+
 
 class AnnotationStorage:
     """
@@ -67,8 +91,7 @@ class AnnotationStorage:
             }
 
             # Save to file
-            with open(storage_path, "w") as f:
-                json.dump(data, f, indent=2)
+            _dump_json(data, storage_path)
 
             logger.info(
                 f"Saved {len(annotations)} annotations to: {storage_path}"
@@ -98,8 +121,7 @@ class AnnotationStorage:
                 return []
 
             # Load data
-            with open(storage_path, "r") as f:
-                data = json.load(f)
+            data = _load_json(storage_path)
 
             # Deserialize annotations
             annotations = [
@@ -115,7 +137,7 @@ class AnnotationStorage:
 
         except FileNotFoundError:
             return []
-        except json.JSONDecodeError as e:
+        except _JSON_DECODE_ERRORS as e:
             logger.warning(f"Invalid annotations file format: {e}")
             return []
         except Exception as e:
@@ -145,6 +167,34 @@ class AnnotationStorage:
         # Save back
         self.save(annotations, workbook_path)
 
+    def add_many(
+        self,
+        annotations: Iterable[Annotation],
+        workbook_path: str,
+    ) -> int:
+        """
+        Add several annotations with a single read and write of the file.
+
+        Args:
+            annotations: Annotations to add
+            workbook_path: Path to Excel workbook
+
+        Returns:
+            Number of annotations added
+
+        Raises:
+            AnnotationError: If operation fails
+        """
+        new_annotations = list(annotations)
+        if not new_annotations:
+            return 0
+
+        existing = self.load(workbook_path)
+        existing.extend(new_annotations)
+        self.save(existing, workbook_path)
+
+        return len(new_annotations)
+
     def remove(
         self,
         range_obj: Range,
@@ -2,22 +2,92 @@
 
 import hashlib
 import json
+import pickle
+import zlib
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional
 
-from src.domain.models.dependency import DependencyGraph, DependencyNode
-from src.shared.exceptions import CacheError
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # Fall back to zlib
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None  # Fall back to pickle
+
+from src.domain.models.dependency import DependencyGraph
+from src.shared.exceptions import CacheError, DependencyGraphError
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Compressed graph files get a codec-specific suffix so a zlib file is never
+# handed to zstd (or vice versa) when zstandard is installed/removed.
+_GRAPH_SUFFIX = ".pkl.zst" if zstandard is not None else ".pkl.gz"
+
+# Graph files start with this magic plus one byte naming the encoding of the
+# (compressed) columns that follow: b"m" msgpack, b"p" pickle. Files in
+# another layout (e.g. older whole-graph pickles) are ignored and rebuilt.
+_GRAPH_MAGIC = b"XSGRAPH1"
+
+_DECODE_ERRORS = (
+    pickle.UnpicklingError, zlib.error, EOFError, ValueError, KeyError, TypeError
+) + (
+    (zstandard.ZstdError,) if zstandard is not None else ()
+) + (
+    (msgpack.ExtraData, msgpack.FormatError, msgpack.StackError) if msgpack is not None else ()
+)
+
+
+def _compress(data: bytes) -> bytes:
+    """Compress graph bytes with zstd when available, otherwise zlib."""
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress(data: bytes) -> bytes:
+    """Reverse _compress."""
+    if zstandard is not None:
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+def _encode(columns: Dict) -> bytes:
+    """Serialize graph columns (msgpack when available, otherwise pickle)."""
+    if msgpack is not None:
+        return _GRAPH_MAGIC + b"m" + _compress(msgpack.packb(columns, use_bin_type=True))
+    return _GRAPH_MAGIC + b"p" + _compress(pickle.dumps(columns, protocol=5))
+
+
+def _decode(data: bytes) -> Optional[Dict]:
+    """Reverse _encode; None if the data is in another format."""
+    header = len(_GRAPH_MAGIC)
+    if data[:header] != _GRAPH_MAGIC:
+        return None
+
+    encoding = data[header:header + 1]
+    payload = data[header + 1:]
+    if encoding == b"m" and msgpack is not None:
+        return msgpack.unpackb(_decompress(payload), raw=False)
+    if encoding == b"p":
+        return pickle.loads(_decompress(payload))
+    return None
+
 
 class GraphCache:
     """
     Manages caching of dependency graphs to disk.
 
-    Caches are stored as JSON files with metadata about freshness.
+    Graphs are stored as flat columns (node fields as parallel lists, CSR
+    arrays as raw bytes), encoded with msgpack when installed (pickle
+    otherwise) and compressed. Loading rebuilds the frozen graph straight
+    from the columns. A JSON side file holds metadata about freshness.
+    Cache files are only ever written by this class, so unpickling them is
+    trusted.
     """
 
     def __init__(self, cache_dir: str = ".cache"):
@@ -40,10 +110,7 @@ class GraphCache:
         Returns:
             Path to cache file
         """
-        # Create safe filename from workbook path
-        workbook_name = Path(workbook_path).stem
-        safe_name = "".join(c if c.isalnum() else "_" for c in workbook_name)
-        return self.cache_dir / f"{safe_name}_graph.json"
+        return self.cache_dir / f"{self._cache_stem(workbook_path)}{_GRAPH_SUFFIX}"
 
     def get_metadata_path(self, workbook_path: str) -> Path:
         """
@@ -55,8 +122,20 @@ class GraphCache:
         Returns:
             Path to metadata file
         """
-        cache_path = self.get_cache_path(workbook_path)
-        return cache_path.with_suffix(".meta.json")
+        return self.cache_dir / f"{self._cache_stem(workbook_path)}.meta.json"
+
+    @staticmethod
+    def _cache_stem(workbook_path: str) -> str:
+        """
+        Get cache file stem for a workbook.
+
+        Includes a digest of the full path so same-named workbooks in
+        different folders don't share a cache entry.
+        """
+        workbook_name = Path(workbook_path).stem
+        safe_name = "".join(c if c.isalnum() else "_" for c in workbook_name)
+        digest = hashlib.blake2b(str(workbook_path).encode(), digest_size=6).hexdigest()
+        return f"{safe_name}_{digest}_graph"
 
     def save(
         self,
@@ -70,7 +149,7 @@ class GraphCache:
         Args:
             graph: Dependency graph to save
             workbook_path: Path to Excel workbook
-            workbook_hash: Optional hash of workbook formulas
+            workbook_hash: Optional digest of workbook formulas
 
         Raises:
             CacheError: If save fails
@@ -79,12 +158,8 @@ class GraphCache:
             cache_path = self.get_cache_path(workbook_path)
             metadata_path = self.get_metadata_path(workbook_path)
 
-            # Serialize graph
-            graph_data = self._serialize_graph(graph)
-
-            # Save graph
-            with open(cache_path, "w") as f:
-                json.dump(graph_data, f, indent=2)
+            # Serialize graph as columns (freezes it, building the CSR arrays)
+            cache_path.write_bytes(_encode(graph.to_columns()))
 
             # Save metadata
             metadata = {
@@ -127,12 +202,12 @@ class GraphCache:
                 logger.debug(f"No cache found for {workbook_path}")
                 return None
 
-            # Load graph data
-            with open(cache_path, "r") as f:
-                graph_data = json.load(f)
-
-            # Deserialize graph
-            graph = self._deserialize_graph(graph_data)
+            # Load and rebuild graph from its columns
+            columns = _decode(cache_path.read_bytes())
+            if not isinstance(columns, dict):
+                logger.warning("Unrecognized cache file format, ignoring")
+                return None
+            graph = DependencyGraph.from_columns(columns)
 
             logger.info(
                 f"Loaded dependency graph from cache: {cache_path} "
@@ -143,7 +218,7 @@ class GraphCache:
 
         except FileNotFoundError:
             return None
-        except json.JSONDecodeError as e:
+        except _DECODE_ERRORS + (DependencyGraphError,) as e:
             logger.warning(f"Invalid cache file format: {e}")
             return None
         except Exception as e:
@@ -210,6 +285,27 @@ class GraphCache:
         except Exception:
             return True
 
+    def mark_fresh(self, workbook_path: str) -> None:
+        """
+        Record that the cached graph is still valid for the current file.
+
+        Used after a formula digest match, so the next staleness check
+        passes on modification time alone.
+
+        Args:
+            workbook_path: Path to Excel workbook
+        """
+        metadata = self.get_metadata(workbook_path)
+        if metadata is None:
+            return
+
+        metadata["cached_at"] = datetime.now().isoformat()
+        try:
+            with open(self.get_metadata_path(workbook_path), "w") as f:
+                json.dump(metadata, f, indent=2)
+        except OSError as e:
+            logger.warning(f"Failed to update cache metadata: {e}")
+
     def clear(self, workbook_path: str) -> None:
         """
         Clear cache for a workbook.
@@ -231,42 +327,6 @@ class GraphCache:
         except Exception as e:
             logger.warning(f"Failed to clear cache: {e}")
 
-    @staticmethod
-    def _serialize_graph(graph: DependencyGraph) -> Dict:
-        """Serialize dependency graph to dict."""
-        nodes_data = {}
-
-        for cell_address, node in graph.nodes.items():
-            nodes_data[cell_address] = {
-                "cell_address": node.cell_address,
-                "sheet": node.sheet,
-                "formula": node.formula,
-                "predecessors": list(node.predecessors),
-                "successors": list(node.successors),
-            }
-
-        return {
-            "workbook_name": graph.workbook_name,
-            "nodes": nodes_data,
-        }
-
-    @staticmethod
-    def _deserialize_graph(data: Dict) -> DependencyGraph:
-        """Deserialize dependency graph from dict."""
-        graph = DependencyGraph(workbook_name=data.get("workbook_name"))
-
-        for cell_address, node_data in data["nodes"].items():
-            node = DependencyNode(
-                cell_address=node_data["cell_address"],
-                sheet=node_data["sheet"],
-                formula=node_data.get("formula"),
-                predecessors=set(node_data.get("predecessors", [])),
-                successors=set(node_data.get("successors", [])),
-            )
-            graph.add_node(node)
-
-        return graph
-
     @staticmethod
     def compute_workbook_hash(formulas: list[str]) -> str:
         """
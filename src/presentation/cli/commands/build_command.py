@@ -64,7 +64,7 @@ class BuildCommand:
             # Check if graph already exists
             status = self.service.get_cache_status()
 
-            if status.get("graph_cached") and not force:
+            if status.graph_cached and not force:
                 self.console.print(
                     "[yellow]Dependency graph already exists[/yellow]"
                 )
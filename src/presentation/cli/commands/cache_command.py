@@ -41,7 +41,7 @@ class CacheCommand:
         try:
             status = self.service.get_cache_status()
 
-            if not status["connected"]:
+            if not status.connected:
                 self.console.print(
                     "[yellow]Not connected to a workbook[/yellow]"
                 )
@@ -52,16 +52,16 @@ class CacheCommand:
             table.add_column("Property", style="cyan")
             table.add_column("Value", style="green")
 
-            table.add_row("Workbook", status["workbook"])
+            table.add_row("Workbook", status.workbook)
             table.add_row(
                 "Graph Cached",
-                " Yes" if status["graph_cached"] else " No",
+                " Yes" if status.graph_cached else " No",
             )
-            table.add_row("Node Count", str(status["node_count"]))
-            table.add_row("Formula Count", str(status["formula_count"]))
+            table.add_row("Node Count", str(status.node_count))
+            table.add_row("Formula Count", str(status.formula_count))
             table.add_row(
                 "Has Annotations",
-                " Yes" if status["has_annotations"] else " No",
+                " Yes" if status.has_annotations else " No",
             )
 
             self.console.print(table)
@@ -55,6 +55,12 @@ class LLMProviderError(ExcelSidekickError):
     pass
 
 
+class LLMTransientError(LLMProviderError):
+    """Raised when an LLM call fails in a retryable way (rate limit, timeout, 5xx)."""
+
+    pass
+
+
 class ConfigurationError(ExcelSidekickError):
     """Raised when configuration is invalid or missing."""
 
@@ -72,7 +72,8 @@ def setup_logging(
         log_path = Path(log_file_resolved)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = logging.FileHandler(log_file_resolved)
+        # delay: the file is only opened on the first record written
+        file_handler = logging.FileHandler(log_file_resolved, delay=True)
         file_handler.setLevel(getattr(logging, level.upper()))
 
         # File handler always uses standard formatter (not RichHandler)
@@ -0,0 +1,139 @@
+"""Tests for ExcelAssistantService question handling."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.application.excel_assistant_service import ExcelAssistantService
+from src.domain.models.query import AssistantResponse
+from src.domain.models.selection import Selection
+from src.infrastructure.config.config_schema import Config
+
+
+class _FakeWorkbookData:
+    """Connected workbook with no unsaved edits."""
+
+    def __init__(self):
+        self.workbook_revision = 0
+        self.unsaved = False
+
+    def is_connected(self):
+        return True
+
+    def get_active_sheet(self):
+        return "S"
+
+    def has_unsaved_changes(self):
+        return self.unsaved
+
+    def mark_workbook_changed(self):
+        self.workbook_revision += 1
+
+
+class _FakeAgent:
+    """Answers every question, counting how often it is asked."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def explore_and_answer(self, context):
+        self.calls += 1
+        return AssistantResponse(question=context.question, answer=f"answer {self.calls}")
+
+    async def aexplore_and_answer(self, context):
+        await asyncio.sleep(0)
+        return self.explore_and_answer(context)
+
+
+@pytest.fixture
+def service(tmp_path):
+    config = Config.model_validate({"logging": {"file": str(tmp_path / "sidekick.log")}})
+    service = ExcelAssistantService(config)
+    # Domain services are cached properties; put fakes in their place
+    service.__dict__.update(
+        workbook_data=_FakeWorkbookData(),
+        agent=_FakeAgent(),
+        llm_interaction=SimpleNamespace(supports_response_memo=lambda: True),
+    )
+    return service
+
+
+SELECTION = Selection.from_address("S!A1:B2")
+
+
+class TestResponseCache:
+    """Repeated questions are answered from the response cache."""
+
+    def test_repeated_question_explores_once(self, service):
+        first = service.ask_question("Why?", SELECTION)
+        second = service.ask_question("Why?", SELECTION)
+
+        assert second is first
+        assert service.agent.calls == 1
+
+    def test_question_without_selection_is_not_cached(self, service):
+        service.ask_question("Why?")
+        service.ask_question("Why?")
+
+        assert service.agent.calls == 2
+
+    def test_workbook_change_invalidates(self, service):
+        service.ask_question("Why?", SELECTION)
+        service.workbook_data.mark_workbook_changed()
+        service.ask_question("Why?", SELECTION)
+
+        assert service.agent.calls == 2
+
+    def test_unsaved_workbook_is_not_cached(self, service):
+        service.workbook_data.unsaved = True
+        service.ask_question("Why?", SELECTION)
+        service.ask_question("Why?", SELECTION)
+
+        assert service.agent.calls == 2
+
+    def test_provider_opt_out_is_not_cached(self, service):
+        service.llm_interaction.supports_response_memo = lambda: False
+        service.ask_question("Why?", SELECTION)
+        service.ask_question("Why?", SELECTION)
+
+        assert service.agent.calls == 2
+
+    def test_async_question_shares_the_cache(self, service):
+        first = service.ask_question("Why?", SELECTION)
+        second = asyncio.run(service.ask_question_async("Why?", SELECTION))
+
+        assert second is first
+        assert service.agent.calls == 1
+
+
+class TestAskMany:
+    """ask_many() goes through the response cache too."""
+
+    def test_identical_questions_in_a_batch_explore_once(self, service):
+        items = [("Why?", SELECTION, "educational")] * 3 + [("How?", SELECTION, "educational")]
+
+        responses = asyncio.run(service.ask_many(items))
+
+        assert service.agent.calls == 2
+        assert responses[0] is responses[1] is responses[2]
+        assert responses[3].question == "How?"
+
+    def test_cached_answers_are_reused(self, service):
+        cached = service.ask_question("Why?", SELECTION)
+
+        responses = asyncio.run(service.ask_many([("Why?", SELECTION, "educational")]))
+
+        assert responses == [cached]
+        assert service.agent.calls == 1
+
+    def test_batch_answers_are_cached(self, service):
+        (response,) = asyncio.run(service.ask_many([("Why?", SELECTION, "educational")]))
+
+        assert service.ask_question("Why?", SELECTION) is response
+        assert service.agent.calls == 1
+
+    def test_uncacheable_questions_are_all_explored(self, service):
+        asyncio.run(service.ask_many([("Why?", None, "educational")] * 2))
+
+        assert service.agent.calls == 2
@@ -0,0 +1,62 @@
+"""Tests for the application response cache."""
+
+from src.application import response_cache
+from src.application.response_cache import ResponseCache
+from src.domain.models.query import AssistantResponse
+
+
+def _response(answer):
+    return AssistantResponse(question="Why?", answer=answer)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache:
+    """ResponseCache keying, expiry and eviction."""
+
+    def test_hit_and_miss(self):
+        cache = ResponseCache()
+        cache.put(b"key", _response("a"))
+
+        assert cache.get(b"key").answer == "a"
+        assert cache.get(b"other") is None
+
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        clock = _Clock()
+        monkeypatch.setattr(response_cache.time, "monotonic", clock)
+        cache = ResponseCache(ttl_seconds=10)
+        cache.put(b"key", _response("a"))
+
+        clock.now += 10
+        assert cache.get(b"key") is not None
+
+        clock.now += 1
+        assert cache.get(b"key") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put(b"a", _response("a"))
+        cache.put(b"b", _response("b"))
+        cache.get(b"a")
+
+        cache.put(b"c", _response("c"))
+
+        assert cache.get(b"b") is None
+        assert cache.get(b"a") is not None
+        assert cache.get(b"c") is not None
+
+    def test_clear(self):
+        cache = ResponseCache()
+        cache.put(b"key", _response("a"))
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get(b"key") is None
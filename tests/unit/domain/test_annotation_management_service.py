@@ -0,0 +1,157 @@
+"""Tests for annotation lookups in AnnotationManagementService."""
+
+import os
+import random
+import string
+
+import pytest
+
+from src.domain.models.annotation import Annotation
+from src.domain.models.selection import Range
+from src.domain.services import annotation_management_service
+from src.domain.services.annotation_management_service import (
+    AnnotationManagementService,
+    _SheetIndex,
+)
+from src.infrastructure.config.config_schema import Config
+
+
+def _random_range(rng, sheet="S"):
+    """A range somewhere in the first 2000 rows and 100 columns, up to whole-column size."""
+    start_row, start_col = rng.randint(1, 2000), rng.randint(1, 100)
+    height = rng.choice([1, 5, 50, 1000, 5000])
+    width = rng.choice([1, 3, 20])
+    return Range(
+        sheet=sheet,
+        start_row=start_row,
+        start_col=start_col,
+        end_row=start_row + height - 1,
+        end_col=start_col + width - 1,
+    )
+
+
+@pytest.fixture
+def service(tmp_path):
+    config = Config.model_validate({"annotations": {"file_location": str(tmp_path)}})
+    service = AnnotationManagementService(config)
+    service.set_workbook(str(tmp_path / "book.xlsx"))
+    return service
+
+
+class TestSheetIndex:
+    """_SheetIndex.query() agrees with a linear overlap scan."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_grid_matches_linear_scan(self, monkeypatch, seed):
+        monkeypatch.setattr(annotation_management_service, "rtree_index", None)
+        rng = random.Random(seed)
+        annotations = [Annotation(_random_range(rng), f"a{i}") for i in range(200)]
+        index = _SheetIndex(annotations)
+
+        for _ in range(100):
+            query = _random_range(rng)
+            expected = [ann for ann in annotations if ann.matches_range(query)]
+            assert index.query(query) == expected
+
+    def test_added_annotations_are_found(self, monkeypatch):
+        monkeypatch.setattr(annotation_management_service, "rtree_index", None)
+        index = _SheetIndex([])
+        index.add(Annotation(Range.from_address("S!A1:A100000"), "wide"))
+        index.add(Annotation(Range.from_address("S!C5"), "cell"))
+
+        labels = [ann.label for ann in index.query(Range.from_address("S!A50:C50"))]
+        assert labels == ["wide"]
+        labels = [ann.label for ann in index.query(Range.from_address("S!A1:Z10"))]
+        assert labels == ["wide", "cell"]
+
+
+class TestAnnotationsForRange:
+    """get_annotations_for_range() through the per-sheet index."""
+
+    def test_overlap_and_exact_match(self, service):
+        service.add_annotations([
+            ("Sheet1!A1:B10", "inputs", None),
+            ("Sheet1!C5", "total", None),
+            ("Sheet2!A1:B10", "other sheet", None),
+        ])
+
+        overlapping = service.get_annotations_for_range(Range.from_address("Sheet1!B5:C5"))
+        exact = service.get_annotations_for_range(
+            Range.from_address("Sheet1!C5"), exact_match=True
+        )
+
+        assert [ann.label for ann in overlapping] == ["inputs", "total"]
+        assert [ann.label for ann in exact] == ["total"]
+
+    def test_unannotated_sheet_is_empty(self, service):
+        service.add_annotation("Sheet1!A1", "input")
+
+        assert service.get_annotations_for_range(Range.from_address("Sheet3!A1")) == []
+
+    def test_many_annotations_on_one_sheet(self, service):
+        service.add_annotations(
+            (f"Sheet1!{col}{row}", f"{col}{row}", None)
+            for row in range(1, 201, 10)
+            for col in string.ascii_uppercase[::4]
+        )
+
+        found = service.get_annotations_for_range(Range.from_address("Sheet1!I91:M111"))
+
+        assert sorted(ann.label for ann in found) == ["I101", "I111", "I91", "M101", "M111", "M91"]
+
+
+class TestIndexRevalidation:
+    """The in-memory index follows edits made to the annotation file."""
+
+    def test_reads_are_served_from_memory(self, service, monkeypatch):
+        service.add_annotation("Sheet1!A1", "input")
+        service.get_annotations()
+        service.add_annotation("Sheet1!B1", "output")
+
+        def fail(workbook_path):
+            raise AssertionError("annotation file reloaded")
+
+        monkeypatch.setattr(service.storage, "load", fail)
+
+        assert [ann.label for ann in service.get_annotations()] == ["input", "output"]
+        assert [ann.label for ann in service.get_annotations(sheet="Sheet1")] == [
+            "input", "output"
+        ]
+
+    def test_outside_edit_is_picked_up(self, service, tmp_path):
+        service.add_annotation("Sheet1!A1", "input")
+        assert len(service.get_annotations_for_range(Range.from_address("Sheet1!A1"))) == 1
+
+        # Another process (or a second service) rewrites the file
+        other = AnnotationManagementService(service.config)
+        other.set_workbook(str(tmp_path / "book.xlsx"))
+        other.clear_all()
+        other.add_annotation("Sheet1!C3", "moved")
+        path = service.storage.get_storage_path(str(tmp_path / "book.xlsx"))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert service.get_annotations_for_range(Range.from_address("Sheet1!A1")) == []
+        assert [ann.label for ann in service.get_annotations()] == ["moved"]
+
+    def test_add_after_outside_edit_keeps_both(self, service, tmp_path):
+        service.add_annotation("Sheet1!A1", "input")
+        service.get_annotations()
+
+        other = AnnotationManagementService(service.config)
+        other.set_workbook(str(tmp_path / "book.xlsx"))
+        other.add_annotation("Sheet1!C3", "theirs")
+        path = service.storage.get_storage_path(str(tmp_path / "book.xlsx"))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        service.add_annotation("Sheet1!D4", "ours")
+
+        assert [ann.label for ann in service.get_annotations()] == ["input", "theirs", "ours"]
+
+    def test_remove_drops_the_annotation(self, service):
+        service.add_annotations([("Sheet1!A1", "input", None), ("Sheet1!B1", "output", None)])
+        service.get_annotations()
+
+        assert service.remove_annotation("Sheet1!A1")
+        assert [ann.label for ann in service.get_annotations()] == ["output"]
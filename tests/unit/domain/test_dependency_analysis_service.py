@@ -0,0 +1,100 @@
+"""Tests for building and caching dependency graphs."""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("xlwings")
+
+from src.domain.models.workbook import Sheet, Workbook  # noqa: E402
+from src.domain.services.dependency_analysis_service import (  # noqa: E402
+    DependencyAnalysisService,
+)
+from src.infrastructure.config.config_schema import Config  # noqa: E402
+
+
+class _FakeWorkbookData:
+    """Serves formulas of one sheet in place of Excel."""
+
+    def __init__(self, workbook, formulas):
+        self.workbook = workbook
+        self.formulas = formulas
+        self.reads = 0
+
+    def get_workbook_structure(self):
+        return SimpleNamespace(workbook=self.workbook)
+
+    def get_formula_arrays(self, range_obj):
+        self.reads += 1
+        rows = range(range_obj.start_row, range_obj.end_row + 1)
+        cells = [(a, f) for a, f in self.formulas.items() if int(a[1:]) in rows]
+        return [a for a, _ in cells], [f for _, f in cells]
+
+
+@pytest.fixture
+def workbook_file(tmp_path):
+    path = tmp_path / "book.xlsx"
+    path.write_bytes(b"")
+    return path
+
+
+def _service(tmp_path, workbook_file, formulas):
+    config = Config.model_validate(
+        {"dependencies": {"batch_size": 2, "cache": {"location": str(tmp_path / "cache")}}}
+    )
+    workbook = Workbook(
+        name="book.xlsx", path=str(workbook_file), sheets=[Sheet("S", used_range="A1:A4")]
+    )
+    data = _FakeWorkbookData(workbook, formulas)
+    return DependencyAnalysisService(config, data), workbook, data
+
+
+def _resave(path):
+    later = path.stat().st_mtime + 60
+    os.utime(path, (later, later))
+
+
+class TestBuildGraphDigest:
+    """A resaved workbook reuses the cached graph if its formulas are unchanged."""
+
+    FORMULAS = {"A2": "=A1*2", "A3": "=A2+1", "A4": "=SUM(A1:A3)"}
+
+    def test_unchanged_formulas_skip_building(self, tmp_path, workbook_file, monkeypatch):
+        service, workbook, _ = _service(tmp_path, workbook_file, self.FORMULAS)
+        built = service.build_graph(workbook)
+        _resave(workbook_file)
+
+        fresh, workbook, data = _service(tmp_path, workbook_file, self.FORMULAS)
+
+        def fail(*args):
+            raise AssertionError("graph was rebuilt")
+
+        monkeypatch.setattr(fresh, "_build_subgraph", fail)
+        graph = fresh.build_graph(workbook)
+
+        assert data.reads == 2
+        assert list(graph.nodes) == list(built.nodes)
+        assert graph.is_frozen
+
+    def test_changed_formulas_rebuild(self, tmp_path, workbook_file):
+        service, workbook, _ = _service(tmp_path, workbook_file, self.FORMULAS)
+        service.build_graph(workbook)
+        _resave(workbook_file)
+
+        changed = {**self.FORMULAS, "A3": "=A1+1"}
+        fresh, workbook, _ = _service(tmp_path, workbook_file, changed)
+        graph = fresh.build_graph(workbook)
+
+        assert graph.depends_on("S!A3", "S!A1")
+        assert not graph.depends_on("S!A3", "S!A2")
+        assert fresh.cache.load(str(workbook_file)).depends_on("S!A3", "S!A1")
+
+    def test_unmodified_file_loads_without_reading(self, tmp_path, workbook_file):
+        service, workbook, _ = _service(tmp_path, workbook_file, self.FORMULAS)
+        service.build_graph(workbook)
+
+        fresh, workbook, data = _service(tmp_path, workbook_file, self.FORMULAS)
+        fresh.build_graph(workbook)
+
+        assert data.reads == 0
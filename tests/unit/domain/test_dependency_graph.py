@@ -0,0 +1,144 @@
+"""Tests for the dependency graph model."""
+
+import random
+
+import pytest
+
+from src.domain.models.dependency import DependencyGraph, DependencyNode
+from src.shared.exceptions import DependencyGraphError
+
+
+def _graph(edges, freeze=True):
+    """Build a graph on sheet S from (precedent, dependent) address pairs."""
+    graph = DependencyGraph()
+    nodes = {}
+    for source, target in edges:
+        for address in (source, target):
+            if address not in nodes:
+                nodes[address] = DependencyNode(address, "S")
+                graph.add_node(nodes[address])
+        nodes[target].add_predecessor(f"S!{source}")
+        nodes[source].add_successor(f"S!{target}")
+    if freeze:
+        graph.freeze()
+    return graph
+
+
+class TestTransitiveClosures:
+    """reachable_upstream/reachable_downstream/depends_on on a frozen graph."""
+
+    # A1 -> B1 -> C1 -> D1, A1 -> D1, E1 -> C1
+    EDGES = [("A1", "B1"), ("B1", "C1"), ("C1", "D1"), ("A1", "D1"), ("E1", "C1")]
+
+    def test_reachable_upstream(self):
+        graph = _graph(self.EDGES)
+
+        assert graph.reachable_upstream("S!D1") == {"S!A1", "S!B1", "S!C1", "S!E1"}
+        assert graph.reachable_upstream("S!A1") == frozenset()
+
+    def test_reachable_downstream(self):
+        graph = _graph(self.EDGES)
+
+        assert graph.reachable_downstream("S!B1") == {"S!C1", "S!D1"}
+        assert graph.reachable_downstream("S!X9") == frozenset()
+
+    def test_depends_on(self):
+        graph = _graph(self.EDGES)
+
+        assert graph.depends_on("S!D1", "S!E1")
+        assert not graph.depends_on("S!E1", "S!D1")
+        assert not graph.depends_on("S!D1", "S!X9")
+
+    def test_closures_are_memoized(self):
+        graph = _graph(self.EDGES)
+        first = graph.reachable_upstream("S!D1")
+
+        assert graph.reachable_upstream("S!D1") == first
+        assert graph._up_closure
+
+
+def _positions(graph):
+    order = list(graph.topo_order())
+    assert sorted(order) == list(range(graph.node_count()))
+    return {graph.addr_of[node_id]: i for i, node_id in enumerate(order)}
+
+
+class TestTopoOrder:
+    """topo_order(): Kahn's algorithm, with an SCC fallback for cycles."""
+
+    def test_chain_in_dependency_order(self):
+        graph = _graph([("C1", "D1"), ("B1", "C1"), ("A1", "B1")])
+
+        assert [graph.addr_of[i] for i in graph.topo_order()] == [
+            "S!A1", "S!B1", "S!C1", "S!D1"
+        ]
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_acyclic_graph_places_precedents_first(self, seed):
+        rng = random.Random(seed)
+        # Edges only go from lower to higher rows, so there is no cycle
+        edges = [
+            (f"A{u}", f"A{v}")
+            for u, v in (sorted(rng.sample(range(1, 30), 2)) for _ in range(60))
+        ]
+        graph = _graph(edges)
+
+        position = _positions(graph)
+        for source, target in edges:
+            assert position[f"S!{source}"] < position[f"S!{target}"]
+
+    def test_cycle_is_kept_together_and_ordered(self):
+        # A1 -> B1 -> C1 -> B1 (cycle), C1 -> D1, E1 -> A1
+        edges = [("A1", "B1"), ("B1", "C1"), ("C1", "B1"), ("C1", "D1"), ("E1", "A1")]
+        graph = _graph(edges)
+
+        position = _positions(graph)
+        assert abs(position["S!B1"] - position["S!C1"]) == 1
+        assert position["S!E1"] < position["S!A1"] < min(position["S!B1"], position["S!C1"])
+        assert max(position["S!B1"], position["S!C1"]) < position["S!D1"]
+
+    def test_self_reference(self):
+        graph = _graph([("A1", "A1"), ("A1", "B1")])
+
+        assert [graph.addr_of[i] for i in graph.topo_order()] == ["S!A1", "S!B1"]
+
+    def test_order_is_computed_once(self):
+        graph = _graph([("A1", "B1")])
+
+        assert graph.topo_order() is graph.topo_order()
+
+    def test_unfrozen_graph_raises(self):
+        graph = _graph([("A1", "B1")], freeze=False)
+
+        with pytest.raises(DependencyGraphError):
+            graph.topo_order()
+        assert not graph.is_frozen
+
+
+class TestUnfrozenReads:
+    """Reads that need the CSR arrays don't freeze a graph being built."""
+
+    @pytest.mark.parametrize(
+        "read",
+        [
+            lambda g: g.reachable_upstream("S!B1"),
+            lambda g: g.reachable_downstream("S!A1"),
+            lambda g: g.depends_on("S!B1", "S!A1"),
+            lambda g: g.to_columns(),
+        ],
+    )
+    def test_read_raises_and_leaves_graph_open(self, read):
+        graph = _graph([("A1", "B1")], freeze=False)
+
+        with pytest.raises(DependencyGraphError):
+            read(graph)
+
+        assert not graph.is_frozen
+        graph.add_node(DependencyNode("C1", "S"))
+        assert graph.node_count() == 3
+
+    def test_frozen_graph_rejects_changes(self):
+        graph = _graph([("A1", "B1")])
+
+        with pytest.raises(DependencyGraphError):
+            graph.add_node(DependencyNode("C1", "S"))
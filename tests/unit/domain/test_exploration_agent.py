@@ -0,0 +1,82 @@
+"""Tests for ExplorationAgent context gathering."""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("xlwings")
+
+from src.domain.models.query import QuestionContext  # noqa: E402
+from src.domain.models.selection import Selection  # noqa: E402
+from src.domain.models.workbook import Cell, Formula  # noqa: E402
+from src.domain.services.exploration_agent import ExplorationAgent  # noqa: E402
+from src.infrastructure.config.config_schema import Config  # noqa: E402
+
+
+class _Recorder:
+    """Records which thread each call ran on."""
+
+    def __init__(self):
+        self.threads = {}
+
+    def record(self, name, result):
+        self.threads[name] = threading.current_thread().name
+        return result
+
+
+def _agent(mode):
+    recorder = _Recorder()
+    selection = Selection.from_address("S!A1:A2")
+    selection.has_formulas = True
+    cells = [Cell("A1", "S", 1), Cell("A2", "S", 2, Formula("=A1*2"))]
+
+    workbook_data = SimpleNamespace(
+        get_current_selection=lambda: selection,
+        iter_range_data=lambda range_obj: iter(cells),
+        expand_selection_context=lambda sel: sel.range,
+        get_snapshot=lambda sheet, address: recorder.record("snapshot", f"{sheet}!{address}"),
+    )
+    dependency_analysis = SimpleNamespace(
+        trace_dependencies=lambda **kwargs: recorder.record("trace", kwargs["cell_address"])
+    )
+    annotation_management = SimpleNamespace(
+        get_annotations=lambda sheet: recorder.record("annotations", [sheet])
+    )
+    config = Config.model_validate({"dependencies": {"mode": mode}})
+    agent = ExplorationAgent(
+        config, workbook_data, dependency_analysis, annotation_management, llm_interaction=None
+    )
+    return agent, recorder, selection
+
+
+@pytest.mark.parametrize("mode", ["full_graph", "on_demand"])
+def test_selection_context(mode):
+    agent, recorder, selection = _agent(mode)
+
+    response = agent._gather_context(QuestionContext(question="Why?", selection=selection))
+
+    assert response.context_used["snapshot"] == "S!A1:A2"
+    assert response.context_used["formulas"] == ["=A1*2"]
+    assert response.dependencies_traced == "S!A2"
+    assert response.annotations_found == ["S"]
+
+
+def test_full_graph_trace_overlaps_snapshot_without_leaking_threads():
+    agent, recorder, selection = _agent("full_graph")
+    caller = threading.current_thread().name
+
+    agent._gather_context(QuestionContext(question="Why?", selection=selection))
+
+    assert recorder.threads["trace"].startswith("agent-trace")
+    assert recorder.threads["snapshot"] == caller
+    assert recorder.threads["annotations"] == caller
+    assert not [t for t in threading.enumerate() if t.name.startswith("agent-trace")]
+
+
+def test_on_demand_trace_stays_on_calling_thread():
+    agent, recorder, selection = _agent("on_demand")
+
+    agent._gather_context(QuestionContext(question="Why?", selection=selection))
+
+    assert recorder.threads["trace"] == threading.current_thread().name
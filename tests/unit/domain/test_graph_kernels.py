@@ -0,0 +1,145 @@
+"""Tests for the dependency graph trace kernels."""
+
+import random
+from array import array
+
+import pytest
+
+from src.domain.services import _graph_kernels
+
+
+def _csr(n_nodes, edges):
+    """Build (indptr, indices) arrays from an edge list, keeping edge order."""
+    neighbours = [[] for _ in range(n_nodes)]
+    for u, v in edges:
+        neighbours[u].append(v)
+
+    indptr = array("i", [0])
+    indices = array("i")
+    for row in neighbours:
+        indices.extend(row)
+        indptr.append(len(indices))
+    return indptr, indices
+
+
+def _reference_trace(root, indptr, indices, max_depth):
+    """Recursive single-direction trace with the kernel's slot layout."""
+    nodes, depths, parents, cycles = [root], [0], [-1], []
+    visited, in_path = set(), set()
+
+    def expand(k):
+        u, d = nodes[k], depths[k]
+        if d >= max_depth or u in visited:
+            return
+        visited.add(u)
+        in_path.add(u)
+        start = len(nodes)
+        for v in indices[indptr[u]:indptr[u + 1]]:
+            if v in in_path:
+                cycles.append(len(nodes))
+            nodes.append(v)
+            depths.append(d + 1)
+            parents.append(k)
+        for j in range(start, len(nodes)):
+            expand(j)
+        in_path.discard(u)
+
+    expand(0)
+    return [nodes, depths, parents, cycles]
+
+
+def _random_graph(rng):
+    n_nodes = rng.randint(1, 30)
+    edges = [
+        (rng.randrange(n_nodes), rng.randrange(n_nodes))
+        for _ in range(rng.randint(0, 3 * n_nodes))
+    ]
+    pred = _csr(n_nodes, edges)
+    succ = _csr(n_nodes, [(v, u) for u, v in edges])
+    return n_nodes, pred, succ
+
+
+def _as_lists(result):
+    return [list(part) for part in result]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_single_direction_matches_recursive_reference(seed):
+    rng = random.Random(seed)
+    n_nodes, pred, succ = _random_graph(rng)
+    root = rng.randrange(n_nodes)
+    max_depth = rng.randint(0, 6)
+
+    for indptr, indices in (pred, succ):
+        result = _graph_kernels.trace(root, [(indptr, indices)], max_depth)
+        assert _as_lists(result) == _reference_trace(root, indptr, indices, max_depth)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_both_directions_in_one_pass(seed):
+    rng = random.Random(seed)
+    n_nodes, pred, succ = _random_graph(rng)
+    root = rng.randrange(n_nodes)
+    max_depth = rng.randint(0, 6)
+
+    ids, depths, parents, cycles = _as_lists(_graph_kernels.trace(root, [pred, succ], max_depth))
+    up = _reference_trace(root, *pred, max_depth)
+    down = _reference_trace(root, *succ, max_depth)
+
+    # Slots 0 and 1 are the root; the upstream walk fills the slots after
+    # them, then the downstream walk follows
+    n_up = len(up[0]) - 1
+    assert ids[:2] == [root, root] and parents[:2] == [-1, -1]
+    assert ids[2:2 + n_up] == up[0][1:]
+    assert ids[2 + n_up:] == down[0][1:]
+    assert depths[2:] == up[1][1:] + down[1][1:]
+    assert len(cycles) == len(up[3]) + len(down[3])
+
+
+def test_cycle_is_reported_and_not_expanded_again():
+    # 0 -> 1 -> 2 -> 0
+    indptr, indices = _csr(3, [(0, 1), (1, 2), (2, 0)])
+
+    ids, depths, parents, cycles = _as_lists(_graph_kernels.trace(0, [(indptr, indices)], 10))
+
+    assert ids == [0, 1, 2, 0]
+    assert depths == [0, 1, 2, 3]
+    assert parents == [-1, 0, 1, 2]
+    assert cycles == [3]
+
+
+def test_python_kernel_matches_dispatch():
+    rng = random.Random(99)
+    for _ in range(20):
+        n_nodes, pred, succ = _random_graph(rng)
+        root = rng.randrange(n_nodes)
+        max_depth = rng.randint(0, 6)
+
+        expected = _as_lists(_graph_kernels._trace_python(root, [pred, succ], max_depth, n_nodes))
+        assert _as_lists(_graph_kernels.trace(root, [pred, succ], max_depth)) == expected
+
+
+@pytest.mark.skipif(not _graph_kernels.NUMBA_AVAILABLE, reason="numba not installed")
+@pytest.mark.parametrize("n_dirs", [1, 2])
+def test_numba_kernel_matches_python_kernel(n_dirs):
+    np = pytest.importorskip("numpy")
+    rng = random.Random(n_dirs)
+    for _ in range(50):
+        n_nodes, pred, succ = _random_graph(rng)
+        root = rng.randrange(n_nodes)
+        max_depth = rng.randint(0, 6)
+        adjacency = [pred, succ][:n_dirs]
+        second = adjacency[-1]
+
+        jit = _graph_kernels._trace_jit(
+            root,
+            np.frombuffer(pred[0], dtype=np.int32),
+            np.frombuffer(pred[1], dtype=np.int32),
+            np.frombuffer(second[0], dtype=np.int32),
+            np.frombuffer(second[1], dtype=np.int32),
+            n_dirs,
+            max_depth,
+            n_nodes,
+        )
+        python = _graph_kernels._trace_python(root, adjacency, max_depth, n_nodes)
+        assert _as_lists(jit) == _as_lists(python)
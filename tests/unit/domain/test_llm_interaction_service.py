@@ -0,0 +1,110 @@
+"""Tests for LLM response caching in LLMInteractionService."""
+
+import asyncio
+
+import pytest
+
+from src.domain.services.llm_interaction_service import LLMInteractionService
+from src.infrastructure.config.config_schema import Config
+from src.infrastructure.llm.providers.mock_provider import MockLLMProvider
+
+
+class _InteractiveProvider(MockLLMProvider):
+    """Mock provider that, like the manual one, needs a fresh answer each time."""
+
+    def supports_response_memo(self) -> bool:
+        return False
+
+
+def _service(**llm):
+    config = Config.model_validate({"llm": {"default_provider": "mock", **llm}})
+    service = LLMInteractionService(config)
+    service._provider_factories["interactive"] = _InteractiveProvider
+    return service
+
+
+@pytest.fixture
+def service():
+    return _service()
+
+
+class TestResponseMemo:
+    """Exact repeats are answered from memory."""
+
+    def test_repeated_question_queries_provider_once(self, service):
+        first = service.query("What is A1?", formulas=["=B1+C1"], workbook_revision=0)
+        second = service.query("What  is A1?", formulas=["=B1+C1"], workbook_revision=0)
+
+        assert second is first
+        assert service.get_provider("mock").call_count == 1
+
+    def test_async_query_shares_the_memo(self, service):
+        service.query("What is A1?", workbook_revision=0)
+        asyncio.run(service.aquery("What is A1?", workbook_revision=0))
+
+        assert service.get_provider("mock").call_count == 1
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            {"question": "What is B1?"},
+            {"formulas": ["=B1-C1"]},
+            {"mode": "technical"},
+            {"workbook_revision": 1},
+        ],
+    )
+    def test_changed_inputs_reach_the_provider(self, service, changed):
+        asked = {"question": "What is A1?", "formulas": ["=B1+C1"], "workbook_revision": 0}
+        service.query(**asked)
+        service.query(**{**asked, **changed})
+
+        assert service.get_provider("mock").call_count == 2
+
+    def test_memo_is_bounded(self):
+        service = _service(cache_size=1)
+        service.query("What is A1?")
+        service.query("What is B1?")
+        service.query("What is A1?")
+
+        assert service.get_provider("mock").call_count == 3
+
+    def test_memo_can_be_disabled(self):
+        service = _service(cache_size=0)
+        service.query("What is A1?")
+        service.query("What is A1?")
+
+        assert service.get_provider("mock").call_count == 2
+
+
+class TestSemanticCache:
+    """Paraphrase matching, when enabled."""
+
+    def test_disabled_by_default(self, service):
+        assert service.response_cache is None
+
+    def test_paraphrase_is_answered_from_cache(self):
+        service = _service(semantic_cache={"enabled": True, "similarity_threshold": 0.8})
+        service.query("explain this formula", workbook_revision=0)
+        service.query("Explain this formula please", workbook_revision=0)
+
+        assert service.get_provider("mock").call_count == 1
+
+    def test_paraphrase_at_another_revision_misses(self):
+        service = _service(semantic_cache={"enabled": True, "similarity_threshold": 0.8})
+        service.query("explain this formula", workbook_revision=0)
+        service.query("Explain this formula please", workbook_revision=1)
+
+        assert service.get_provider("mock").call_count == 2
+
+
+class TestProviderOptOut:
+    """Providers whose supports_response_memo() is False are always asked."""
+
+    def test_memo_and_semantic_cache_are_skipped(self):
+        service = _service(semantic_cache={"enabled": True})
+        service.query("What is A1?", provider_name="interactive", workbook_revision=0)
+        service.query("What is A1?", provider_name="interactive", workbook_revision=0)
+
+        assert service.get_provider("interactive").call_count == 2
+        assert not service.supports_response_memo("interactive")
+        assert service.supports_response_memo()
@@ -0,0 +1,73 @@
+"""Tests for LLM prompt rendering."""
+
+import os
+
+from src.domain.models.query import LLMContext
+
+
+def _context(question="What does A1 do?", **fields):
+    return LLMContext(
+        question=question,
+        selection_info="S!A1",
+        formulas=["=B1+C1", "=A1*2"],
+        annotations=["Rates", "Inputs"],
+        spatial_context="| A | B |",
+        dependencies="S!A1\n  S!B1",
+        additional_context={"b": 2, "a": 1},
+        **fields,
+    )
+
+
+class TestPromptOrder:
+    """Prompts put the question-independent sections first."""
+
+    def test_sections_are_static_first(self):
+        prompt = _context().to_prompt("You are helpful.")
+
+        sections = [
+            "You are helpful.",
+            "## Spatial Context",
+            "## Annotations",
+            "## Formulas",
+            "## Dependencies",
+            "## Additional Context",
+            "## User Selection",
+            "# Question\nWhat does A1 do?",
+        ]
+        positions = [prompt.index(section) for section in sections]
+        assert positions == sorted(positions)
+
+    def test_questions_about_the_same_context_share_a_prefix(self):
+        first = _context("What does A1 do?").to_prompt("System")
+        second = _context("Why is A1 negative?").to_prompt("System")
+
+        prefix = os.path.commonprefix([first, second])
+        assert "S!A1\n  S!B1" in prefix
+        assert "**b**: 2" in prefix
+
+    def test_list_and_dict_order_does_not_change_the_prompt(self):
+        shuffled = LLMContext(
+            question="What does A1 do?",
+            selection_info="S!A1",
+            formulas=["=A1*2", "=B1+C1"],
+            annotations=["Inputs", "Rates"],
+            spatial_context="| A | B |  \n",
+            dependencies="S!A1\n  S!B1",
+            additional_context={"a": 1, "b": 2},
+        )
+
+        assert shuffled.to_prompt("System") == _context().to_prompt("System")
+
+    def test_prompt_is_memoized_until_a_field_changes(self):
+        context = _context()
+        first = context.to_prompt()
+
+        assert context.to_prompt() is first
+        context.formulas.append("=Z9")
+        assert "=Z9" in context.to_prompt()
+
+    def test_chunks_join_to_the_prompt(self):
+        context = _context()
+
+        assert "".join(context.iter_prompt_chunks("System")) == context.to_prompt("System")
+        assert context.token_estimate() == len(context.to_prompt()) // 4
@@ -0,0 +1,106 @@
+"""Tests for range and selection models."""
+
+import pytest
+
+from src.domain.models.selection import Range
+from src.shared.exceptions import InvalidRangeError
+
+
+def _letters(col_index):
+    """Reference 0-based column index -> letters conversion."""
+    letters = ""
+    col_index += 1
+    while col_index:
+        col_index, remainder = divmod(col_index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+class TestColumnTables:
+    """Column letter/index conversion via the precomputed tables."""
+
+    @pytest.mark.parametrize(
+        "col_index, letters",
+        [(0, "A"), (25, "Z"), (26, "AA"), (701, "ZZ"), (702, "AAA"), (16383, "XFD")],
+    )
+    def test_known_columns(self, col_index, letters):
+        assert Range._col_index_to_letter(col_index) == letters
+        assert Range._parse_cell_address(f"{letters}1") == (col_index, 1)
+
+    def test_table_matches_arithmetic(self):
+        for col_index in range(0, 18278 + 50):
+            letters = _letters(col_index)
+            assert Range._col_index_to_letter(col_index) == letters
+            assert Range._parse_cell_address(f"{letters}7") == (col_index, 7)
+
+    def test_col_letters(self):
+        assert list(Range.from_address("Y1:AB1").col_letters()) == ["Y", "Z", "AA", "AB"]
+        wide = Range(sheet=None, start_col=18277, start_row=1, end_col=18278, end_row=1)
+        assert list(wide.col_letters()) == ["ZZZ", "AAAA"]
+
+
+class TestParseAddress:
+    """Range.from_address() and the regex-free cell address fast path."""
+
+    @pytest.mark.parametrize(
+        "cell, expected",
+        [
+            ("A1", (0, 1)),
+            ("$B$12", (1, 12)),
+            ("c$3", (2, 3)),
+            ("xfd1048576", (16383, 1048576)),
+            ("AAAA1", (18278, 1)),
+        ],
+    )
+    def test_cell_address(self, cell, expected):
+        assert Range._parse_cell_address(cell) == expected
+
+    @pytest.mark.parametrize("cell", ["", "1", "A", "A1B", "1A", "A-1", "A 1", "!A1"])
+    def test_invalid_cell_address(self, cell):
+        with pytest.raises(InvalidRangeError):
+            Range._parse_cell_address(cell)
+
+    def test_range_with_sheet(self):
+        range_obj = Range.from_address("'My Sheet'!$A$1:c10")
+
+        assert range_obj.sheet == "My Sheet"
+        assert (range_obj.start_col, range_obj.start_row) == (0, 1)
+        assert (range_obj.end_col, range_obj.end_row) == (2, 10)
+        assert range_obj.to_address() == "My Sheet!A1:C10"
+
+    def test_single_cell(self):
+        range_obj = Range.from_address("D4")
+
+        assert range_obj.sheet is None
+        assert range_obj.is_single_cell()
+        assert range_obj.to_address() == "D4"
+
+    def test_reversed_range_is_rejected(self):
+        with pytest.raises(InvalidRangeError):
+            Range.from_address("B2:A1")
+
+
+class TestRangeGeometry:
+    """contains()/overlaps() over the packed bounds."""
+
+    def test_contains(self):
+        outer = Range.from_address("S!A1:D10")
+
+        assert outer.contains(Range.from_address("S!B2:C3"))
+        assert outer.contains(Range.from_address("B2"))
+        assert not outer.contains(Range.from_address("S!C9:E9"))
+        assert not outer.contains(Range.from_address("T!B2"))
+
+    def test_overlaps(self):
+        block = Range.from_address("S!B2:C3")
+
+        assert block.overlaps(Range.from_address("S!C3:D4"))
+        assert block.overlaps(Range.from_address("A1:Z1000"))
+        assert not block.overlaps(Range.from_address("S!D1:D9"))
+        assert not block.overlaps(Range.from_address("T!B2:C3"))
+
+    def test_expand_keeps_bounds_in_sheet(self):
+        expanded = Range.from_address("S!B2").expand(rows=3, cols=3)
+
+        assert expanded.to_address() == "S!A1:E5"
+        assert expanded.contains(Range.from_address("S!A1:E5"))
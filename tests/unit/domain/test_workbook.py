@@ -0,0 +1,97 @@
+"""Tests for workbook domain models."""
+
+from src.domain.models.workbook import Cell, Formula, Sheet, Workbook
+
+
+class TestFormulaKnownReferences:
+    """Formula(known_references=...) keeps pre-parsed references."""
+
+    def test_known_references_are_used_instead_of_parsing(self):
+        formula = Formula("=A1+B2", known_references=["C3", "Data!D4"])
+
+        assert formula.referenced_cells == ("C3", "Data!D4")
+        assert formula.references("C3")
+        assert not formula.references("A1")
+
+    def test_known_references_drive_sheet_lookups(self):
+        formula = Formula("=A1", known_references=["Data!D4"])
+
+        assert formula.has_cross_sheet_references()
+        assert formula.get_referenced_sheets() == frozenset({"Data"})
+
+    def test_empty_known_references_are_kept(self):
+        formula = Formula("=A1+B2", known_references=[])
+
+        assert formula.referenced_cells == ()
+        assert not formula.has_cross_sheet_references()
+
+    def test_references_are_parsed_when_not_given(self):
+        formula = Formula("=SUM($A$1:A10)+Data!B2")
+
+        assert formula.referenced_cells == ("A1:A10", "DATA!B2")
+        assert formula.references("A1:A10")
+
+    def test_known_references_do_not_affect_equality(self):
+        assert Formula("=A1", known_references=["Z9"]) == Formula("=A1")
+
+
+class TestCellReferences:
+    """Cell reference helpers."""
+
+    def test_references_cell(self):
+        cell = Cell(address="C1", sheet="S", value=3, formula=Formula("=A1+B1"))
+
+        assert cell.references_cell("A1")
+        assert not cell.references_cell("D1")
+
+    def test_references_sheet(self):
+        cell = Cell(address="C1", sheet="S", value=3, formula=Formula("=Data!A1"))
+
+        assert cell.references_sheet("DATA")
+        assert not cell.references_sheet("Other")
+
+    def test_constant_cell_references_nothing(self):
+        cell = Cell(address="C1", sheet="S", value=3)
+
+        assert not cell.references_cell("A1")
+        assert not cell.references_sheet("Data")
+
+
+class TestWorkbookFormulaTotal:
+    """Workbook.total_formula_count()."""
+
+    def test_counts_added_sheets(self):
+        workbook = Workbook(name="w.xlsx", path="w.xlsx", sheets=[Sheet("A", formula_count=2)])
+        assert workbook.total_formula_count() == 2
+
+        workbook.add_sheet(Sheet("B", formula_count=3))
+        assert workbook.total_formula_count() == 5
+
+    def test_reflects_sheet_changes(self):
+        sheet = Sheet("A", formula_count=2)
+        workbook = Workbook(name="w.xlsx", path="w.xlsx", sheets=[sheet])
+        assert workbook.total_formula_count() == 2
+
+        sheet.formula_count = 7
+        assert workbook.total_formula_count() == 7
+
+
+class TestWorkbookSheetIndex:
+    """Sheet lookups by name."""
+
+    def test_get_sheet(self):
+        first, second = Sheet("A"), Sheet("B")
+        workbook = Workbook(name="w.xlsx", path="w.xlsx", sheets=[first])
+        workbook.add_sheet(second)
+
+        assert workbook.get_sheet("A") is first
+        assert workbook.get_sheet("B") is second
+        assert workbook.get_sheet("C") is None
+        assert workbook.has_sheet("B")
+        assert workbook.get_sheet_names() == ["A", "B"]
+
+    def test_first_sheet_wins_on_duplicate_names(self):
+        first = Sheet("A")
+        workbook = Workbook(name="w.xlsx", path="w.xlsx", sheets=[first, Sheet("A")])
+
+        assert workbook.get_sheet("A") is first
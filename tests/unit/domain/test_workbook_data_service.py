@@ -0,0 +1,108 @@
+"""Tests for WorkbookDataService snapshots."""
+
+import pytest
+
+pytest.importorskip("xlwings")
+
+from src.domain.models.selection import Range  # noqa: E402
+from src.domain.models.workbook import Sheet, Workbook  # noqa: E402
+from src.domain.services.workbook_data_service import WorkbookDataService  # noqa: E402
+from src.infrastructure.config.config_schema import Config  # noqa: E402
+
+VALUES = [[1, 2], [3, 5]]
+FORMULAS = [[1, 2], [3, "=A2+B1"]]
+
+
+class _FakeConnector:
+    """Connector serving one fixed 2x2 block."""
+
+    def __init__(self):
+        self.reads = 0
+
+    def connect(self, workbook_name=None):
+        return Workbook(name="book.xlsx", path="book.xlsx", sheets=[Sheet("S")])
+
+    def read_block(self, range_obj):
+        self.reads += 1
+        return VALUES, FORMULAS
+
+
+def _service(**snapshot_cache):
+    config = Config.model_validate({"agent": {"snapshot_cache": snapshot_cache}})
+    service = WorkbookDataService(config)
+    service.connector = _FakeConnector()
+    service.connect()
+    return service
+
+
+class TestGetSnapshot:
+    """get_snapshot() renders bulk-read grids."""
+
+    def test_renders_connector_grids(self):
+        service = _service(max_entries=0)
+
+        snapshot = service.get_snapshot("S", "A1:B2")
+
+        expected = service.snapshot_generator.generate_from_arrays(
+            VALUES, FORMULAS, Range.from_address("S!A1:B2")
+        )
+        assert snapshot == expected
+        assert "=A2+B1" in snapshot
+
+    def test_uncached_snapshots_are_read_every_time(self):
+        service = _service(max_entries=0)
+        service.get_snapshot("S", "A1:B2")
+        service.get_snapshot("S", "A1:B2")
+
+        assert service.connector.reads == 2
+
+
+class TestSnapshotCache:
+    """Recent snapshots are reused until the workbook revision changes."""
+
+    def test_repeated_snapshot_is_read_once(self):
+        service = _service()
+        first = service.get_snapshot("S", "A1:B2")
+
+        assert service.get_snapshot("S", "A1:B2") == first
+        assert service.connector.reads == 1
+
+    def test_other_range_or_strategy_is_read(self):
+        service = _service()
+        service.get_snapshot("S", "A1:B2")
+        service.get_snapshot("S", "A1:B3")
+        service.get_snapshot("S", "A1:B2", strategy="full")
+
+        assert service.connector.reads == 3
+
+    def test_mark_workbook_changed_invalidates(self):
+        service = _service()
+        revision = service.workbook_revision
+        service.get_snapshot("S", "A1:B2")
+
+        service.mark_workbook_changed()
+        service.get_snapshot("S", "A1:B2")
+
+        assert service.workbook_revision == revision + 1
+        assert service.connector.reads == 2
+
+    def test_entries_expire(self, monkeypatch):
+        service = _service(ttl_seconds=5)
+        now = [100.0]
+        monkeypatch.setattr(
+            "src.domain.services.workbook_data_service.time.monotonic", lambda: now[0]
+        )
+        service.get_snapshot("S", "A1:B2")
+
+        now[0] += 6
+        service.get_snapshot("S", "A1:B2")
+
+        assert service.connector.reads == 2
+
+    def test_least_recently_used_snapshot_is_evicted(self):
+        service = _service(max_entries=1)
+        service.get_snapshot("S", "A1:B2")
+        service.get_snapshot("S", "A1:B3")
+        service.get_snapshot("S", "A1:B2")
+
+        assert service.connector.reads == 3
@@ -0,0 +1,120 @@
+"""Tests for configuration loading and caching."""
+
+import os
+
+import pytest
+
+from src.infrastructure.config import config_loader
+from src.infrastructure.config.config_loader import load_config
+from src.shared.exceptions import ConfigurationError
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    load_config.cache_clear()
+    yield
+    load_config.cache_clear()
+
+
+def _write(path, provider, bump=0):
+    """Write a config selecting a provider, moving its mtime forward by bump seconds."""
+    path.write_text(f"llm:\n  default_provider: {provider}\n")
+    if bump:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump * 1_000_000_000))
+
+
+class TestLoadConfigCache:
+    """load_config() reuses the loaded Config until the file changes."""
+
+    def test_repeat_load_returns_cached_config(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        _write(path, "mock")
+
+        first = load_config(path)
+
+        assert load_config(path) is first
+        assert first.llm.default_provider == "mock"
+
+    def test_modified_file_is_reloaded(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        _write(path, "mock")
+        first = load_config(path)
+
+        _write(path, "manual", bump=1)
+        second = load_config(path)
+
+        assert second is not first
+        assert second.llm.default_provider == "manual"
+
+    def test_cache_is_per_file(self, tmp_path):
+        _write(tmp_path / "a.yaml", "mock")
+        _write(tmp_path / "b.yaml", "manual")
+
+        assert load_config(tmp_path / "a.yaml").llm.default_provider == "mock"
+        assert load_config(tmp_path / "b.yaml").llm.default_provider == "manual"
+
+    def test_cache_clear_forces_reload(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        _write(path, "mock")
+        first = load_config(path)
+
+        load_config.cache_clear()
+
+        assert load_config(path) is not first
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(ConfigurationError):
+            load_config(tmp_path / "missing.yaml")
+
+
+def _no_yaml(config_path):
+    raise AssertionError("YAML parsed despite a current side-car")
+
+
+class TestParsedConfigSideCar:
+    """The parsed YAML is kept in "<config>.cache.json" between runs."""
+
+    def test_side_car_is_written_with_mtime_header(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        _write(path, "mock")
+
+        load_config(path)
+
+        header, _, body = (tmp_path / "config.yaml.cache.json").read_bytes().partition(b"\n")
+        assert header == str(path.stat().st_mtime_ns).encode("ascii")
+        assert b'"default_provider"' in body
+
+    def test_warm_start_skips_yaml(self, tmp_path, monkeypatch):
+        path = tmp_path / "config.yaml"
+        _write(path, "mock")
+        load_config(path)
+        load_config.cache_clear()
+
+        monkeypatch.setattr(config_loader, "_parse_yaml", _no_yaml)
+
+        assert load_config(path).llm.default_provider == "mock"
+
+    def test_stale_side_car_is_ignored(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        _write(path, "mock")
+        load_config(path)
+        load_config.cache_clear()
+
+        _write(path, "manual", bump=1)
+
+        assert load_config(path).llm.default_provider == "manual"
+        header = (tmp_path / "config.yaml.cache.json").read_bytes().partition(b"\n")[0]
+        assert header == str(path.stat().st_mtime_ns).encode("ascii")
+
+    def test_invalid_config_raises_from_side_car(self, tmp_path, monkeypatch):
+        path = tmp_path / "config.yaml"
+        path.write_text("")
+        mtime_ns = path.stat().st_mtime_ns
+        (tmp_path / "config.yaml.cache.json").write_bytes(
+            f"{mtime_ns}\n".encode("ascii") + b'{"llm": {"max_concurrency": "many"}}'
+        )
+        monkeypatch.setattr(config_loader, "_parse_yaml", _no_yaml)
+
+        with pytest.raises(ConfigurationError, match="llm.max_concurrency"):
+            load_config(path)
@@ -0,0 +1,120 @@
+"""Tests for the dependency graph cache."""
+
+import os
+
+from src.domain.models.dependency import DependencyGraph, DependencyNode
+from src.infrastructure.storage.graph_cache import GraphCache
+
+
+def _build_graph():
+    """S!C1 = A1 + B1, S!D1 = C1 * Other!A1."""
+    graph = DependencyGraph(workbook_name="book.xlsx")
+    nodes = {
+        "S!A1": DependencyNode("A1", "S"),
+        "S!B1": DependencyNode("B1", "S"),
+        "S!C1": DependencyNode("C1", "S", "=A1+B1"),
+        "S!D1": DependencyNode("D1", "S", "=C1*Other!A1"),
+        "Other!A1": DependencyNode("A1", "Other"),
+    }
+    for target, sources in {
+        "S!C1": ["S!A1", "S!B1"],
+        "S!D1": ["S!C1", "Other!A1"],
+    }.items():
+        for source in sources:
+            nodes[target].add_predecessor(source)
+            nodes[source].add_successor(target)
+    for node in nodes.values():
+        graph.add_node(node)
+    graph.freeze()
+    return graph
+
+
+def _edges(graph):
+    return {
+        address: (set(node.predecessors), set(node.successors))
+        for address, node in graph.nodes.items()
+    }
+
+
+class TestGraphCacheRoundTrip:
+    """save() followed by load() gives back an equivalent frozen graph."""
+
+    def test_round_trip_preserves_nodes_and_edges(self, tmp_path):
+        cache = GraphCache(cache_dir=str(tmp_path / "cache"))
+        graph = _build_graph()
+        expected_edges = _edges(graph)
+
+        cache.save(graph, "book.xlsx", workbook_hash="abc")
+        loaded = cache.load("book.xlsx")
+
+        assert loaded is not None
+        assert loaded.is_frozen
+        assert loaded.workbook_name == "book.xlsx"
+        assert list(loaded.nodes) == list(graph.nodes)
+        assert _edges(loaded) == expected_edges
+        assert loaded.get_node("C1").formula == "=A1+B1"
+        assert loaded.formula_count() == 2
+        assert loaded.node_count() == graph.node_count()
+
+    def test_round_trip_preserves_csr_arrays(self, tmp_path):
+        cache = GraphCache(cache_dir=str(tmp_path))
+        graph = _build_graph()
+
+        cache.save(graph, "book.xlsx")
+        loaded = cache.load("book.xlsx")
+
+        assert loaded.addr_of == graph.addr_of
+        assert loaded.pred_indptr == graph.pred_indptr
+        assert loaded.pred_indices == graph.pred_indices
+        assert loaded.succ_indptr == graph.succ_indptr
+        assert loaded.succ_indices == graph.succ_indices
+        assert loaded.depends_on("S!D1", "S!A1")
+        assert not loaded.depends_on("S!A1", "S!D1")
+
+    def test_missing_cache_loads_none(self, tmp_path):
+        assert GraphCache(cache_dir=str(tmp_path)).load("book.xlsx") is None
+
+    def test_unrecognized_file_is_ignored(self, tmp_path):
+        cache = GraphCache(cache_dir=str(tmp_path))
+        cache.get_cache_path("book.xlsx").write_bytes(b"not a graph")
+
+        assert cache.load("book.xlsx") is None
+
+    def test_clear_removes_cache(self, tmp_path):
+        cache = GraphCache(cache_dir=str(tmp_path))
+        cache.save(_build_graph(), "book.xlsx")
+
+        cache.clear("book.xlsx")
+
+        assert cache.load("book.xlsx") is None
+        assert cache.get_metadata("book.xlsx") is None
+
+
+class TestGraphCacheStaleness:
+    """is_stale() by formula digest and by file modification time."""
+
+    def test_digest_decides_when_both_are_known(self, tmp_path):
+        cache = GraphCache(cache_dir=str(tmp_path / "cache"))
+        cache.save(_build_graph(), "book.xlsx", workbook_hash="abc")
+
+        assert not cache.is_stale("book.xlsx", "abc")
+        assert cache.is_stale("book.xlsx", "def")
+
+    def test_modified_workbook_is_stale_until_marked_fresh(self, tmp_path):
+        workbook = tmp_path / "book.xlsx"
+        workbook.write_bytes(b"")
+        cache = GraphCache(cache_dir=str(tmp_path / "cache"))
+        cache.save(_build_graph(), str(workbook), workbook_hash="abc")
+        assert not cache.is_stale(str(workbook))
+
+        # Saved again later (e.g. a resave with the same formulas)
+        later = workbook.stat().st_mtime + 60
+        os.utime(workbook, (later, later))
+        assert cache.is_stale(str(workbook))
+
+        cache.mark_fresh(str(workbook))
+        os.utime(workbook, (later - 3600, later - 3600))
+        assert not cache.is_stale(str(workbook))
+
+    def test_missing_cache_is_stale(self, tmp_path):
+        assert GraphCache(cache_dir=str(tmp_path)).is_stale("book.xlsx")
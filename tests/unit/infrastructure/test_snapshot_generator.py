@@ -0,0 +1,124 @@
+"""Tests for markdown snapshot generation."""
+
+from itertools import islice
+
+import pytest
+
+from src.domain.models.selection import Range
+from src.domain.models.workbook import Cell, Formula
+from src.infrastructure.config.config_schema import Config
+from src.infrastructure.excel.snapshot_generator import SnapshotGenerator
+
+
+@pytest.fixture
+def generator():
+    return SnapshotGenerator(Config.defaults())
+
+
+def _column(rows):
+    """Values 1..rows in column A, doubled in column B, with no formulas."""
+    values = [[row, row * 2] for row in range(1, rows + 1)]
+    formulas = [[None, None] for _ in range(rows)]
+    return values, formulas
+
+
+class TestTableLines:
+    """Snapshot tables are built one line at a time."""
+
+    def test_full_table(self, generator):
+        cells = [
+            Cell("C1", "S", 3, Formula("=A1+1")),
+            Cell("A1", "S", "x"),
+            Cell("B1", "S", 2.5),
+            Cell("A3", "S", "y"),
+        ]
+
+        lines = list(generator.iter_lines(cells, Range.from_address("S!A1:C4")))
+
+        assert lines[-6:] == [
+            "| A | B | C |",
+            "|---|---|---|",
+            "| x | 2.50 | =A1+1 `[3]` |",
+            "|  |  |  |",
+            "| y |  |  |",
+            "|  |  |  |",
+        ]
+
+    def test_sampled_table_marks_gaps(self, generator):
+        values, formulas = _column(40)
+
+        lines = list(generator.iter_lines_from_arrays(
+            values, formulas, Range.from_address("S!A1:B40"), strategy="sampled"
+        ))
+
+        table = lines[lines.index("|---|---|") + 1:]
+        assert table[:2] == ["| 1 | 2 |", "| 2 | 4 |"]
+        assert "| *... 9 rows omitted ...* | |" in table
+        assert table[-1] == "| 40 | 80 |"
+        assert len(table) == 21
+
+    def test_rows_are_formatted_as_lines_are_taken(self, generator, monkeypatch):
+        values, formulas = _column(1000)
+        formatted = []
+
+        def format_value(value, formula):
+            formatted.append(value)
+            return str(value)
+
+        monkeypatch.setattr(generator, "_format_value", format_value)
+        lines = generator.iter_lines_from_arrays(
+            values, formulas, Range.from_address("S!A1:B1000"), strategy="full"
+        )
+
+        taken = list(islice((line for line in lines if line.startswith("| 1 ")), 1))
+
+        assert taken == ["| 1 | 2 |"]
+        assert formatted == [1, 2]
+
+    def test_cells_and_arrays_give_the_same_table(self, generator):
+        values = [[1, "a", None], [None, None, None], [2.5, True, 7]]
+        formulas = [[None, None, None], [None, None, None], [None, None, "=A3*2"]]
+        cells = [
+            Cell(f"{col}{row}", "S", value, Formula(text) if text else None)
+            for row, (value_row, text_row) in enumerate(zip(values, formulas, strict=True), start=1)
+            for col, value, text in zip("ABC", value_row, text_row, strict=True)
+        ]
+        range_obj = Range.from_address("S!A1:C3")
+
+        assert generator.generate(cells, range_obj) == generator.generate_from_arrays(
+            values, formulas, range_obj
+        )
+
+
+class TestGenerateIter:
+    """generate_iter()/generate_iter_from_arrays() chunk the generate() output."""
+
+    CELLS = [Cell("A1", "S", "x"), Cell("B1", "S", 2.5), Cell("A3", "S", "y")]
+
+    @pytest.mark.parametrize("strategy", [None, "full", "sampled"])
+    def test_chunks_join_to_generate(self, generator, strategy):
+        range_obj = Range.from_address("S!A1:C4")
+
+        chunks = list(generator.generate_iter(self.CELLS, range_obj, strategy))
+
+        assert "".join(chunks) == generator.generate(self.CELLS, range_obj, strategy)
+        assert all(chunk.endswith("\n") for chunk in chunks[:-1])
+        assert not chunks[-1].endswith("\n")
+        assert all(chunk.count("\n") <= 1 for chunk in chunks)
+
+    @pytest.mark.parametrize("strategy", ["full", "sampled"])
+    def test_array_chunks_join_to_generate_from_arrays(self, generator, strategy):
+        values, formulas = _column(40)
+        range_obj = Range.from_address("S!A1:B40")
+
+        chunks = list(generator.generate_iter_from_arrays(values, formulas, range_obj, strategy))
+
+        assert "".join(chunks) == generator.generate_from_arrays(
+            values, formulas, range_obj, strategy
+        )
+        assert len(chunks) > 20
+
+    def test_empty_range_is_one_chunk(self, generator):
+        range_obj = Range.from_address("S!A1:B2")
+
+        assert list(generator.generate_iter([], range_obj)) == [generator.generate([], range_obj)]
@@ -0,0 +1,197 @@
+"""Tests for workbook discovery across Excel instances."""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("xlwings")
+
+from src.infrastructure.excel import workbook_discovery  # noqa: E402
+from src.infrastructure.excel.workbook_discovery import WorkbookDiscovery  # noqa: E402
+from src.shared.exceptions import ExcelConnectionError  # noqa: E402
+
+
+def _book(name, fullname, saved=True):
+    """Stand-in for an xlwings Book, counting reads of its COM api."""
+    api = SimpleNamespace(Name=name, Saved=saved, Sheets=SimpleNamespace(Count=2))
+    return SimpleNamespace(api=api, fullname=fullname, name=name)
+
+
+class _Apps(list):
+    """Stand-in for xlwings.apps that counts how often it is walked."""
+
+    walks = 0
+
+    def __iter__(self):
+        self.walks += 1
+        return super().__iter__()
+
+
+@pytest.fixture
+def apps(monkeypatch, tmp_path):
+    model = tmp_path / "Model.xlsx"
+    model.write_bytes(b"")
+    apps = _Apps([
+        SimpleNamespace(pid=1, books=[_book("Model.xlsx", str(model)), _book("Book1", "", False)]),
+        SimpleNamespace(pid=2, books=[_book("Model.xlsx", str(model))]),
+    ])
+    monkeypatch.setattr(workbook_discovery.xw, "apps", apps, raising=False)
+    WorkbookDiscovery.invalidate()
+    yield apps
+    WorkbookDiscovery.invalidate()
+
+
+class TestDiscoveryCache:
+    """Back-to-back lookups share one walk of the Excel instances."""
+
+    def test_repeat_lookups_walk_once(self, apps):
+        first = WorkbookDiscovery.list_all_workbooks()
+        WorkbookDiscovery.find_by_name("Model.xlsx")
+        WorkbookDiscovery.find_by_path(first[0].full_path)
+
+        assert apps.walks == 1
+        assert [info.excel_pid for info in first] == [1, 1, 2]
+
+    def test_callers_get_their_own_list(self, apps):
+        first = WorkbookDiscovery.list_all_workbooks()
+        first.clear()
+
+        assert len(WorkbookDiscovery.list_all_workbooks()) == 3
+
+    def test_expired_result_is_rediscovered(self, apps, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(workbook_discovery.time, "monotonic", lambda: now[0])
+        WorkbookDiscovery.list_all_workbooks()
+
+        now[0] += workbook_discovery._DISCOVERY_TTL_SECONDS
+        WorkbookDiscovery.list_all_workbooks()
+
+        assert apps.walks == 2
+
+    def test_invalidate_forces_a_new_walk(self, apps):
+        WorkbookDiscovery.list_all_workbooks()
+        apps[1].books.append(_book("Other.xlsx", "Other.xlsx"))
+
+        WorkbookDiscovery.invalidate()
+
+        assert len(WorkbookDiscovery.find_by_name("other.xlsx")) == 1
+        assert apps.walks == 2
+
+    def test_no_excel_instances_raises_and_is_not_cached(self, apps):
+        apps.clear()
+
+        with pytest.raises(ExcelConnectionError, match="No Excel instances"):
+            WorkbookDiscovery.list_all_workbooks()
+        assert workbook_discovery._discovery_cache is None
+
+
+class TestFindByPath:
+    """Workbook paths are normalized once, at discovery."""
+
+    def test_equivalent_spellings_match(self, apps, tmp_path):
+        spelled = str(tmp_path / "sub" / ".." / "Model.xlsx")
+
+        matches = WorkbookDiscovery.find_by_path(spelled)
+
+        assert [info.excel_pid for info in matches] == [1, 2]
+
+    def test_only_the_target_is_normalized_per_lookup(self, apps, tmp_path, monkeypatch):
+        WorkbookDiscovery.list_all_workbooks()
+        calls = []
+        normalize = workbook_discovery._normalize_path
+
+        def counting(path):
+            calls.append(path)
+            return normalize(path)
+
+        monkeypatch.setattr(workbook_discovery, "_normalize_path", counting)
+
+        assert len(WorkbookDiscovery.find_by_path(str(tmp_path / "Model.xlsx"))) == 2
+        assert calls == [str(tmp_path / "Model.xlsx")]
+
+    def test_unsaved_workbook_matches_by_name(self, apps):
+        assert [info.workbook_name for info in WorkbookDiscovery.find_by_path("Book1")] == [
+            "Book1"
+        ]
+
+    def test_unknown_path_matches_nothing(self, apps, tmp_path):
+        assert WorkbookDiscovery.find_by_path(str(tmp_path / "Missing.xlsx")) == []
+
+
+def _info(pid, path):
+    return workbook_discovery.WorkbookInfo(
+        excel_pid=pid, workbook_name=path.rsplit("/", 1)[-1], full_path=path,
+        sheet_count=1, is_saved=True,
+    )
+
+
+class TestDuplicates:
+    """Workbooks open in more than one Excel instance."""
+
+    WORKBOOKS = [
+        _info(1, "/data/a.xlsx"),
+        _info(1, "/data/b.xlsx"),
+        _info(2, "/data/a.xlsx"),
+        _info(3, "/data/c.xlsx"),
+        _info(3, "/data/b.xlsx"),
+    ]
+
+    def test_has_duplicates(self):
+        assert WorkbookDiscovery.has_duplicates(self.WORKBOOKS)
+        assert not WorkbookDiscovery.has_duplicates(self.WORKBOOKS[:2])
+        assert not WorkbookDiscovery.has_duplicates([])
+
+    def test_get_duplicate_paths_in_first_seen_order(self):
+        assert WorkbookDiscovery.get_duplicate_paths(self.WORKBOOKS) == [
+            "/data/a.xlsx", "/data/b.xlsx"
+        ]
+        assert WorkbookDiscovery.get_duplicate_paths(self.WORKBOOKS[:2]) == []
+
+    def test_group_duplicates(self):
+        groups = WorkbookDiscovery.group_duplicates(self.WORKBOOKS)
+
+        assert list(groups) == ["/data/a.xlsx", "/data/b.xlsx", "/data/c.xlsx"]
+        assert [info.excel_pid for info in groups["/data/b.xlsx"]] == [1, 3]
+
+    def test_discovered_duplicates(self, apps):
+        workbooks = WorkbookDiscovery.list_all_workbooks()
+
+        assert WorkbookDiscovery.has_duplicates(workbooks)
+        assert WorkbookDiscovery.get_duplicate_paths(workbooks) == [workbooks[0].full_path]
+
+
+class TestFileDetails:
+    """Resolved paths and modification times are read off the COM thread."""
+
+    def test_saved_workbooks_get_path_and_mtime(self, apps, tmp_path):
+        model, unsaved, copy = WorkbookDiscovery.list_all_workbooks()
+
+        expected = workbook_discovery._normalize_path(str(tmp_path / "Model.xlsx"))
+        assert model.resolved_path == copy.resolved_path == expected
+        assert model.modified_time is not None
+        assert unsaved.resolved_path == workbook_discovery._normalize_path("Book1")
+        assert unsaved.modified_time is None
+
+    def test_missing_file_has_no_mtime(self, apps):
+        apps[:] = [SimpleNamespace(pid=1, books=[_book("Gone.xlsx", "/no/such/Gone.xlsx")])]
+
+        (info,) = WorkbookDiscovery.list_all_workbooks()
+
+        assert info.modified_time is None
+        assert info.resolved_path is not None
+
+    def test_files_are_read_on_workers(self, apps, monkeypatch):
+        threads = []
+        read = workbook_discovery._read_file_details
+
+        def recording(info):
+            threads.append(threading.current_thread().name)
+            read(info)
+
+        monkeypatch.setattr(workbook_discovery, "_read_file_details", recording)
+
+        WorkbookDiscovery.list_all_workbooks()
+
+        assert len(threads) == 3
+        assert all(name.startswith("workbook-stat") for name in threads)